@@ -1,14 +1,23 @@
 """
 크리에이터 프로필 API
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
-from app.db.supabase_client import get_supabase_client
+from typing import Dict, List, Literal, Optional, Union
+from datetime import datetime, timezone
+from app.db.pagination import NEXT_CURSOR_HEADER, InvalidCursor, next_cursor
+from app.db.postgrest import PostgrestDataError, PostgrestError
+from app.db.repositories import creator_profiles
+from app.services.bulk_import import BulkImporter, ImportAborted, ImportFormat, detect_format
+from app.services.creator_discovery import INDEX_COLUMNS, DiscoveryQuery, creator_discovery_index
+from app.core.config import settings
 import uuid
 
 router = APIRouter()
 
+# Postgres unique_violation (PostgREST는 409로 응답)
+UNIQUE_VIOLATION = "23505"
+
 # Pydantic 스키마
 class FeaturedVideo(BaseModel):
     video_id: str
@@ -48,37 +57,45 @@ class CreatorProfileUpdate(BaseModel):
     contact_value: Optional[str] = None
     featured_videos: Optional[List[FeaturedVideo]] = None
 
-class CreatorProfileResponse(BaseModel):
+class CreatorProfileSummary(BaseModel):
+    """목록 카드용 요약 (bio, 연락처, featured_videos 제외)"""
     id: str
     username: str
     display_name: str
-    bio: Optional[str]
     profile_image_url: Optional[str]
-    youtube_channel_id: Optional[str]
-    youtube_channel_url: Optional[str]
     subscriber_count: int
     average_views: int
     sponsorship_rate: int
     sponsorship_available: bool
     preferred_categories: List[str]
+    created_at: str
+    is_verified: bool
+
+class CreatorProfileResponse(CreatorProfileSummary):
+    bio: Optional[str]
+    youtube_channel_id: Optional[str]
+    youtube_channel_url: Optional[str]
     email: Optional[str]
     contact_method: Optional[str]
     contact_value: Optional[str]
     featured_videos: List[dict]
-    created_at: str
-    is_verified: bool
     is_active: bool
 
+# 목록 조회 시 PostgREST select 컬럼 (요약 모델 필드와 같게 유지)
+SUMMARY_COLUMNS = ",".join(CreatorProfileSummary.model_fields)
+
+# 목록 응답: view=summary(기본)는 요약, view=full은 기존 전체 행
+ProfileListView = Literal["summary", "full"]
+
+# 탐색 정렬: 구독자 많은 순, 평균 조회수 높은 순, 협찬 단가 낮은 순, 최신 가입순
+DiscoverySort = Literal["subscribers", "views", "rate", "recent"]
+
+# 탐색 결과 전체 수 (인덱스로 처리한 경우만)
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
 @router.post("/", response_model=CreatorProfileResponse)
 async def create_profile(profile: CreatorProfileCreate):
     """크리에이터 프로필 생성"""
-    supabase = get_supabase_client()
-    
-    # username 중복 체크
-    existing = supabase.table("creator_profiles").select("id").eq("username", profile.username).execute()
-    if existing.data:
-        raise HTTPException(status_code=400, detail="Username already exists")
-    
     # featured_videos를 dict 리스트로 변환
     featured_videos_data = [video.dict() for video in profile.featured_videos]
     
@@ -86,35 +103,111 @@ async def create_profile(profile: CreatorProfileCreate):
     data = profile.dict()
     data["featured_videos"] = featured_videos_data
     
-    result = supabase.table("creator_profiles").insert(data).execute()
+    # username 중복은 UNIQUE 제약으로 확인 (조회 후 저장 사이 경합 없이 INSERT 한 번)
+    try:
+        created = await creator_profiles.create(data)
+    except PostgrestError as e:
+        if e.code == UNIQUE_VIOLATION:
+            raise HTTPException(status_code=400, detail="Username already exists")
+        raise
     
-    if not result.data:
+    if not created:
         raise HTTPException(status_code=500, detail="Failed to create profile")
     
-    return result.data[0]
+    # 탐색 인덱스에 바로 반영
+    creator_discovery_index.upsert(created)
+    
+    return created
+
+async def _save_imported_profiles(profiles: List[CreatorProfileCreate]) -> Dict[str, int]:
+    """
+    가져온 프로필 청크를 username 기준 UPSERT로 저장하고 탐색 인덱스에 반영
+
+    파일에 적힌 필드만 보내므로 (CSV 빈 칸/없는 열은 제외) 기존 프로필의 나머지 값은 그대로 유지됩니다.
+    PostgREST 대량 UPSERT는 모든 행의 키가 같아야 하므로 보낸 필드 조합별로 한 번씩 요청합니다.
+    """
+    updated_at = datetime.now(timezone.utc).isoformat()
+    groups: Dict[frozenset, List[Dict]] = {}
+    for profile in profiles:
+        row = {**profile.dict(exclude_unset=True), "updated_at": updated_at}
+        groups.setdefault(frozenset(row), []).append(row)
+    for rows in groups.values():
+        saved = await creator_profiles.upsert_many(rows, columns=INDEX_COLUMNS)
+        for row in saved:
+            creator_discovery_index.upsert(row)
+    return {}
+
+@router.post("/import")
+async def import_profiles(request: Request, format: Optional[ImportFormat] = None):
+    """
+    크리에이터 프로필 대량 가져오기 (NDJSON 또는 CSV 본문 스트리밍)
+    한 줄(행)이 CreatorProfileCreate 하나이며, 같은 username이 있으면 파일에 적힌 필드만 갱신합니다 (빈 칸은 기존 값 유지).
+    형식은 format 또는 Content-Type(text/csv면 CSV)으로 정하고, 잘못된 행은 줄 번호와 사유를 errors로 반환
+    """
+    importer = BulkImporter(CreatorProfileCreate, _save_imported_profiles, key="username",
+                            row_errors=(PostgrestDataError,))
+    try:
+        return await importer.run(request.stream(), format or detect_format(request.headers.get("content-type")))
+    except ImportAborted as e:
+        raise HTTPException(status_code=502, detail={"message": str(e), "report": e.report})
+
+@router.get("/discover", response_model=List[CreatorProfileSummary])
+async def discover_profiles(
+    response: Response,
+    min_subscribers: Optional[int] = None,
+    max_subscribers: Optional[int] = None,
+    min_views: Optional[int] = None,
+    max_views: Optional[int] = None,
+    min_rate: Optional[int] = None,
+    max_rate: Optional[int] = None,
+    categories: List[str] = Query([]),
+    q: Optional[str] = None,
+    sort: DiscoverySort = "subscribers",
+    limit: int = 20,
+    offset: int = 0
+):
+    """
+    협찬 가능 크리에이터 탐색 (브랜드 매칭)
+    구독자 수 / 평균 조회수 / 협찬 단가 범위, 선호 카테고리(?categories=뷰티&categories=패션, 하나라도 일치),
+    display_name / bio 검색(q)으로 거릅니다. 조건에 맞는 전체 수는 X-Total-Count 헤더로 반환
+    """
+    query = DiscoveryQuery(
+        min_subscribers=min_subscribers,
+        max_subscribers=max_subscribers,
+        min_views=min_views,
+        max_views=max_views,
+        min_rate=min_rate,
+        max_rate=max_rate,
+        categories=tuple(categories),
+        text=q.strip() if q and q.strip() else None,
+        sort=sort,
+        limit=max(1, min(limit, settings.CREATOR_DISCOVERY_MAX_LIMIT)),
+        offset=max(0, offset),
+    )
+    profiles, total = await creator_discovery_index.discover(query)
+    
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
+    return profiles
+
+@router.get("/discover/stats")
+async def get_discovery_stats():
+    """크리에이터 탐색 인덱스 통계 (적재 수, 인덱스/DB 처리 수)"""
+    return creator_discovery_index.stats()
 
 @router.get("/@{username}", response_model=CreatorProfileResponse)
 async def get_profile(username: str):
     """크리에이터 프로필 조회"""
-    supabase = get_supabase_client()
+    profile = await creator_profiles.get_by_username(username, active_only=True)
     
-    result = supabase.table("creator_profiles").select("*").eq("username", username).eq("is_active", True).execute()
-    
-    if not result.data:
+    if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     
-    return result.data[0]
+    return profile
 
 @router.put("/@{username}", response_model=CreatorProfileResponse)
 async def update_profile(username: str, profile: CreatorProfileUpdate):
     """크리에이터 프로필 수정"""
-    supabase = get_supabase_client()
-    
-    # 기존 프로필 확인
-    existing = supabase.table("creator_profiles").select("id").eq("username", username).execute()
-    if not existing.data:
-        raise HTTPException(status_code=404, detail="Profile not found")
-    
     # 업데이트할 데이터만 추출
     update_data = {k: v for k, v in profile.dict().items() if v is not None}
     
@@ -125,23 +218,32 @@ async def update_profile(username: str, profile: CreatorProfileUpdate):
     # updated_at 자동 업데이트
     update_data["updated_at"] = "now()"
     
-    result = supabase.table("creator_profiles").update(update_data).eq("username", username).execute()
+    # UPDATE … RETURNING 한 번 (수정된 행이 없으면 없는 프로필)
+    updated = await creator_profiles.update_by_username(username, update_data)
     
-    if not result.data:
-        raise HTTPException(status_code=500, detail="Failed to update profile")
-    
-    return result.data[0]
-
-@router.get("/", response_model=List[CreatorProfileResponse])
-async def list_profiles(limit: int = 20, offset: int = 0):
-    """크리에이터 프로필 목록 조회"""
-    supabase = get_supabase_client()
+    if not updated:
+        raise HTTPException(status_code=404, detail="Profile not found")
     
-    result = supabase.table("creator_profiles")\
-        .select("*")\
-        .eq("is_active", True)\
-        .order("created_at", desc=True)\
-        .range(offset, offset + limit - 1)\
-        .execute()
+    # 탐색 인덱스에 바로 반영 (협찬 불가로 바뀌면 제외)
+    creator_discovery_index.upsert(updated)
     
-    return result.data
+    return updated
+
+@router.get("/", response_model=List[Union[CreatorProfileResponse, CreatorProfileSummary]])
+async def list_profiles(response: Response, limit: int = 20, offset: int = 0, cursor: Optional[str] = None,
+                        view: ProfileListView = "summary"):
+    """
+    크리에이터 프로필 목록 조회 (최신순)
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환 (cursor를 주면 offset은 무시)
+    기본은 카드용 요약이며, 전체 프로필은 /@{username}에서 받음 (view=full이면 기존 전체 행)
+    """
+    columns = "*" if view == "full" else SUMMARY_COLUMNS
+    try:
+        profiles = await creator_profiles.list_active(limit=limit, offset=offset, cursor=cursor, columns=columns)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    cursor_value = next_cursor(profiles, limit)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return profiles
@@ -1,11 +1,16 @@
 """
 뉴스레터 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from app.db.bulk import bulk_upsert
 from app.db.database import get_db
 from app.schemas.schemas import NewsletterSubscribe, NewsletterResponse, NewsletterUnsubscribe
 from app.models.models import NewsletterSubscriber
+from app.services.bulk_import import BulkImporter, ImportAborted, ImportFormat, detect_format
 from datetime import datetime
 
 router = APIRouter()
@@ -114,6 +119,68 @@ async def unsubscribe_newsletter(
         raise HTTPException(status_code=500, detail=f"구독 취소 중 오류가 발생했습니다: {str(e)}")
 
 
+def _save_imported_subscribers(db: Session, subscriptions: List[NewsletterSubscribe]) -> Dict[str, int]:
+    """
+    가져온 구독자 청크를 email 기준 대량 UPSERT
+
+    이미 있는 이메일은 이름/유형/규모만 갱신하고 구독 상태는 그대로 둡니다
+    (구독 취소한 사람을 가져오기로 다시 구독시키지 않음).
+    """
+    subscribed_at = datetime.now()
+    rows = [
+        {
+            "email": subscription.email,
+            "name": subscription.name,
+            "creator_type": subscription.creator_type,
+            "subscriber_count_range": subscription.subscriber_count_range,
+            "is_active": True,
+            "is_verified": False,
+            "subscribed_at": subscribed_at,
+        }
+        for subscription in subscriptions
+    ]
+    try:
+        result = bulk_upsert(
+            db,
+            NewsletterSubscriber,
+            rows,
+            key="email",
+            update_columns=["name", "creator_type", "subscriber_count_range"],
+            chunk_size=len(rows),
+            touch_column=None,
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return {"inserted": result.inserted, "updated": result.updated}
+
+
+@router.post("/import")
+async def import_subscribers(
+    request: Request,
+    format: Optional[ImportFormat] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    뉴스레터 구독자 대량 가져오기 (NDJSON 또는 CSV 본문 스트리밍)
+    
+    - 한 줄(행)이 NewsletterSubscribe 하나 (email 필수)
+    - 형식은 format 또는 Content-Type(text/csv면 CSV)으로 결정
+    - 잘못된 행은 건너뛰고 줄 번호와 사유를 errors로 반환
+    """
+    async def save(subscriptions: List[NewsletterSubscribe]) -> Dict[str, int]:
+        # 동기 세션이라 스레드에서 저장 (저장 중에도 이벤트 루프가 다른 요청 처리)
+        return await asyncio.to_thread(_save_imported_subscribers, db, subscriptions)
+
+    importer = BulkImporter(NewsletterSubscribe, save, key="email", row_errors=(IntegrityError, DataError))
+    try:
+        return await importer.run(request.stream(), format or detect_format(request.headers.get("content-type")))
+    except ImportAborted as e:
+        raise HTTPException(status_code=500, detail={"message": f"가져오기 중 오류가 발생했습니다: {e}",
+                                                     "report": e.report})
+
+
 @router.get("/stats")
 async def get_newsletter_stats(db: Session = Depends(get_db)):
     """
@@ -5,17 +5,16 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from app.db.database import get_db
 from app.schemas.schemas import PredictionInput, PredictionOutput
-from app.services.predictor import PredictorService
+from app.services.predictor import get_predictor
+from app.services.prediction_cache import prediction_cache, normalize_prediction_input
+from app.services.prediction_log_writer import prediction_log_writer
 from app.models.models import PredictionLog
 from datetime import datetime
 
 router = APIRouter()
 
 @router.post("/", response_model=PredictionOutput)
-async def predict_virality(
-    input_data: PredictionInput,
-    db: Session = Depends(get_db)
-):
+async def predict_virality(input_data: PredictionInput):
     """
     영상 정보를 받아 '떡상' 확률과 성장 가이드라인을 예측합니다.
     
@@ -30,27 +29,37 @@ async def predict_virality(
         - **top_features**: 예측에 영향을 준 주요 요인들
     """
     try:
-        # 예측 서비스 초기화
-        predictor = PredictorService()
+        predictor = get_predictor()
         
-        # 예측 수행
-        result = predictor.predict(
-            title=input_data.title,
-            description=input_data.description,
-            tags=input_data.tags
+        # 정규화된 입력으로 캐시 조회 (모델/키워드 버전이 바뀌면 자동 무효화)
+        cache_key = normalize_prediction_input(
+            input_data.title,
+            input_data.description,
+            input_data.tags
         )
+        result = prediction_cache.get(cache_key, predictor.version)
         
-        # 예측 로그 저장
-        log = PredictionLog(
-            input_title=input_data.title,
-            input_description=input_data.description,
-            input_features=result.get("features"),
-            prediction_probability=result["probability"],
-            prediction_guideline=result["guideline"],
-            created_at=datetime.now()
-        )
-        db.add(log)
-        db.commit()
+        if result is None:
+            # 예측 수행 (정규화된 입력 기준이라 같은 키는 항상 같은 결과)
+            title, description, tags = cache_key
+            result = predictor.predict(
+                title=title,
+                description=description or None,
+                tags=list(tags) or None
+            )
+            prediction_cache.set(cache_key, predictor.version, result)
+        
+        # 예측 로그 저장 (백그라운드 기록기가 모아서 일괄 INSERT)
+        await prediction_log_writer.aenqueue({
+            "input_title": input_data.title,
+            "input_description": input_data.description,
+            "input_features": result.get("features"),
+            "prediction_probability": result["probability"],
+            "prediction_guideline": result["guideline"],
+            "ip_address": None,
+            "user_agent": None,
+            "created_at": datetime.now()
+        })
         
         return PredictionOutput(
             probability=result["probability"],
@@ -72,5 +81,7 @@ async def get_prediction_stats(db: Session = Depends(get_db)):
     
     return {
         "total_predictions": total_predictions,
+        "cache": prediction_cache.stats(),
+        "log_writer": prediction_log_writer.stats(),
         "service_status": "active"
     }
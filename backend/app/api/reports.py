@@ -1,19 +1,22 @@
 """
 영상 분석 리포트 API 라우터
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional, Union
 from datetime import datetime
-from app.services.video_analyzer import analyze_video
-from app.db.supabase_client import supabase
+from app.db.pagination import NEXT_CURSOR_HEADER, InvalidCursor, next_cursor
+from app.db.repositories import video_reports
+from app.services.report_cache import report_cache
+from app.services.report_generator import AnalysisFailed, report_generator
 
 router = APIRouter()
 
 class VideoReportRequest(BaseModel):
     video_url: str
 
-class VideoReport(BaseModel):
+class VideoReportSummary(BaseModel):
+    """목록 카드용 요약 (analysis_report 본문 제외)"""
     id: str
     video_id: str
     video_url: str
@@ -24,73 +27,71 @@ class VideoReport(BaseModel):
     comment_count: Optional[int]
     published_at: Optional[str]
     thumbnail_url: Optional[str]
-    analysis_report: str
     success_score: Optional[int]
-    trending_keywords: Optional[List[str]]
     created_at: str
 
+class VideoReport(VideoReportSummary):
+    analysis_report: str
+    trending_keywords: Optional[List[str]]
+
+# 목록 조회 시 PostgREST select 컬럼 (요약 모델 필드와 같게 유지)
+SUMMARY_COLUMNS = ",".join(VideoReportSummary.model_fields)
+
+# 목록 응답: view=summary(기본)는 요약, view=full은 기존 전체 행
+ReportListView = Literal["summary", "full"]
+ReportListItem = Union[VideoReport, VideoReportSummary]
+
 @router.post("/generate", response_model=VideoReport)
 async def generate_report(request: VideoReportRequest):
     """
     유튜브 영상 URL을 받아 분석 리포트 생성 및 저장
+    이미 분석된 영상은 저장된 리포트를 반환
     """
     try:
-        # 1. 영상 분석
-        analysis_data = await analyze_video(request.video_url)
-        if not analysis_data:
+        # 기존 리포트가 있으면 분석 없이 반환, 같은 영상 동시 요청은 분석 한 번을 함께 기다림
+        report = await report_generator.generate(request.video_url)
+        if not report:
             raise HTTPException(status_code=400, detail="유효하지 않은 유튜브 URL이거나 영상을 찾을 수 없습니다.")
         
-        # 2. 기존 리포트 확인 (중복 방지)
-        existing = supabase.table('video_reports').select('*').eq('video_id', analysis_data['video_id']).execute()
-        
-        if existing.data:
-            # 기존 리포트 반환
-            return existing.data[0]
-        
-        # 3. Supabase에 저장
-        insert_data = {
-            'video_id': analysis_data['video_id'],
-            'video_url': analysis_data['video_url'],
-            'title': analysis_data['title'],
-            'channel_name': analysis_data.get('channel_name'),
-            'view_count': analysis_data.get('view_count'),
-            'like_count': analysis_data.get('like_count'),
-            'comment_count': analysis_data.get('comment_count'),
-            'published_at': analysis_data.get('published_at'),
-            'thumbnail_url': analysis_data.get('thumbnail_url'),
-            'analysis_report': analysis_data['analysis_report'],
-            'success_score': analysis_data.get('success_score'),
-            'trending_keywords': analysis_data.get('trending_keywords', [])
-        }
-        
-        result = supabase.table('video_reports').insert(insert_data).execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=500, detail="리포트 저장에 실패했습니다.")
-        
-        return result.data[0]
+        return report
         
     except HTTPException:
         raise
+    except AnalysisFailed:
+        raise HTTPException(status_code=503, detail="영상 분석을 완료하지 못했습니다. 잠시 후 다시 시도해주세요.")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 생성 중 오류 발생: {str(e)}")
 
-@router.get("", response_model=List[VideoReport])
-@router.get("/", response_model=List[VideoReport])
-async def get_reports(limit: int = 10, offset: int = 0):
+@router.get("", response_model=List[ReportListItem])
+@router.get("/", response_model=List[ReportListItem])
+async def get_reports(response: Response, limit: int = 10, offset: int = 0, cursor: Optional[str] = None,
+                      view: ReportListView = "summary"):
     """
     저장된 리포트 목록 조회 (최신순)
     슬래시 있는 경로와 없는 경로 모두 지원
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환 (cursor를 주면 offset은 무시)
+    기본은 카드용 요약이며, 리포트 본문은 상세 조회(/{report_id})에서 받음 (view=full이면 기존 전체 행)
     """
+    columns = "*" if view == "full" else SUMMARY_COLUMNS
     try:
-        result = supabase.table('video_reports')\
-            .select('*')\
-            .order('created_at', desc=True)\
-            .range(offset, offset + limit - 1)\
-            .execute()
+        if cursor:
+            # 커서 페이지는 앞쪽 몇 행인지 알 수 없으므로 캐시하지 않음
+            reports = await video_reports.list_recent(limit=limit, cursor=cursor, columns=columns)
+        else:
+            reports = await report_cache.get_list(
+                ("recent", view, limit, offset),
+                offset + limit,
+                lambda: video_reports.list_recent(limit=limit, offset=offset, columns=columns),
+                full_rows=view == "full"
+            )
         
-        return result.data
+        cursor_value = next_cursor(reports, limit)
+        if cursor_value:
+            response.headers[NEXT_CURSOR_HEADER] = cursor_value
+        return reports
         
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 조회 중 오류 발생: {str(e)}")
 
@@ -100,34 +101,38 @@ async def get_report(report_id: str):
     특정 리포트 상세 조회
     """
     try:
-        result = supabase.table('video_reports')\
-            .select('*')\
-            .eq('id', report_id)\
-            .execute()
+        report = await report_cache.get_report(report_id, lambda: video_reports.get(report_id))
         
-        if not result.data:
+        if not report:
             raise HTTPException(status_code=404, detail="리포트를 찾을 수 없습니다.")
         
-        return result.data[0]
+        return report
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 조회 중 오류 발생: {str(e)}")
 
-@router.get("/top/success", response_model=List[VideoReport])
-async def get_top_reports(limit: int = 5):
+@router.get("/top/success", response_model=List[ReportListItem])
+async def get_top_reports(limit: int = 5, view: ReportListView = "summary"):
     """
-    성공 점수 높은 순으로 리포트 조회
+    성공 점수 높은 순으로 리포트 조회 (기본은 카드용 요약)
     """
+    columns = "*" if view == "full" else SUMMARY_COLUMNS
     try:
-        result = supabase.table('video_reports')\
-            .select('*')\
-            .order('success_score', desc=True)\
-            .limit(limit)\
-            .execute()
-        
-        return result.data
+        return await report_cache.get_list(
+            ("top", view, limit),
+            limit,
+            lambda: video_reports.list_top(limit=limit, columns=columns),
+            full_rows=view == "full"
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"리포트 조회 중 오류 발생: {str(e)}")
+
+@router.get("/cache/stats")
+async def get_report_cache_stats():
+    """
+    리포트 읽기 캐시 통계 (적중률, 항목 수, 무효화 횟수)와 리포트 생성 통계 (분석 수, 중복 합류 수)
+    """
+    return {**report_cache.stats(), "generator": report_generator.stats()}
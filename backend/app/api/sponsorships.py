@@ -1,11 +1,11 @@
 """
 협찬 중개 요청 API
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
-from typing import List, Optional
-from app.db.supabase_client import get_supabase_client
-from datetime import datetime
+from typing import List, Literal, Optional
+from app.db.pagination import NEXT_CURSOR_HEADER, InvalidCursor, next_cursor
+from app.db.repositories import creator_profiles, sponsorship_requests, sponsorship_stats
 
 router = APIRouter()
 
@@ -36,102 +36,142 @@ class SponsorshipRequestResponse(BaseModel):
     created_at: str
     updated_at: str
 
+class SponsorshipTotals(BaseModel):
+    total_requests: int
+    pending_count: int
+    in_progress_count: int
+    completed_count: int
+    cancelled_count: int
+    final_rate_sum: int
+    commission_sum: int
+    conversion_rate: Optional[float]  # 완료 / 전체 요청
+    updated_at: Optional[str] = None
+
+class SponsorshipMonthlyStats(BaseModel):
+    month: str  # 완료 월 (KST, YYYY-MM-01)
+    completed_count: int
+    final_rate_sum: int
+    commission_sum: int
+
+class SponsorshipCreatorStats(BaseModel):
+    creator_id: str
+    total_requests: int
+    completed_count: int
+    cancelled_count: int
+    commission_sum: int
+    conversion_rate: Optional[float]  # 완료 / 전체 요청
+
+# 크리에이터 집계 정렬 기준
+CreatorStatsOrder = Literal["commission_sum", "completed_count", "total_requests"]
+
+def _with_conversion(row: dict) -> dict:
+    total = row.get("total_requests") or 0
+    return {**row, "conversion_rate": round(row["completed_count"] / total, 4) if total else None}
+
 @router.post("/", response_model=SponsorshipRequestResponse)
 async def create_sponsorship_request(request: SponsorshipRequestCreate):
     """협찬 중개 요청 생성"""
-    supabase = get_supabase_client()
-    
     # 크리에이터 존재 확인
-    creator = supabase.table("creator_profiles").select("id, sponsorship_available").eq("id", request.creator_id).execute()
-    if not creator.data:
+    creator = await creator_profiles.get(request.creator_id, columns="id,sponsorship_available")
+    if not creator:
         raise HTTPException(status_code=404, detail="Creator not found")
     
-    if not creator.data[0].get("sponsorship_available", True):
+    if not creator.get("sponsorship_available", True):
         raise HTTPException(status_code=400, detail="Creator is not available for sponsorship")
     
     # 요청 생성
     data = request.dict()
-    result = supabase.table("sponsorship_requests").insert(data).execute()
+    created = await sponsorship_requests.create(data)
     
-    if not result.data:
+    if not created:
         raise HTTPException(status_code=500, detail="Failed to create sponsorship request")
     
-    return result.data[0]
+    return created
+
+@router.get("/stats", response_model=SponsorshipTotals)
+async def get_sponsorship_totals():
+    """협찬 요청 전체 집계 (상태별 건수, 협찬비/수수료 합계, 성사율) - 요약 행 1개 조회"""
+    totals = await sponsorship_stats.totals()
+    
+    if not totals:
+        raise HTTPException(status_code=404, detail="Sponsorship stats not initialized")
+    
+    return _with_conversion(totals)
+
+@router.get("/stats/monthly", response_model=List[SponsorshipMonthlyStats])
+async def get_sponsorship_monthly_stats(months: int = 12):
+    """월별 성사 건수와 수수료 합계 (최근 months개월)"""
+    return await sponsorship_stats.monthly(months=months)
+
+@router.get("/stats/creators", response_model=List[SponsorshipCreatorStats])
+async def list_sponsorship_creator_stats(order: CreatorStatsOrder = "commission_sum", limit: int = 20):
+    """크리에이터별 요청/성사 집계 상위 목록"""
+    rows = await sponsorship_stats.top_creators(order=order, limit=limit)
+    return [_with_conversion(row) for row in rows]
+
+@router.get("/stats/creators/{creator_id}", response_model=SponsorshipCreatorStats)
+async def get_sponsorship_creator_stats(creator_id: str):
+    """특정 크리에이터의 요청/성사 집계"""
+    stats = await sponsorship_stats.creator(creator_id)
+    
+    if not stats:
+        # 요청이 한 번도 없던 크리에이터
+        stats = {"creator_id": creator_id, "total_requests": 0, "completed_count": 0,
+                 "cancelled_count": 0, "commission_sum": 0}
+    
+    return _with_conversion(stats)
 
 @router.get("/{request_id}", response_model=SponsorshipRequestResponse)
 async def get_sponsorship_request(request_id: str):
     """협찬 중개 요청 조회"""
-    supabase = get_supabase_client()
+    sponsorship = await sponsorship_requests.get(request_id)
     
-    result = supabase.table("sponsorship_requests").select("*").eq("id", request_id).execute()
-    
-    if not result.data:
+    if not sponsorship:
         raise HTTPException(status_code=404, detail="Sponsorship request not found")
     
-    return result.data[0]
+    return sponsorship
 
 @router.put("/{request_id}", response_model=SponsorshipRequestResponse)
 async def update_sponsorship_request(request_id: str, update: SponsorshipRequestUpdate):
     """협찬 중개 요청 업데이트 (관리자용)"""
-    supabase = get_supabase_client()
-    
-    # 기존 요청 확인
-    existing = supabase.table("sponsorship_requests").select("*").eq("id", request_id).execute()
-    if not existing.data:
-        raise HTTPException(status_code=404, detail="Sponsorship request not found")
-    
     # 업데이트할 데이터만 추출
     update_data = {k: v for k, v in update.dict().items() if v is not None}
     
-    # 상태가 'completed'로 변경되면 수수료 계산
-    if update_data.get("status") == "completed" and update_data.get("final_rate"):
-        final_rate = update_data["final_rate"]
-        commission_rate = existing.data[0].get("commission_rate", 30.00)
-        commission_amount = int(final_rate * commission_rate / 100)
-        update_data["commission_amount"] = commission_amount
-        update_data["completed_at"] = datetime.utcnow().isoformat()
+    # 상태가 'completed'로 바뀌면 수수료(final_rate × 행의 commission_rate)와 completed_at,
+    # 그리고 updated_at은 저장 함수가 UPDATE 안에서 계산 (조회 없이 왕복 1회)
+    updated = await sponsorship_requests.apply_update(request_id, update_data)
     
-    # updated_at 자동 업데이트
-    update_data["updated_at"] = datetime.utcnow().isoformat()
-    
-    result = supabase.table("sponsorship_requests").update(update_data).eq("id", request_id).execute()
-    
-    if not result.data:
-        raise HTTPException(status_code=500, detail="Failed to update sponsorship request")
+    if not updated:
+        raise HTTPException(status_code=404, detail="Sponsorship request not found")
     
-    return result.data[0]
+    return updated
 
 @router.get("/", response_model=List[SponsorshipRequestResponse])
 async def list_sponsorship_requests(
+    response: Response,
     status: Optional[str] = None,
     creator_id: Optional[str] = None,
     limit: int = 20,
-    offset: int = 0
+    offset: int = 0,
+    cursor: Optional[str] = None
 ):
-    """협찬 중개 요청 목록 조회 (관리자용)"""
-    supabase = get_supabase_client()
-    
-    query = supabase.table("sponsorship_requests").select("*")
-    
-    if status:
-        query = query.eq("status", status)
-    
-    if creator_id:
-        query = query.eq("creator_id", creator_id)
-    
-    result = query.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
-    
-    return result.data
+    """
+    협찬 중개 요청 목록 조회 (관리자용, 최신순)
+    다음 페이지 커서는 X-Next-Cursor 헤더로 반환 (cursor를 주면 offset은 무시)
+    """
+    try:
+        requests = await sponsorship_requests.list(
+            status=status, creator_id=creator_id, limit=limit, offset=offset, cursor=cursor
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    cursor_value = next_cursor(requests, limit)
+    if cursor_value:
+        response.headers[NEXT_CURSOR_HEADER] = cursor_value
+    return requests
 
 @router.get("/creator/{creator_id}", response_model=List[SponsorshipRequestResponse])
 async def list_creator_sponsorship_requests(creator_id: str):
     """특정 크리에이터의 협찬 중개 요청 목록"""
-    supabase = get_supabase_client()
-    
-    result = supabase.table("sponsorship_requests")\
-        .select("*")\
-        .eq("creator_id", creator_id)\
-        .order("created_at", desc=True)\
-        .execute()
-    
-    return result.data
+    return await sponsorship_requests.list(creator_id=creator_id, limit=None)
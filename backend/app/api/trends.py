@@ -1,69 +1,133 @@
 """
 트렌드 분석 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.database import get_db
+import asyncio
+from fastapi import APIRouter, Header, HTTPException, Response
+from app.core.cache import LRUCache, SingleFlight
+from app.core.config import settings
+from app.db.database import SessionLocal
 from app.schemas.schemas import WeeklyTrends
 from app.models.models import WeeklyReport
-from datetime import datetime
-from typing import Optional
+from app.services.trend_engine import trend_engine, refresh_trend_engine
+from app.services.rising_trends import rising_trend_detector
+from app.services.weekly_report_builder import KST, WeeklyReportBuilder, current_iso_week, iso_week_range
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+import hashlib
+import time
 
 router = APIRouter()
 
+# 주간 리포트 응답 캐시: (year, week) → (etag, 직렬화된 본문, 만료 시각 또는 None)
+weekly_report_cache = LRUCache(max_size=settings.WEEKLY_REPORT_CACHE_SIZE)
+
+# 같은 주차를 동시에 요청해도 조회/생성은 한 번
+weekly_report_loads = SingleFlight()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _buildable_weeks() -> Tuple[Tuple[int, int], ...]:
+    """조회 시 리포트가 없으면 바로 생성해도 되는 주차 (이번 주, 지난주)"""
+    now = datetime.now(KST)
+    return current_iso_week(now), current_iso_week(now - timedelta(days=7))
+
+
+def _load_weekly_report(year: int, week: int) -> Tuple[str, bytes, Optional[float]]:
+    """
+    저장된 리포트를 읽어 직렬화
+
+    리포트가 없으면 이번 주/지난주만 생성해서 저장하고, 그 밖의 주차는 404
+    (동기 DB 작업이라 스레드에서 호출, 여러 요청이 함께 기다리므로 요청 세션 대신 자체 세션 사용)
+    """
+    db = SessionLocal()
+    try:
+        report = db.query(WeeklyReport).filter(
+            WeeklyReport.week_number == week,
+            WeeklyReport.year == year
+        ).first()
+        
+        if not report:
+            if (year, week) not in _buildable_weeks():
+                raise HTTPException(status_code=404, detail="해당 주차의 리포트가 없습니다.")
+            report = WeeklyReportBuilder(db).build(year, week)
+        
+        return _serialize_weekly_report(report)
+    finally:
+        db.close()
+
+
+def _serialize_weekly_report(report: WeeklyReport) -> Tuple[str, bytes, Optional[float]]:
+    year, week = report.year, report.week_number
+    body = WeeklyTrends(
+        week_number=report.week_number,
+        year=report.year,
+        top_keywords=report.top_keywords,
+        success_patterns=report.success_patterns,
+        rising_trends=report.rising_trends,
+        generated_at=report.generated_at
+    ).model_dump_json().encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    
+    # 지난 주차는 더 이상 바뀌지 않으므로 만료 없이 보관
+    _, week_end = iso_week_range(year, week)
+    expires_at = None
+    if week_end > datetime.now(week_end.tzinfo):
+        expires_at = time.time() + settings.WEEKLY_REPORT_CACHE_TTL_SECONDS
+    
+    return etag, body, expires_at
+
+
 @router.get("/weekly", response_model=Optional[WeeklyTrends])
 async def get_weekly_trends(
     week: Optional[int] = None,
     year: Optional[int] = None,
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     주간 트렌드 리포트 조회
     
     - **week**: 주차 (선택, 기본값: 현재 주)
     - **year**: 연도 (선택, 기본값: 현재 연도)
+    
+    미리 생성된 리포트를 메모리 캐시에서 바로 응답하며,
+    ETag가 같으면(If-None-Match) 304를 반환합니다.
     """
     try:
         # 기본값: 현재 주차
         if not week or not year:
-            now = datetime.now()
-            week = now.isocalendar()[1]
-            year = now.year
+            year, week = current_iso_week()
         
-        # 리포트 조회
-        report = db.query(WeeklyReport).filter(
-            WeeklyReport.week_number == week,
-            WeeklyReport.year == year
-        ).first()
+        try:
+            week_start, _ = iso_week_range(year, week)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="잘못된 주차입니다.")
+        if week_start > datetime.now(week_start.tzinfo):
+            raise HTTPException(status_code=404, detail="아직 시작되지 않은 주차입니다.")
         
-        if not report:
-            # 리포트가 없으면 더미 데이터 반환 (실제로는 생성 트리거)
-            return {
-                "week_number": week,
-                "year": year,
-                "top_keywords": [
-                    {"keyword": "블랙프라이데이", "impact_score": 0.85, "video_count": 127, "avg_views": 45000},
-                    {"keyword": "겨울쿨톤", "impact_score": 0.78, "video_count": 89, "avg_views": 38000},
-                    {"keyword": "내돈내산", "impact_score": 0.72, "video_count": 156, "avg_views": 32000}
-                ],
-                "success_patterns": {
-                    "optimal_length": "12-15분",
-                    "best_upload_time": "금요일 오후 8시",
-                    "thumbnail_type": "얼굴 클로즈업 + 제품"
-                },
-                "rising_trends": ["비건 글리터", "퍼스널 컬러 진단", "올리브영 세일"],
-                "generated_at": datetime.now()
-            }
+        key = (year, week)
+        cached = weekly_report_cache.get(key)
+        if cached is None or (cached[2] is not None and cached[2] < time.time()):
+            cached = await weekly_report_loads.run(
+                key, lambda: asyncio.to_thread(_load_weekly_report, year, week)
+            )
+            weekly_report_cache.set(key, cached)
         
-        return WeeklyTrends(
-            week_number=report.week_number,
-            year=report.year,
-            top_keywords=report.top_keywords,
-            success_patterns=report.success_patterns,
-            rising_trends=report.rising_trends,
-            generated_at=report.generated_at
-        )
+        etag, body, _ = cached
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
         
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers=headers)
+        
+        return Response(content=body, media_type="application/json", headers=headers)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"트렌드 조회 중 오류가 발생했습니다: {str(e)}")
 
@@ -72,14 +136,24 @@ async def get_weekly_trends(
 async def get_trending_keywords(limit: int = 10):
     """
     현재 트렌딩 키워드 목록 (실시간)
+    
+    수집된 영상의 제목/태그를 조회수 가중으로 집계한 상위 키워드입니다.
+    """
+    refresh_trend_engine(background=True)
+    
+    keywords = trend_engine.top_k(limit)
+    for item in keywords:
+        # 기존 응답 호환용 0-100 점수
+        item["trend_score"] = round(item["impact_score"] * 100)
+    
+    return {"keywords": keywords}
+
+
+@router.get("/rising")
+async def get_rising_trends(limit: int = 10):
     """
-    # 실제로는 DB에서 조회, 지금은 더미 데이터
-    return {
-        "keywords": [
-            {"keyword": "올리브영", "trend_score": 95},
-            {"keyword": "신상", "trend_score": 88},
-            {"keyword": "GRWM", "trend_score": 82},
-            {"keyword": "내돈내산", "trend_score": 79},
-            {"keyword": "퍼스널컬러", "trend_score": 75}
-        ][:limit]
-    }
+    떠오르는 트렌드 (최근 24시간 vs 과거 기준선 대비 급상승 키워드)
+    """
+    rising_trend_detector.reload_if_changed()
+    
+    return {"rising": rising_trend_detector.rising(limit)}
@@ -0,0 +1,121 @@
+"""
+프로세스 내 LRU 캐시
+"""
+import asyncio
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    크기 제한이 있는 스레드 안전 LRU 캐시
+
+    가장 오래 사용되지 않은 항목부터 제거하며,
+    적중률 확인을 위해 hit/miss 횟수를 함께 기록합니다.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("max_size는 1 이상이어야 합니다.")
+
+        self.max_size = max_size
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (조회된 항목은 최신으로 갱신)"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """캐시 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """단일 항목 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 삭제 (통계는 유지)"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    @property
+    def hit_ratio(self) -> Optional[float]:
+        total = self.hits + self.misses
+        if not total:
+            return None
+        return self.hits / total
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        hit_ratio = self.hit_ratio
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(hit_ratio, 4) if hit_ratio is not None else None,
+        }
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 비동기 작업을 한 번으로 합침
+
+    실행 중인 키로 들어온 호출은 새로 실행하지 않고 같은 결과(또는 예외)를 기다립니다.
+    작업은 호출한 요청과 분리된 태스크에서 실행되므로, 한 호출이 취소되어도 (클라이언트 연결 끊김 등)
+    작업과 나머지 호출은 그대로 진행됩니다.
+    작업이 끝나면 키를 지우므로 결과를 보관하지는 않습니다 (캐시는 호출하는 쪽에서).
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.joined = 0  # 실행 중인 작업에 합류한 호출 수
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.joined += 1
+        else:
+            task = asyncio.ensure_future(loader())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # shield: 이 호출이 취소되어도 공유 태스크는 취소하지 않음
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # 기다리는 쪽이 모두 취소되어도 경고가 나지 않도록 회수 표시
@@ -0,0 +1,104 @@
+"""
+대량 UPSERT 헬퍼
+행마다 SELECT 후 INSERT/UPDATE 하던 방식(N+1) 대신
+청크 단위 INSERT … ON CONFLICT DO UPDATE 한 번으로 저장합니다.
+"""
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Session
+
+
+class UpsertResult(NamedTuple):
+    """UPSERT 결과 (새로 들어간 키 / 갱신된 키)"""
+    inserted_keys: List[Any]
+    updated_keys: List[Any]
+
+    @property
+    def inserted(self) -> int:
+        return len(self.inserted_keys)
+
+    @property
+    def updated(self) -> int:
+        return len(self.updated_keys)
+
+
+def _dialect_insert(dialect_name: str):
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise ValueError(f"UPSERT를 지원하지 않는 데이터베이스입니다: {dialect_name}")
+    return insert
+
+
+def bulk_upsert(
+    db: Session,
+    model,
+    rows: Iterable[Dict[str, Any]],
+    key: str,
+    update_columns: Sequence[str],
+    chunk_size: int = 500,
+    touch_column: Optional[str] = "updated_at"
+) -> UpsertResult:
+    """
+    key 컬럼 기준 대량 UPSERT (PostgreSQL / SQLite)
+
+    - 청크마다 INSERT … ON CONFLICT (key) DO UPDATE 문 하나로 저장
+    - PostgreSQL: RETURNING (xmax = 0)으로 삽입/갱신을 같은 문장에서 구분
+    - SQLite: 청크마다 기존 키를 한 번 조회해 구분
+    - 같은 청크 안에 key가 중복되면 마지막 행만 사용
+
+    커밋은 호출하는 쪽에서 합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        model: ORM 모델 클래스
+        rows: 컬럼명 → 값 dict (모든 행이 같은 컬럼을 가져야 함)
+        key: 유니크 제약이 걸린 컬럼명
+        update_columns: 충돌 시 갱신할 컬럼
+        chunk_size: 한 문장에 담을 최대 행 수
+        touch_column: 갱신 시 현재 시각으로 바꿀 컬럼 (없으면 None)
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+    dialect_name = db.get_bind().dialect.name
+    insert = _dialect_insert(dialect_name)
+    key_column = getattr(model, key)
+
+    inserted_keys: List[Any] = []
+    updated_keys: List[Any] = []
+
+    def _flush(chunk: Dict[Any, Dict[str, Any]]) -> None:
+        # 값은 executemany 파라미터로 넘겨 컴파일된 문장을 재사용 (insertmanyvalues로 배치 전송)
+        stmt = insert(model)
+        set_ = {column: stmt.excluded[column] for column in update_columns}
+        if touch_column:
+            set_[touch_column] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=[key], set_=set_)
+
+        if dialect_name == "postgresql":
+            # xmax가 0이면 이번 문장에서 새로 삽입된 행
+            stmt = stmt.returning(key_column, literal_column("xmax = 0").label("inserted"))
+            for row_key, was_inserted in db.execute(stmt, list(chunk.values())):
+                (inserted_keys if was_inserted else updated_keys).append(row_key)
+            return
+
+        existing = set(db.scalars(select(key_column).where(key_column.in_(list(chunk)))))
+        db.execute(stmt, list(chunk.values()))
+        for row_key in chunk:
+            (updated_keys if row_key in existing else inserted_keys).append(row_key)
+
+    chunk: Dict[Any, Dict[str, Any]] = {}
+    for row in rows:
+        chunk[row[key]] = row
+        if len(chunk) >= chunk_size:
+            _flush(chunk)
+            chunk = {}
+    if chunk:
+        _flush(chunk)
+
+    return UpsertResult(inserted_keys, updated_keys)
+
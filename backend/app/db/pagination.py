@@ -0,0 +1,70 @@
+"""
+키셋(커서) 페이지네이션
+목록을 (created_at, id) 내림차순으로 정렬하고, 마지막 행의 (created_at, id)를 커서로 넘겨 다음 페이지를 조회합니다.
+
+offset 방식은 깊은 페이지일수록 Postgres가 offset만큼 행을 읽고 버려야 하고,
+조회 사이에 새 행이 들어오면 페이지 경계가 밀려 중복/누락이 생깁니다.
+커서 방식은 (created_at DESC, id DESC) 복합 인덱스에서 바로 이어서 읽습니다.
+
+커서는 클라이언트가 해석하지 않도록 base64url로 감싼 불투명 문자열입니다.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.db.postgrest import Filters, lte, quote
+
+# 목록 정렬 (커서 비교 순서와 같아야 함, id는 created_at이 같은 행 사이의 순서)
+KEYSET_ORDER = "created_at.desc,id.desc"
+
+# 응답 헤더 (본문은 기존처럼 목록 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def encode_cursor(row: Dict[str, Any]) -> str:
+    """행의 (created_at, id) → 커서 문자열"""
+    payload = json.dumps([row["created_at"], str(row["id"])], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """커서 문자열 → (created_at, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, TypeError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursor(f"유효하지 않은 커서입니다: {cursor!r}") from e
+    if not isinstance(created_at, str) or not isinstance(row_id, str):
+        raise InvalidCursor(f"유효하지 않은 커서입니다: {cursor!r}")
+    return created_at, row_id
+
+
+def after_cursor(cursor: str) -> Filters:
+    """
+    커서 다음 행 조건 (PostgREST 필터)
+
+    (created_at, id) < (커서 created_at, 커서 id)를 풀어 쓴 식입니다.
+    PostgREST 필터로는 행 값 비교를 쓸 수 없어 OR로 풀고, created_at <= 커서 조건을 따로 붙여
+    인덱스 범위 조건으로 쓰이게 합니다 (OR 식만 있으면 인덱스를 처음부터 읽으며 걸러냄).
+
+    최상위 created_at 값은 그대로 보내고, or= 식 안의 값만 따옴표로 감쌉니다
+    (created_at에는 항상 :가 들어가며, PostgREST는 식 안의 따옴표만 벗김).
+    """
+    created_at, row_id = decode_cursor(cursor)
+    quoted_at, quoted_id = quote(created_at), quote(row_id)
+    return {
+        "created_at": lte(created_at),
+        "or": f"(created_at.lt.{quoted_at},and(created_at.eq.{quoted_at},id.lt.{quoted_id}))",
+    }
+
+
+def next_cursor(rows: List[Dict[str, Any]], limit: Optional[int]) -> Optional[str]:
+    """꽉 찬 페이지면 마지막 행의 커서, 아니면 None (마지막 페이지)"""
+    if not rows or limit is None or len(rows) < limit:
+        return None
+    return encode_cursor(rows[-1])
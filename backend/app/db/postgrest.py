@@ -0,0 +1,217 @@
+"""
+비동기 PostgREST 클라이언트
+Supabase REST API(/rest/v1)를 httpx.AsyncClient로 직접 호출해 이벤트 루프를 막지 않습니다.
+
+API 핸들러(async def)에서는 동기 Supabase SDK(.execute()) 대신 이 클라이언트 위의 저장소를 사용합니다
+(app/db/repositories.py).
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import httpx
+
+from app.core.config import settings
+
+_RESERVED = ",:()\""
+
+
+class PostgrestError(Exception):
+    """PostgREST 오류 응답 (status_code, code, message)"""
+
+    def __init__(self, status_code: int, message: str, code: Optional[str] = None, details: Any = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.code = code
+        self.details = details
+
+
+class PostgrestDataError(PostgrestError):
+    """
+    행 데이터 때문에 거부된 요청 (4xx + SQLSTATE 22xxx 데이터 예외 / 23xxx 제약 위반)
+
+    권한(401/403), 서버 오류(5xx), 잘못된 요청 형식(PGRST…)과 달리 같은 요청을 다른 행으로 보내면 성공할 수 있습니다.
+    """
+
+
+def _error_class(status_code: int, code: Optional[str]) -> type:
+    if 400 <= status_code < 500 and code and code[:2] in ("22", "23"):
+        return PostgrestDataError
+    return PostgrestError
+
+
+def _value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if value is None:
+        return "null"
+    return str(value)
+
+
+def quote(value: Any) -> str:
+    """
+    in.(…) 목록과 or=/and= 식 안에 넣을 값 (구분 문자 ,:()"가 있으면 큰따옴표로 감쌈)
+
+    최상위 필터(eq./gte. 등)의 값은 PostgREST가 따옴표를 벗기지 않으므로 감싸지 않습니다.
+    """
+    text = _value(value)
+    if any(char in text for char in _RESERVED):
+        return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return text
+
+
+def eq(value: Any) -> str:
+    return f"eq.{_value(value)}"
+
+
+def neq(value: Any) -> str:
+    return f"neq.{_value(value)}"
+
+
+def gt(value: Any) -> str:
+    return f"gt.{_value(value)}"
+
+
+def gte(value: Any) -> str:
+    return f"gte.{_value(value)}"
+
+
+def lte(value: Any) -> str:
+    return f"lte.{_value(value)}"
+
+
+def in_(values: Iterable[Any]) -> str:
+    return f"in.({','.join(quote(value) for value in values)})"
+
+
+def ov(values: Iterable[Any]) -> str:
+    """배열 컬럼이 values 중 하나라도 포함 (&&)"""
+    quoted = ('"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"' for value in values)
+    return f"ov.{{{','.join(quoted)}}}"
+
+
+Filters = Dict[str, Union[str, List[str]]]
+
+
+class AsyncPostgrest:
+    """
+    공유 httpx.AsyncClient 기반 PostgREST 호출 (keep-alive 연결 풀, HTTP/2)
+
+    필터는 PostgREST 쿼리 형식 그대로 받습니다: {"username": eq("abc"), "status": in_(["a", "b"])}
+
+    동시 요청은 연결 수만큼만 풀에 들여보내고 나머지는 세마포어에서 기다리게 합니다.
+    httpcore 연결 풀은 대기 요청이 많으면 연결을 배정할 때마다 대기열 전체를 훑어서 CPU를 많이 씁니다.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+        self.base_url = base_url
+        self.api_key = api_key
+        self._client: Optional[httpx.AsyncClient] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            base_url = self.base_url or settings.SUPABASE_URL
+            api_key = self.api_key or settings.SUPABASE_ANON_KEY
+            self._slots = asyncio.Semaphore(settings.SUPABASE_HTTP_MAX_CONNECTIONS)
+            self._client = httpx.AsyncClient(
+                base_url=f"{base_url.rstrip('/')}/rest/v1",
+                headers={
+                    "apikey": api_key,
+                    "Authorization": f"Bearer {api_key}",
+                    "Accept": "application/json",
+                },
+                timeout=settings.SUPABASE_HTTP_TIMEOUT,
+                http2=settings.SUPABASE_HTTP2,
+                limits=httpx.Limits(
+                    max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=settings.SUPABASE_HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, method: str, table: str, params: Optional[Filters] = None,
+                       json: Any = None, prefer: Optional[str] = None) -> List[Dict[str, Any]]:
+        headers = {"Prefer": prefer} if prefer else None
+        client = self.client
+        async with self._slots:
+            response = await client.request(method, f"/{table}", params=params, json=json, headers=headers)
+        if response.status_code >= 400:
+            try:
+                body = response.json()
+            except ValueError:
+                body = {"message": response.text}
+            raise _error_class(response.status_code, body.get("code"))(
+                response.status_code,
+                body.get("message") or response.reason_phrase,
+                code=body.get("code"),
+                details=body.get("details"),
+            )
+        if not response.content:
+            return []
+        return response.json()
+
+    async def select(
+        self,
+        table: str,
+        filters: Optional[Filters] = None,
+        columns: str = "*",
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        행 조회
+
+        Args:
+            order: PostgREST 정렬 식 (예: "created_at.desc")
+        """
+        params: Filters = {"select": columns, **(filters or {})}
+        if order:
+            params["order"] = order
+        if limit is not None:
+            params["limit"] = str(limit)
+        if offset:
+            params["offset"] = str(offset)
+        return await self._request("GET", table, params=params)
+
+    async def select_one(self, table: str, filters: Filters, columns: str = "*") -> Optional[Dict[str, Any]]:
+        rows = await self.select(table, filters, columns=columns, limit=1)
+        return rows[0] if rows else None
+
+    async def insert(self, table: str, rows: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """행 삽입 후 저장된 행 반환"""
+        return await self._request("POST", table, json=rows, prefer="return=representation")
+
+    async def upsert(self, table: str, rows: List[Dict[str, Any]], on_conflict: str,
+                     columns: str = "*") -> List[Dict[str, Any]]:
+        """
+        행 삽입, on_conflict 컬럼이 겹치면 보낸 컬럼만 갱신 (INSERT … ON CONFLICT DO UPDATE) 후 저장된 행 반환
+
+        모든 행이 같은 키를 가져야 합니다 (PostgREST 대량 삽입 규칙).
+        """
+        return await self._request(
+            "POST", table, params={"on_conflict": on_conflict, "select": columns}, json=rows,
+            prefer="resolution=merge-duplicates,return=representation",
+        )
+
+    async def update(self, table: str, values: Dict[str, Any], filters: Filters) -> List[Dict[str, Any]]:
+        """조건에 맞는 행 수정 후 수정된 행 반환"""
+        if not filters:
+            raise ValueError("update에는 필터가 필요합니다.")
+        return await self._request("PATCH", table, params=filters, json=values, prefer="return=representation")
+
+    async def rpc(self, function: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """저장 함수 호출 (POST /rpc/{function}, 인자는 이름으로 전달)"""
+        return await self._request("POST", f"rpc/{function}", json=params or {})
+
+
+# 전역 인스턴스
+postgrest = AsyncPostgrest()
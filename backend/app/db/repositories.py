@@ -0,0 +1,195 @@
+"""
+Supabase 테이블 저장소 (비동기)
+API 핸들러가 쓰는 조회/저장을 테이블별로 모아 둡니다.
+"""
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from app.db.pagination import KEYSET_ORDER, after_cursor
+from app.db.postgrest import AsyncPostgrest, Filters, eq, gt, gte, lte, neq, ov, postgrest, quote
+
+
+class _Repository:
+    table = ""
+
+    def __init__(self, db: AsyncPostgrest):
+        self.db = db
+
+    async def get(self, row_id: str, columns: str = "*") -> Optional[Dict[str, Any]]:
+        return await self.db.select_one(self.table, {"id": eq(row_id)}, columns=columns)
+
+    async def create(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rows = await self.db.insert(self.table, data)
+        return rows[0] if rows else None
+
+    async def update(self, row_id: str, values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rows = await self.db.update(self.table, values, {"id": eq(row_id)})
+        return rows[0] if rows else None
+
+    async def _list_page(self, filters: Filters, limit: Optional[int], offset: int,
+                         cursor: Optional[str], columns: str = "*") -> List[Dict[str, Any]]:
+        """
+        최신순 목록 한 페이지
+
+        cursor가 있으면 키셋 방식(offset 무시), 없으면 기존 offset 방식으로 조회합니다.
+        """
+        if cursor:
+            filters = {**filters, **after_cursor(cursor)}
+            offset = 0
+        return await self.db.select(self.table, filters, columns=columns, order=KEYSET_ORDER,
+                                    limit=limit, offset=offset)
+
+    async def scan(self, filters: Optional[Filters] = None, columns: str = "*",
+                   page_size: int = 1000) -> AsyncIterator[List[Dict[str, Any]]]:
+        """조건에 맞는 행 전체를 id 순 page_size행씩 조회 (id 키셋이라 깊은 페이지도 느려지지 않음)"""
+        last_id = None
+        while True:
+            page_filters = dict(filters or {})
+            if last_id is not None:
+                page_filters["id"] = gt(last_id)
+            rows = await self.db.select(self.table, page_filters, columns=columns, order="id.asc", limit=page_size)
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+
+class CreatorProfileRepository(_Repository):
+    table = "creator_profiles"
+
+    async def get_by_username(self, username: str, active_only: bool = False,
+                              columns: str = "*") -> Optional[Dict[str, Any]]:
+        filters: Filters = {"username": eq(username)}
+        if active_only:
+            filters["is_active"] = eq(True)
+        return await self.db.select_one(self.table, filters, columns=columns)
+
+    async def update_by_username(self, username: str, values: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        rows = await self.db.update(self.table, values, {"username": eq(username)})
+        return rows[0] if rows else None
+
+    async def upsert_many(self, rows: List[Dict[str, Any]], columns: str = "*") -> List[Dict[str, Any]]:
+        """username 기준 대량 UPSERT (요청 1번, 있는 프로필은 보낸 컬럼만 갱신)"""
+        return await self.db.upsert(self.table, rows, on_conflict="username", columns=columns)
+
+    async def list_active(self, limit: int = 20, offset: int = 0, cursor: Optional[str] = None,
+                          columns: str = "*") -> List[Dict[str, Any]]:
+        return await self._list_page({"is_active": eq(True)}, limit, offset, cursor, columns)
+
+    # 탐색 정렬 (id는 같은 값 사이의 순서)
+    DISCOVERY_ORDER = {
+        "subscribers": "subscriber_count.desc,id.desc",
+        "views": "average_views.desc,id.desc",
+        "rate": "sponsorship_rate.asc,id.asc",
+        "recent": "created_at.desc,id.desc",
+    }
+
+    async def discover(
+        self,
+        min_subscribers: Optional[int] = None,
+        max_subscribers: Optional[int] = None,
+        min_views: Optional[int] = None,
+        max_views: Optional[int] = None,
+        min_rate: Optional[int] = None,
+        max_rate: Optional[int] = None,
+        categories: Sequence[str] = (),
+        text: Optional[str] = None,
+        sort: str = "subscribers",
+        limit: int = 20,
+        offset: int = 0,
+        columns: str = "*",
+    ) -> List[Dict[str, Any]]:
+        """
+        협찬 가능 프로필 탐색 (DB 조회)
+
+        범위 조건은 부분 btree 인덱스, categories는 GIN(&&), text는 pg_trgm GIN(ILIKE)을 씁니다
+        (docs/creator_profile_schema.md).
+        """
+        filters: Filters = {"is_active": eq(True), "sponsorship_available": eq(True)}
+        for column, low, high in (
+            ("subscriber_count", min_subscribers, max_subscribers),
+            ("average_views", min_views, max_views),
+            ("sponsorship_rate", min_rate, max_rate),
+        ):
+            bounds = [op(value) for op, value in ((gte, low), (lte, high)) if value is not None]
+            if bounds:
+                filters[column] = bounds
+        if categories:
+            filters["preferred_categories"] = ov(categories)
+        if text:
+            pattern = quote(f"*{text}*")
+            filters["or"] = f"(display_name.ilike.{pattern},bio.ilike.{pattern})"
+        return await self.db.select(self.table, filters, columns=columns, order=self.DISCOVERY_ORDER[sort],
+                                    limit=limit, offset=offset)
+
+
+class SponsorshipRequestRepository(_Repository):
+    table = "sponsorship_requests"
+
+    async def list(self, status: Optional[str] = None, creator_id: Optional[str] = None,
+                   limit: Optional[int] = 20, offset: int = 0,
+                   cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        filters: Filters = {}
+        if status:
+            filters["status"] = eq(status)
+        if creator_id:
+            filters["creator_id"] = eq(creator_id)
+        return await self._list_page(filters, limit, offset, cursor)
+
+    async def apply_update(self, row_id: str, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        요청 수정 (왕복 1회)
+
+        저장 함수 update_sponsorship_request가 UPDATE 한 문장에서 수수료/완료 시각/updated_at까지 계산해
+        수정된 행을 돌려줍니다 (docs/creator_profile_schema.md). 없는 요청이면 None.
+        """
+        rows = await self.db.rpc("update_sponsorship_request", {"p_id": row_id, "p_changes": changes})
+        return rows[0] if rows else None
+
+
+class SponsorshipStatsRepository(_Repository):
+    """
+    협찬 요청 집계 (요약 테이블 조회)
+
+    sponsorship_requests 트리거가 INSERT/UPDATE/DELETE마다 증감분을 반영하므로
+    집계는 이력 크기와 관계없이 요약 행을 읽기만 합니다 (docs/creator_profile_schema.md).
+    """
+    table = "sponsorship_totals"
+    monthly_table = "sponsorship_monthly_stats"
+    creator_table = "sponsorship_creator_stats"
+
+    async def totals(self) -> Optional[Dict[str, Any]]:
+        return await self.db.select_one(self.table, {"id": eq(True)})
+
+    async def monthly(self, months: int = 12) -> List[Dict[str, Any]]:
+        # 완료가 취소되어 0건이 된 달은 제외
+        return await self.db.select(
+            self.monthly_table, {"completed_count": neq(0)}, order="month.desc", limit=months
+        )
+
+    async def creator(self, creator_id: str) -> Optional[Dict[str, Any]]:
+        return await self.db.select_one(self.creator_table, {"creator_id": eq(creator_id)})
+
+    async def top_creators(self, order: str = "commission_sum", limit: int = 20) -> List[Dict[str, Any]]:
+        return await self.db.select(self.creator_table, order=f"{order}.desc,creator_id.asc", limit=limit)
+
+
+class VideoReportRepository(_Repository):
+    table = "video_reports"
+
+    async def get_by_video_id(self, video_id: str) -> Optional[Dict[str, Any]]:
+        return await self.db.select_one(self.table, {"video_id": eq(video_id)})
+
+    async def list_recent(self, limit: int = 10, offset: int = 0, cursor: Optional[str] = None,
+                          columns: str = "*") -> List[Dict[str, Any]]:
+        return await self._list_page({}, limit, offset, cursor, columns)
+
+    async def list_top(self, limit: int = 5, columns: str = "*") -> List[Dict[str, Any]]:
+        return await self.db.select(self.table, columns=columns, order="success_score.desc", limit=limit)
+
+
+# 전역 인스턴스
+creator_profiles = CreatorProfileRepository(postgrest)
+sponsorship_requests = SponsorshipRequestRepository(postgrest)
+sponsorship_stats = SponsorshipStatsRepository(postgrest)
+video_reports = VideoReportRepository(postgrest)
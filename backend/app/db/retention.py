@@ -0,0 +1,117 @@
+"""
+보존 기간 정리 헬퍼
+한 번의 무제한 DELETE 대신 기본키 청크 단위로 짧은 트랜잭션을 반복해
+수집/사용자 요청이 쓰기 잠금에 오래 막히지 않도록 합니다.
+"""
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+
+def ensure_index(engine: Engine, model, column_name: str) -> None:
+    """
+    모델에 선언된 column_name 단일 컬럼 인덱스가 DB에 없으면 생성
+
+    create_all은 이미 있는 테이블에 인덱스를 추가하지 않으므로
+    모델에 인덱스를 새로 선언했을 때 기존 DB에도 반영하기 위해 사용합니다.
+    """
+    for index in model.__table__.indexes:
+        if [column.name for column in index.columns] == [column_name]:
+            index.create(bind=engine, checkfirst=True)
+            return
+    raise ValueError(f"{model.__tablename__}.{column_name} 인덱스가 모델에 선언되어 있지 않습니다.")
+
+
+def delete_in_chunks(
+    db: Session,
+    model,
+    column,
+    cutoff: datetime,
+    chunk_size: int = 1000,
+    pause_seconds: float = 0.05,
+    max_chunks: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    column < cutoff 인 행을 chunk_size개씩 나눠 삭제
+
+    청크마다 column 인덱스 순서로 대상 기본키를 골라 삭제한 뒤 바로 커밋하고,
+    다음 청크 전에 pause_seconds만큼 쉬어 다른 쓰기 작업이 끼어들 수 있게 합니다.
+
+    Args:
+        db: SQLAlchemy 세션
+        model: ORM 모델 클래스 (단일 기본키)
+        column: 기준 컬럼 (인덱스가 있어야 청크 선택이 빠름)
+        cutoff: 이 시각 이전 행 삭제
+        max_chunks: 한 번 실행에서 처리할 최대 청크 수 (None이면 끝까지)
+
+    Returns:
+        rows_deleted, chunks, lock_ms_total, lock_ms_max, duration_ms
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+    pk = model.__mapper__.primary_key[0]
+    started = time.perf_counter()
+    metrics: Dict[str, Any] = {
+        "rows_deleted": 0,
+        "chunks": 0,
+        "lock_ms_total": 0.0,
+        "lock_ms_max": 0.0,
+    }
+
+    while max_chunks is None or metrics["chunks"] < max_chunks:
+        ids = db.scalars(
+            select(pk).where(column < cutoff).order_by(column).limit(chunk_size)
+        ).all()
+        if not ids:
+            db.rollback()  # 읽기 트랜잭션 종료
+            break
+
+        lock_started = time.perf_counter()
+        result = db.execute(
+            delete(model).where(pk.in_(ids)).execution_options(synchronize_session=False)
+        )
+        db.commit()
+        lock_ms = (time.perf_counter() - lock_started) * 1000
+
+        metrics["rows_deleted"] += result.rowcount or 0
+        metrics["chunks"] += 1
+        metrics["lock_ms_total"] += lock_ms
+        metrics["lock_ms_max"] = max(metrics["lock_ms_max"], lock_ms)
+
+        if len(ids) < chunk_size:
+            break
+        if pause_seconds > 0:
+            time.sleep(pause_seconds)
+
+    metrics["lock_ms_total"] = round(metrics["lock_ms_total"], 2)
+    metrics["lock_ms_max"] = round(metrics["lock_ms_max"], 2)
+    metrics["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return metrics
+
+
+def record_retention_run(db: Session, table_name: str, cutoff: datetime, metrics: Dict[str, Any],
+                         error: Optional[str] = None) -> None:
+    """DataRetentionRun에 실행 지표 저장 (실패해도 정리 작업에는 영향 없음)"""
+    from app.models.models import DataRetentionRun
+
+    try:
+        db.add(DataRetentionRun(
+            table_name=table_name,
+            cutoff=cutoff,
+            rows_deleted=metrics.get("rows_deleted", 0),
+            chunks=metrics.get("chunks", 0),
+            lock_ms_total=metrics.get("lock_ms_total"),
+            lock_ms_max=metrics.get("lock_ms_max"),
+            duration_ms=metrics.get("duration_ms"),
+            error=error,
+            started_at=datetime.now(timezone.utc),
+        ))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"⚠️  보존 기간 정리 기록 저장 실패: {e}")
@@ -1,15 +1,102 @@
 """
 Supabase 클라이언트 설정
+
+프로세스 전체에서 클라이언트 하나를 공유합니다.
+PostgREST 요청은 keep-alive 연결 풀(HTTP/2)을 재사용하므로, 요청마다 클라이언트를 새로 만들 때의
+클라이언트 생성 + TCP/TLS 연결 비용이 없습니다.
+앱 시작 시 start(), 종료 시 close()를 호출합니다 (app/main.py).
 """
-from supabase import create_client, Client
+import threading
+from typing import Optional
+
+import httpx
+from postgrest import SyncPostgrestClient
+from postgrest.utils import SyncClient
+from supabase import Client, ClientOptions
 from app.core.config import settings
 
-def get_supabase_client() -> Client:
-    """Supabase 클라이언트 인스턴스 반환"""
-    return create_client(
-        supabase_url=settings.SUPABASE_URL,
-        supabase_key=settings.SUPABASE_ANON_KEY
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.SUPABASE_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.SUPABASE_HTTP_KEEPALIVE_EXPIRY,
     )
 
-# 전역 클라이언트 인스턴스
-supabase: Client = get_supabase_client()
+
+class _PooledPostgrestClient(SyncPostgrestClient):
+    """연결 풀 한도를 지정한 HTTP 세션을 쓰는 PostgREST 클라이언트"""
+
+    def create_session(self, base_url, headers, timeout, verify=True, proxy=None) -> SyncClient:
+        return SyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=timeout,
+            verify=verify,
+            proxy=proxy,
+            follow_redirects=True,
+            http2=settings.SUPABASE_HTTP2,
+            limits=_pool_limits(),
+        )
+
+
+class PooledSupabaseClient(Client):
+    """PostgREST 요청에 _PooledPostgrestClient를 사용하는 Supabase 클라이언트"""
+
+    @staticmethod
+    def _init_postgrest_client(rest_url, headers, schema, timeout=None, verify=True, proxy=None):
+        return _PooledPostgrestClient(
+            rest_url,
+            headers=headers,
+            schema=schema,
+            timeout=timeout if timeout is not None else settings.SUPABASE_HTTP_TIMEOUT,
+            verify=verify,
+            proxy=proxy,
+        )
+
+
+class SupabaseClientPool:
+    """공유 Supabase 클라이언트 수명 관리 (처음 get() 또는 start() 때 생성)"""
+
+    def __init__(self):
+        self._client: Optional[Client] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Client:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = PooledSupabaseClient.create(
+                        supabase_url=settings.SUPABASE_URL,
+                        supabase_key=settings.SUPABASE_ANON_KEY,
+                        options=ClientOptions(postgrest_client_timeout=settings.SUPABASE_HTTP_TIMEOUT),
+                    )
+        return self._client
+
+    def start(self) -> Client:
+        """클라이언트와 PostgREST 세션을 미리 만들어 둠 (첫 요청 지연 방지)"""
+        client = self.get()
+        client.postgrest
+        return client
+
+    def close(self) -> None:
+        """열린 HTTP 연결 정리 (앱 종료 시)"""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None and client._postgrest is not None:
+            client._postgrest.aclose()
+
+
+supabase_pool = SupabaseClientPool()
+
+
+def get_supabase_client() -> Client:
+    """공유 Supabase 클라이언트 반환 (요청마다 새로 만들지 않음)"""
+    return supabase_pool.get()
+
+
+def __getattr__(name: str):
+    # `from app.db.supabase_client import supabase` 호환 (처음 접근할 때 생성)
+    if name == "supabase":
+        return supabase_pool.get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
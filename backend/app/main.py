@@ -8,8 +8,19 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 import os
 
-from app.api import reports, creators, sponsorships
+from app.api import reports, creators, sponsorships, prediction, trends, newsletter
 from app.core.config import settings
+from app.db.database import Base, engine
+from app.db.pagination import NEXT_CURSOR_HEADER
+from app.db.postgrest import postgrest
+from app.db.supabase_client import supabase_pool
+from app.models import models  # noqa: F401 (테이블 등록)
+from app.services.prediction_log_writer import prediction_log_writer
+from app.services.success_patterns import success_pattern_analyzer
+from app.services.trend_engine import refresh_trend_engine
+from app.services.rising_trends import rising_trend_detector
+from app.services.known_ids import known_report_index, known_video_index
+from app.services.creator_discovery import creator_discovery_index
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -25,12 +36,40 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, creators.TOTAL_COUNT_HEADER],  # 목록 API 다음 페이지 커서, 탐색 결과 수
 )
 
 # API 라우터 등록
 app.include_router(reports.router, prefix="/api/reports", tags=["리포트"])
 app.include_router(creators.router, prefix="/api/creators", tags=["크리에이터"])
 app.include_router(sponsorships.router, prefix="/api/sponsorships", tags=["협찬 중개"])
+app.include_router(prediction.router, prefix="/api/prediction", tags=["떡상 예측"])
+app.include_router(trends.router, prefix="/api/trends", tags=["트렌드"])
+app.include_router(newsletter.router, prefix="/api/newsletter", tags=["뉴스레터"])
+
+@app.on_event("startup")
+async def on_startup():
+    """앱 시작 시 테이블 생성 및 백그라운드 작업 시작"""
+    Base.metadata.create_all(bind=engine)
+    supabase_pool.start()
+    prediction_log_writer.start()
+    
+    # 트렌드 엔진은 DB에서 재구성 (기동을 막지 않도록 백그라운드에서)
+    refresh_trend_engine(background=True)
+    rising_trend_detector.load()
+    # 성공 패턴은 예측 요청 밖에서 미리 계산
+    success_pattern_analyzer.refresh(background=True)
+    known_video_index.ensure_ready(settings.KNOWN_IDS_MAX_AGE_HOURS, background=True)
+    known_report_index.ensure_ready(settings.KNOWN_IDS_MAX_AGE_HOURS, background=True)
+    # 크리에이터 탐색 인덱스 적재 (실패하면 탐색 API는 DB 조회로 처리)
+    creator_discovery_index.start()
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """앱 종료 시 남은 예측 로그 기록 및 Supabase 연결 정리"""
+    prediction_log_writer.stop()
+    supabase_pool.close()
+    await postgrest.aclose()
 
 # 정적 파일 서빙 (프론트엔드 빌드 파일)
 # Render 환경에서는 /opt/render/project/src/가 루트 경로
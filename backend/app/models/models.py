@@ -1,7 +1,7 @@
 """
 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, Text, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, Boolean, Text, JSON, Index
 from sqlalchemy.sql import func
 from app.db.database import Base
 
@@ -35,7 +35,23 @@ class VideoData(Base):
     
     # 타임스탬프 (API 정책 준수용)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), server_default=func.now(), index=True)  # 보존 기간 정리용
+
+
+class VideoStatsSnapshot(Base):
+    """영상 통계 시계열 (재수집할 때마다 한 행씩 추가, 수정하지 않음)"""
+    __tablename__ = "video_stats_snapshots"
+    __table_args__ = (
+        Index("ix_video_stats_snapshots_video_captured", "video_id", "captured_at"),
+    )
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    video_id = Column(String, nullable=False)
+    captured_at = Column(DateTime(timezone=True), nullable=False, index=True)  # 보존 기간 정리용
+    
+    view_count = Column(BigInteger)
+    like_count = Column(Integer)
+    comment_count = Column(Integer)
 
 
 class NewsletterSubscriber(Base):
@@ -107,3 +123,23 @@ class PredictionLog(Base):
     
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class DataRetentionRun(Base):
+    """보존 기간 정리 실행 기록"""
+    __tablename__ = "data_retention_runs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, index=True, nullable=False)
+    cutoff = Column(DateTime(timezone=True))
+    
+    # 실행 지표
+    rows_deleted = Column(Integer, default=0)
+    chunks = Column(Integer, default=0)
+    lock_ms_total = Column(Float)  # 쓰기 트랜잭션(DELETE + COMMIT) 시간 합계
+    lock_ms_max = Column(Float)  # 가장 길었던 한 번의 쓰기 트랜잭션
+    duration_ms = Column(Float)  # 대기 시간 포함 전체 소요 시간
+    error = Column(Text)
+    
+    # 타임스탬프
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,303 @@
+"""
+VideoData 컬럼형 분석 스냅샷
+VideoData를 주기적으로 컬럼별 .npy 파일로 내보내고, mmap으로 열어
+OLTP DB를 건드리지 않고 group-by/백분위 집계를 수행합니다.
+
+디렉터리 구조:
+    <base_dir>/CURRENT              현재 스냅샷 이름
+    <base_dir>/<version>/meta.json  행 수, 생성 시각
+    <base_dir>/<version>/*.npy      컬럼 배열
+    <base_dir>/<version>/vocab.json 키워드 사전 (kw_ids의 인덱스)
+"""
+import json
+import os
+import shutil
+import time
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.services.text_features import tokenize_keywords
+
+# 숫자 컬럼과 dtype (결측값은 -1)
+NUMERIC_COLUMNS: Dict[str, str] = {
+    "view_count": "int64",
+    "like_count": "int64",
+    "comment_count": "int64",
+    "duration": "int32",
+    "published_at": "int64",  # epoch 초
+}
+VIDEO_ID_DTYPE = "U16"
+
+
+def _epoch_seconds(value: Optional[datetime]) -> int:
+    if value is None:
+        return -1
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def write_snapshot(
+    base_dir: str,
+    columns: Dict[str, np.ndarray],
+    kw_indptr: np.ndarray,
+    kw_ids: np.ndarray,
+    vocab: Sequence[str],
+    keep: int = 3
+) -> str:
+    """
+    컬럼 배열을 새 스냅샷으로 기록하고 CURRENT를 교체
+
+    임시 디렉터리에 모두 쓴 뒤 이름을 바꾸므로 읽는 쪽은 항상 완성된 스냅샷만 봅니다.
+
+    Returns:
+        스냅샷 버전 이름
+    """
+    os.makedirs(base_dir, exist_ok=True)
+    version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    tmp_dir = os.path.join(base_dir, f".tmp-{version}")
+    os.makedirs(tmp_dir)
+
+    row_count = len(columns["video_id"])
+    for name, values in columns.items():
+        np.save(os.path.join(tmp_dir, f"{name}.npy"), values)
+    np.save(os.path.join(tmp_dir, "kw_indptr.npy"), kw_indptr)
+    np.save(os.path.join(tmp_dir, "kw_ids.npy"), kw_ids)
+
+    with open(os.path.join(tmp_dir, "vocab.json"), "w", encoding="utf-8") as f:
+        json.dump(list(vocab), f, ensure_ascii=False)
+    with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": version, "row_count": row_count, "exported_at": time.time()}, f)
+
+    os.replace(tmp_dir, os.path.join(base_dir, version))
+
+    pointer_tmp = os.path.join(base_dir, "CURRENT.tmp")
+    with open(pointer_tmp, "w") as f:
+        f.write(version)
+    os.replace(pointer_tmp, os.path.join(base_dir, "CURRENT"))
+
+    # 오래된 스냅샷 정리 (최근 keep개 유지)
+    versions = sorted(
+        name for name in os.listdir(base_dir)
+        if not name.startswith(".") and os.path.isdir(os.path.join(base_dir, name))
+    )
+    for old in versions[:-keep]:
+        shutil.rmtree(os.path.join(base_dir, old), ignore_errors=True)
+
+    return version
+
+
+def export_snapshot(db, base_dir: str, batch_size: int = 5000, keep: int = 3) -> str:
+    """
+    VideoData 전체를 스트리밍으로 읽어 스냅샷 생성
+
+    Args:
+        db: SQLAlchemy 세션
+        base_dir: 스냅샷 루트 디렉터리
+    """
+    from app.models.models import VideoData
+
+    video_ids: List[str] = []
+    numeric = {name: array("q") for name in NUMERIC_COLUMNS}
+    kw_indptr = array("q", [0])
+    kw_ids = array("q")
+    vocab: Dict[str, int] = {}
+
+    rows = db.query(
+        VideoData.video_id, VideoData.title, VideoData.tags,
+        VideoData.view_count, VideoData.like_count, VideoData.comment_count,
+        VideoData.duration, VideoData.published_at
+    ).execution_options(yield_per=batch_size)
+
+    for video_id, title, tags, views, likes, comments, duration, published_at in rows:
+        video_ids.append(video_id)
+        numeric["view_count"].append(views or 0)
+        numeric["like_count"].append(likes or 0)
+        numeric["comment_count"].append(comments or 0)
+        numeric["duration"].append(duration if duration is not None else -1)
+        numeric["published_at"].append(_epoch_seconds(published_at))
+
+        for keyword in tokenize_keywords(title, tags):
+            kw_ids.append(vocab.setdefault(keyword, len(vocab)))
+        kw_indptr.append(len(kw_ids))
+
+    columns: Dict[str, np.ndarray] = {"video_id": np.array(video_ids, dtype=VIDEO_ID_DTYPE)}
+    for name, dtype in NUMERIC_COLUMNS.items():
+        columns[name] = np.frombuffer(numeric[name], dtype=np.int64).astype(dtype)
+
+    return write_snapshot(
+        base_dir,
+        columns,
+        np.frombuffer(kw_indptr, dtype=np.int64).copy(),
+        np.frombuffer(kw_ids, dtype=np.int64).astype(np.int32),
+        sorted(vocab, key=vocab.get),
+        keep=keep,
+    )
+
+
+def group_aggregate(
+    keys: np.ndarray,
+    values: np.ndarray,
+    n_groups: int,
+    agg: str = "mean",
+    q: float = 50.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정수 그룹 키 기준 집계
+
+    Args:
+        keys: 행별 그룹 번호 (0 <= key < n_groups, 음수는 제외)
+        values: 행별 값
+        agg: 'count' | 'sum' | 'mean' | 'percentile'
+        q: agg='percentile'일 때 백분위 (0-100, 선형 보간)
+
+    Returns:
+        (그룹별 집계값, 그룹별 행 수) - 행이 없는 그룹은 NaN
+    """
+    valid = keys >= 0
+    keys = keys[valid].astype(np.int64)
+    values = np.asarray(values)[valid].astype(np.float64)
+
+    counts = np.bincount(keys, minlength=n_groups)[:n_groups]
+    if agg == "count":
+        return counts.astype(np.float64), counts
+
+    result = np.full(n_groups, np.nan)
+    has_rows = counts > 0
+
+    if agg in ("sum", "mean"):
+        sums = np.bincount(keys, weights=values, minlength=n_groups)[:n_groups]
+        if agg == "sum":
+            return sums, counts
+        result[has_rows] = sums[has_rows] / counts[has_rows]
+        return result, counts
+
+    if agg == "percentile":
+        # (그룹, 값) 순으로 정렬한 뒤 그룹별 위치를 계산해 한 번에 보간
+        order = np.lexsort((values, keys))
+        sorted_values = values[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        position = starts + (counts - 1).clip(min=0) * (q / 100.0)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, starts + counts - 1)
+        frac = position - lower
+
+        groups = np.flatnonzero(has_rows)
+        result[groups] = (
+            sorted_values[lower[groups]] * (1 - frac[groups])
+            + sorted_values[upper[groups]] * frac[groups]
+        )
+        return result, counts
+
+    raise ValueError(f"지원하지 않는 집계 방식입니다: {agg}")
+
+
+class AnalyticsSnapshot:
+    """
+    읽기 전용 컬럼형 스냅샷
+
+    컬럼은 처음 접근할 때 mmap으로 열리며, 이후 집계는 모두 NumPy 벡터 연산입니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._vocab: Optional[List[str]] = None
+
+    @classmethod
+    def open_current(cls, base_dir: str) -> Optional["AnalyticsSnapshot"]:
+        """CURRENT가 가리키는 스냅샷 열기 (없으면 None)"""
+        pointer = os.path.join(base_dir, "CURRENT")
+        if not os.path.exists(pointer):
+            return None
+        with open(pointer) as f:
+            version = f.read().strip()
+        return cls(os.path.join(base_dir, version))
+
+    @property
+    def version(self) -> str:
+        return self.meta["version"]
+
+    @property
+    def row_count(self) -> int:
+        return self.meta["row_count"]
+
+    @property
+    def vocab(self) -> List[str]:
+        if self._vocab is None:
+            with open(os.path.join(self.path, "vocab.json"), encoding="utf-8") as f:
+                self._vocab = json.load(f)
+        return self._vocab
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in self._columns:
+            self._columns[name] = np.load(os.path.join(self.path, f"{name}.npy"), mmap_mode="r")
+        return self._columns[name]
+
+    # ===== 그룹 키 =====
+    def duration_bucket(self, edges: Sequence[int]) -> np.ndarray:
+        """영상 길이(초) 구간 번호 (edges[i] <= duration < edges[i+1] → i, 결측은 -1)"""
+        duration = self.column("duration")
+        codes = np.digitize(duration, edges) - 1
+        codes[(duration < 0) | (codes >= len(edges) - 1)] = -1
+        return codes
+
+    def publish_hour(self, utc_offset_hours: int = 9) -> np.ndarray:
+        """게시 시각의 시(0-23), 기본 KST"""
+        published = self.column("published_at")
+        hours = ((published + utc_offset_hours * 3600) // 3600) % 24
+        return np.where(published < 0, -1, hours)
+
+    def publish_weekday(self, utc_offset_hours: int = 9) -> np.ndarray:
+        """게시 요일 (월=0 … 일=6), 기본 KST"""
+        published = self.column("published_at")
+        # 1970-01-01은 목요일(3)
+        weekdays = ((published + utc_offset_hours * 3600) // 86400 + 3) % 7
+        return np.where(published < 0, -1, weekdays)
+
+    # ===== 집계 =====
+    def aggregate(
+        self,
+        keys: np.ndarray,
+        n_groups: int,
+        value_column: str = "view_count",
+        agg: str = "mean",
+        q: float = 50.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        return group_aggregate(keys, self.column(value_column), n_groups, agg=agg, q=q)
+
+    def keyword_aggregate(
+        self,
+        value_column: str = "view_count",
+        agg: str = "mean",
+        q: float = 50.0,
+        top: int = 20,
+        min_count: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드별 집계 (한 영상이 여러 키워드에 속하는 다대다 그룹)
+
+        Returns:
+            값이 큰 순서의 [{"keyword", "value", "video_count"}, ...]
+        """
+        kw_indptr = self.column("kw_indptr")
+        kw_ids = self.column("kw_ids")
+        rows = np.repeat(np.arange(self.row_count), np.diff(kw_indptr))
+        values = self.column(value_column)[rows]
+
+        result, counts = group_aggregate(kw_ids, values, len(self.vocab), agg=agg, q=q)
+        eligible = np.flatnonzero((counts >= min_count) & ~np.isnan(result))
+        if len(eligible) > top:
+            eligible = eligible[np.argpartition(-result[eligible], top - 1)[:top]]
+        eligible = eligible[np.argsort(-result[eligible])]
+
+        vocab = self.vocab
+        return [
+            {"keyword": vocab[i], "value": float(result[i]), "video_count": int(counts[i])}
+            for i in eligible
+        ]
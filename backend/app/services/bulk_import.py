@@ -0,0 +1,297 @@
+"""
+대량 가져오기 (NDJSON / CSV 스트리밍 업로드)
+요청 본문을 받는 대로 한 줄씩 읽어 검증하고, chunk_size행이 모이면 저장 함수로 한 번에 UPSERT합니다.
+
+- 파일 전체를 메모리에 올리지 않음: 들고 있는 것은 읽는 중인 줄 + 저장 대기 청크 + 행 오류(최대 max_errors개)
+- 행 검증은 청크 단위로 스레드에서 실행 (큰 파일을 받는 동안에도 이벤트 루프가 다른 요청 처리)
+- 검증 실패/파싱 실패 행은 건너뛰고 줄 번호와 사유를 보고, 나머지 행은 계속 저장
+- 청크 저장이 데이터 오류(row_errors)로 실패하면 그 청크를 반씩 나눠 다시 저장해 실패한 행을 찾음
+  (문제 행이 적으면 왕복이 행 수가 아니라 log2(청크 크기)에 비례)
+- 같은 청크 안에서 key가 겹치면 마지막 행만 저장 (duplicates로 집계)
+
+CSV는 첫 줄이 헤더(모델 필드명)이고, 빈 칸은 값 없음(모델 기본값)으로 봅니다.
+리스트 필드는 "뷰티|패션"처럼 |로 구분하거나 JSON 배열로 적습니다.
+"""
+import asyncio
+import csv
+import json
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, List, Literal, Optional,
+                    Tuple, Type, get_origin)
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+
+ImportFormat = Literal["ndjson", "csv"]
+
+# 청크 저장 함수: 검증된 모델 목록 → 처리 결과 카운터 (예: {"inserted": 3, "updated": 1})
+FlushFunc = Callable[[List[BaseModel]], Awaitable[Dict[str, int]]]
+
+_BOM = b"\xef\xbb\xbf"
+
+
+class ImportAborted(Exception):
+    """데이터 오류가 아닌 이유(DB 연결 등)로 중단 - 그때까지의 보고서를 함께 전달"""
+
+    def __init__(self, message: str, report: Dict[str, Any]):
+        super().__init__(message)
+        self.report = report
+
+
+def detect_format(content_type: Optional[str]) -> ImportFormat:
+    """Content-Type으로 형식 추정 (text/csv면 csv, 나머지는 ndjson)"""
+    return "csv" if content_type and "csv" in content_type.lower() else "ndjson"
+
+
+async def iter_lines(stream: AsyncIterator[bytes],
+                     max_line_bytes: int) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    바이트 스트림 → (줄 번호, 줄) (줄바꿈 제외)
+
+    max_line_bytes를 넘는 줄은 다음 줄바꿈까지 버리고 None으로 알립니다.
+    UTF-8에서 줄바꿈 바이트는 여러 바이트 문자 안에 나오지 않으므로 줄 단위로 디코딩합니다.
+    """
+    buffer = b""
+    line_no = 0
+    skipping = False
+    first = True
+    async for data in stream:
+        if first and data:
+            data = data[len(_BOM):] if data.startswith(_BOM) else data
+            first = False
+        buffer += data
+        while True:
+            end = buffer.find(b"\n")
+            if end < 0:
+                break
+            line, buffer = buffer[:end], buffer[end + 1:]
+            line_no += 1
+            if skipping:
+                skipping = False
+                yield line_no, None
+                continue
+            yield line_no, _decode(line, max_line_bytes)
+        if len(buffer) > max_line_bytes:
+            # 줄바꿈 없이 너무 긴 줄: 남은 부분은 버리며 읽음
+            buffer = b""
+            skipping = True
+    if buffer or skipping:
+        line_no += 1
+        yield line_no, None if skipping else _decode(buffer, max_line_bytes)
+
+
+def _decode(line: bytes, max_line_bytes: int) -> Optional[str]:
+    if len(line) > max_line_bytes:
+        return None
+    return line.rstrip(b"\r").decode("utf-8", errors="replace")
+
+
+async def iter_ndjson(lines: AsyncIterator[Tuple[int, Optional[str]]],
+                      model: Type[BaseModel]) -> AsyncIterator[Tuple[int, Any]]:
+    """NDJSON 줄 → (줄 번호, dict 또는 오류 메시지 str)"""
+    async for line_no, line in lines:
+        if line is None:
+            yield line_no, "줄이 너무 깁니다."
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, f"JSON 형식 오류: {e}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, "JSON 객체가 아닙니다."
+            continue
+        yield line_no, record
+
+
+async def iter_csv(lines: AsyncIterator[Tuple[int, Optional[str]]],
+                   model: Type[BaseModel]) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    CSV 줄 → (레코드 시작 줄 번호, dict 또는 오류 메시지 str)
+
+    따옴표 안의 줄바꿈은 따옴표 수가 짝수가 될 때까지 다음 줄을 이어 붙여 처리합니다.
+    """
+    list_fields = {name for name, field in model.model_fields.items()
+                   if get_origin(field.annotation) is list or _optional_list(field.annotation)}
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start = 0
+
+    async for line_no, line in lines:
+        if line is None:
+            pending = []
+            yield line_no, "줄이 너무 깁니다."
+            continue
+        if not pending:
+            start = line_no
+        pending.append(line)
+        text = "\n".join(pending)
+        if text.count('"') % 2:
+            continue
+        pending = []
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) > len(header):
+            yield start, f"열 수({len(values)})가 헤더({len(header)})보다 많습니다."
+            continue
+        yield start, _csv_record(header, values, list_fields)
+
+    if pending:
+        yield start, "닫히지 않은 따옴표가 있습니다."
+
+
+def _optional_list(annotation: Any) -> bool:
+    # Optional[List[...]]
+    return any(get_origin(arg) is list for arg in getattr(annotation, "__args__", ()))
+
+
+def _csv_record(header: List[str], values: List[str], list_fields: set) -> Dict[str, Any]:
+    record: Dict[str, Any] = {}
+    for name, value in zip(header, values):
+        value = value.strip()
+        if not name or value == "":
+            continue
+        if name in list_fields:
+            if value.startswith("["):
+                try:
+                    record[name] = json.loads(value)
+                    continue
+                except ValueError:
+                    pass
+            record[name] = [item.strip() for item in value.split("|") if item.strip()]
+        else:
+            record[name] = value
+    return record
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}" if detail["loc"] else detail["msg"]
+        for detail in error.errors()
+    )
+
+
+def _error_message(error: Exception) -> str:
+    # PostgrestError.message, SQLAlchemy DBAPIError.orig (SQL 문장/파라미터 제외)
+    return str(getattr(error, "message", None) or getattr(error, "orig", None) or error)
+
+
+class BulkImporter:
+    """
+    스트리밍 검증 + 청크 UPSERT
+
+    flush(models)는 검증된 모델을 저장하고 카운터 dict를 반환합니다.
+    row_errors에 해당하는 예외는 행 데이터 문제로 보고 청크를 반씩 나눠 다시 시도하며,
+    그 밖의 예외는 가져오기를 중단합니다 (ImportAborted).
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        flush: FlushFunc,
+        key: str,
+        row_errors: Tuple[Type[Exception], ...] = (),
+        chunk_size: Optional[int] = None,
+        max_errors: Optional[int] = None,
+        max_line_bytes: Optional[int] = None,
+    ):
+        self.model = model
+        self.flush = flush
+        self.key = key
+        self.row_errors = row_errors
+        self.chunk_size = chunk_size or settings.BULK_IMPORT_CHUNK_SIZE
+        self.max_errors = max_errors if max_errors is not None else settings.BULK_IMPORT_MAX_ERRORS
+        self.max_line_bytes = max_line_bytes or settings.BULK_IMPORT_MAX_LINE_BYTES
+        if self.chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+
+    async def run(self, stream: AsyncIterator[bytes], fmt: ImportFormat) -> Dict[str, Any]:
+        """
+        스트림 전체를 가져오고 보고서 반환
+
+        Returns:
+            {"rows", "saved", "failed", "duplicates", 저장 함수 카운터…, "errors": [{"line", "error"}],
+             "errors_truncated"}
+        """
+        report: Dict[str, Any] = {"rows": 0, "saved": 0, "failed": 0, "duplicates": 0,
+                                  "errors": [], "errors_truncated": False}
+        parse = iter_csv if fmt == "csv" else iter_ndjson
+        batch: List[Tuple[int, Any]] = []
+
+        try:
+            async for line_no, record in parse(iter_lines(stream, self.max_line_bytes), self.model):
+                batch.append((line_no, record))
+                if len(batch) >= self.chunk_size:
+                    await self._process(batch, report)
+                    batch = []
+            if batch:
+                await self._process(batch, report)
+        except Exception as e:
+            raise ImportAborted(str(e), report) from e
+        return report
+
+    async def _process(self, batch: List[Tuple[int, Any]], report: Dict[str, Any]) -> None:
+        """읽은 레코드 묶음 검증 → key 중복 정리 → 청크 저장"""
+        # 이메일 형식 등 행 검증은 CPU를 쓰므로 스레드에서
+        validated = await asyncio.to_thread(self._validate, batch)
+
+        chunk: Dict[Any, Tuple[int, BaseModel]] = {}
+        for line_no, item in validated:
+            report["rows"] += 1
+            if isinstance(item, str):
+                self._add_error(report, line_no, item)
+                continue
+            key = getattr(item, self.key)
+            if chunk.pop(key, None) is not None:
+                report["duplicates"] += 1
+            chunk[key] = (line_no, item)
+        if chunk:
+            await self._flush_chunk(list(chunk.values()), report)
+
+    def _validate(self, batch: List[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+        """(줄 번호, dict 또는 오류 메시지) → (줄 번호, 모델 또는 오류 메시지)"""
+        validated = []
+        for line_no, record in batch:
+            if not isinstance(record, str):
+                try:
+                    record = self.model.model_validate(record)
+                except ValidationError as e:
+                    record = _validation_message(e)
+            validated.append((line_no, record))
+        return validated
+
+    async def _flush_chunk(self, rows: List[Tuple[int, BaseModel]], report: Dict[str, Any]) -> None:
+        try:
+            counters = await self.flush([item for _, item in rows])
+        except self.row_errors as e:
+            if len(rows) == 1:
+                self._add_error(report, rows[0][0], _error_message(e))
+                return
+        else:
+            self._count(report, counters, len(rows))
+            return
+
+        # 청크 안의 어느 행이 문제인지 반씩 나눠 저장해 확인 (성공한 절반은 그대로 저장됨)
+        middle = len(rows) // 2
+        await self._flush_chunk(rows[:middle], report)
+        await self._flush_chunk(rows[middle:], report)
+
+    @staticmethod
+    def _count(report: Dict[str, Any], counters: Dict[str, int], saved: int) -> None:
+        report["saved"] += saved
+        for name, value in counters.items():
+            report[name] = report.get(name, 0) + value
+
+    def _add_error(self, report: Dict[str, Any], line_no: int, message: str) -> None:
+        report["failed"] += 1
+        if len(report["errors"]) < self.max_errors:
+            report["errors"].append({"line": line_no, "error": message})
+        else:
+            report["errors_truncated"] = True
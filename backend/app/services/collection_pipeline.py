@@ -0,0 +1,473 @@
+"""
+스트리밍 수집 파이프라인
+검색 → 상세 조회(50개 단위) → 파싱 → 저장을 제너레이터 단계로 나누고,
+단계 사이를 크기가 제한된 큐로 연결해 뒤 단계가 밀리면 앞 단계(검색)도 멈추게 합니다.
+진행 상황은 체크포인트 파일에 남겨, 중간에 중단돼도 다시 실행하면 할당량을 다시 쓰지 않고 이어서 처리합니다.
+"""
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Container, Dict, Iterable, Iterator, List, Optional, Set
+
+from app.services.collection_planner import CollectionPlanner
+
+KST = timezone(timedelta(hours=9))
+
+_END = object()
+
+
+class PipelineAborted(Exception):
+    """다른 단계의 오류로 파이프라인이 중단됨"""
+
+
+class BoundedQueue:
+    """
+    단계 사이 큐 (가득 차면 넣는 쪽이 대기 = back-pressure)
+
+    넣을 때마다 점유 개수를 기록해 최대/평균 점유율과 앞 단계가 대기한 시간을 보고합니다.
+    """
+
+    def __init__(self, name: str, maxsize: int, stop: threading.Event):
+        self.name = name
+        self.maxsize = maxsize
+        self._queue: Queue = Queue(maxsize=maxsize)
+        self._stop = stop
+
+        self.puts = 0
+        self.gets = 0
+        self.max_occupancy = 0
+        self._occupancy_sum = 0
+        self.blocked_seconds = 0.0
+
+    def put(self, item: Any) -> None:
+        started = None
+        while True:
+            try:
+                self._queue.put(item, timeout=0.1)
+                break
+            except Full:
+                if started is None:
+                    started = time.perf_counter()
+                if self._stop.is_set():
+                    raise PipelineAborted()
+
+        if started is not None:
+            self.blocked_seconds += time.perf_counter() - started
+        if item is not _END:
+            occupancy = self._queue.qsize()
+            self.puts += 1
+            self._occupancy_sum += occupancy
+            self.max_occupancy = max(self.max_occupancy, occupancy)
+
+    def close(self) -> None:
+        try:
+            self.put(_END)
+        except PipelineAborted:
+            pass
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            try:
+                item = self._queue.get(timeout=0.1)
+            except Empty:
+                if self._stop.is_set():
+                    raise PipelineAborted()
+                continue
+            if item is _END:
+                return
+            self.gets += 1
+            yield item
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue": self.name,
+            "capacity": self.maxsize,
+            "max_occupancy": self.max_occupancy,
+            "avg_occupancy": round(self._occupancy_sum / self.puts, 1) if self.puts else 0.0,
+            "producer_blocked_seconds": round(self.blocked_seconds, 2),
+        }
+
+
+class _Stage(threading.Thread):
+    """제너레이터 함수 하나를 실행하는 단계 (입력 큐 → fn → 출력 큐)"""
+
+    def __init__(self, name: str, fn: Callable[..., Iterable[Any]], stop: threading.Event,
+                 inbox: Optional[BoundedQueue] = None, outbox: Optional[BoundedQueue] = None):
+        super().__init__(name=f"pipeline-{name}", daemon=True)
+        self.stage_name = name
+        self.fn = fn
+        self.stop = stop
+        self.inbox = inbox
+        self.outbox = outbox
+
+        self.items_out = 0
+        self.elapsed = 0.0
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        try:
+            source = self.fn(self.inbox) if self.inbox is not None else self.fn()
+            for item in source:
+                self.items_out += 1
+                if self.outbox is not None:
+                    self.outbox.put(item)
+        except PipelineAborted:
+            pass
+        except BaseException as e:
+            self.error = e
+            self.stop.set()
+            print(f"❌ 파이프라인 단계 오류 ({self.stage_name}): {e}")
+        finally:
+            if self.outbox is not None:
+                self.outbox.close()
+            self.elapsed = time.perf_counter() - started
+
+    def stats(self) -> Dict[str, Any]:
+        items_in = self.inbox.gets if self.inbox is not None else None
+        return {
+            "stage": self.stage_name,
+            "items_in": items_in,
+            "items_out": self.items_out,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "throughput_per_second": round(self.items_out / self.elapsed, 1) if self.elapsed else 0.0,
+            "error": str(self.error) if self.error else None,
+        }
+
+
+class CollectionCheckpoint:
+    """
+    수집 체크포인트 (JSON 파일)
+
+    - queries: 검색어별 진행 상태 (다음 pageToken, 사용 할당량 등)
+    - discovered: 이번 실행에서 찾은 영상 ID
+    - done: 저장까지 끝났거나 더 처리할 필요가 없는 영상 ID
+
+    run_key(KST 날짜)가 같고 완료되지 않은 체크포인트가 있으면 이어서 실행합니다.
+    """
+
+    def __init__(self, path: str, run_key: str):
+        self.path = path
+        self.run_key = run_key
+        self._lock = threading.Lock()
+        self.resumed = False
+
+        self.published_after: Optional[str] = None
+        self.queries: Dict[str, Dict[str, Any]] = {}
+        self.discovered: Dict[str, None] = {}  # 순서 유지용
+        self.done: Set[str] = set()
+        self.completed = False
+
+    def load(self) -> bool:
+        """같은 run_key의 미완료 체크포인트가 있으면 복원"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  체크포인트를 읽을 수 없어 새로 시작합니다: {e}")
+            return False
+
+        if data.get("run_key") != self.run_key or data.get("completed"):
+            return False
+
+        self.published_after = data.get("published_after")
+        self.queries = data.get("queries", {})
+        self.discovered = dict.fromkeys(data.get("discovered", []))
+        self.done = set(data.get("done", []))
+        self.resumed = True
+        return True
+
+    @property
+    def pending(self) -> List[str]:
+        """찾았지만 아직 저장되지 않은 영상 ID"""
+        with self._lock:
+            return [video_id for video_id in self.discovered if video_id not in self.done]
+
+    def record_page(self, query_key: str, query_state: Dict[str, Any], new_ids: List[str]) -> None:
+        with self._lock:
+            self.queries[query_key] = query_state
+            self.discovered.update(dict.fromkeys(new_ids))
+            self._save()
+
+    def mark_done(self, video_ids: Iterable[str]) -> None:
+        with self._lock:
+            self.done.update(video_ids)
+            self._save()
+
+    def complete(self) -> None:
+        with self._lock:
+            self.completed = True
+            self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "run_key": self.run_key,
+                "published_after": self.published_after,
+                "queries": self.queries,
+                "discovered": list(self.discovered),
+                "done": sorted(self.done),
+                "completed": self.completed,
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+class _KnownIds:
+    """저장된 영상 ID(집합 또는 Bloom 필터 인덱스) + 이번 실행에서 이미 찾은 ID"""
+
+    def __init__(self, known_ids: Optional[Container[str]], discovered: Set[str]):
+        self.known_ids = known_ids if known_ids is not None else ()
+        self.discovered = discovered
+
+    def __contains__(self, video_id: str) -> bool:
+        return video_id in self.discovered or video_id in self.known_ids
+
+
+class CollectionPipeline:
+    """
+    검색 → 상세 조회 → 파싱 → 저장 스트리밍 파이프라인
+
+    각 단계는 별도 스레드의 제너레이터이며 단계 사이 큐 크기는 queue_size로 제한됩니다.
+    저장 단계가 느려지면 큐가 차면서 상세 조회와 검색이 차례로 멈추므로
+    메모리 사용량과 '저장되지 못한 채 할당량만 쓴' 영상 수가 큐 크기로 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        collector,
+        planner: CollectionPlanner,
+        checkpoint_path: str,
+        queue_size: int = 500,
+        persist_chunk_size: int = 500,
+        days: int = 7
+    ):
+        self.collector = collector
+        self.planner = planner
+        self.checkpoint_path = checkpoint_path
+        self.queue_size = queue_size
+        self.persist_chunk_size = persist_chunk_size
+        self.days = days
+
+        self.counters: Dict[str, int] = {}
+        self.plan_result: Optional[Dict[str, Any]] = None
+
+    # ===== 단계 =====
+    def _discover(self, checkpoint: CollectionCheckpoint, published_after: datetime,
+                  known_ids: Container[str], stop: threading.Event) -> Callable[[], Iterator[str]]:
+        def stage() -> Iterator[str]:
+            # 지난 실행에서 찾았지만 저장하지 못한 영상부터 (검색 할당량 재사용 없음)
+            for video_id in checkpoint.pending:
+                self.counters["resumed_ids"] += 1
+                yield video_id
+
+            # 검색 작업자 스레드 → 이 제너레이터로 페이지 전달 (작은 큐라 뒤 단계가 밀리면 검색도 대기)
+            pages: Queue = Queue(maxsize=2)
+            errors: List[BaseException] = []
+
+            def on_page(state, new_ids: List[str]) -> None:
+                checkpoint.record_page(state.key, state.to_checkpoint(), new_ids)
+                while not stop.is_set():
+                    try:
+                        pages.put(new_ids, timeout=0.1)
+                        return
+                    except Full:
+                        continue
+                # 다른 단계가 실패하면 검색도 멈춤 (찾은 ID는 체크포인트에 남아 있음)
+                self.planner.cancel()
+
+            def run_planner() -> None:
+                try:
+                    self.plan_result = self.planner.run(
+                        published_after=published_after,
+                        known_ids=known_ids,
+                        on_page=on_page,
+                        resume=checkpoint.queries,
+                    )
+                except BaseException as e:
+                    errors.append(e)
+                finally:
+                    # 소비자가 중단(stop)으로 빠져나갔으면 큐가 비지 않으므로 기다리지 않고 끝냄
+                    while not stop.is_set():
+                        try:
+                            pages.put(_END, timeout=0.1)
+                            break
+                        except Full:
+                            continue
+
+            planner_thread = threading.Thread(target=run_planner, name="pipeline-planner", daemon=True)
+            planner_thread.start()
+
+            while True:
+                try:
+                    page = pages.get(timeout=0.1)
+                except Empty:
+                    if stop.is_set():
+                        raise PipelineAborted()
+                    continue
+                if page is _END:
+                    break
+                yield from page
+
+            if errors:
+                raise errors[0]
+
+        return stage
+
+    def _fetch(self, checkpoint: CollectionCheckpoint) -> Callable[[Iterable[str]], Iterator[Dict]]:
+        def stage(video_ids: Iterable[str]) -> Iterator[Dict]:
+            batch: List[str] = []
+
+            def flush() -> Iterator[Dict]:
+                items = self.collector.fetch_video_items(batch)
+                if items is None:
+                    # 실패한 묶음은 체크포인트에 남겨 다음 실행에서 다시 시도
+                    self.counters["failed_batches"] += 1
+                    return
+                returned = {item["id"] for item in items}
+                missing = [video_id for video_id in batch if video_id not in returned]
+                if missing:
+                    # 삭제/비공개 영상은 다시 조회할 필요 없음
+                    self.counters["missing_videos"] += len(missing)
+                    checkpoint.mark_done(missing)
+                yield from items
+
+            for video_id in video_ids:
+                batch.append(video_id)
+                if len(batch) >= 50:
+                    yield from flush()
+                    batch = []
+            if batch:
+                yield from flush()
+
+        return stage
+
+    def _parse(self, checkpoint: CollectionCheckpoint) -> Callable[[Iterable[Dict]], Iterator[Dict]]:
+        def stage(items: Iterable[Dict]) -> Iterator[Dict]:
+            for item in items:
+                try:
+                    yield self.collector._parse_video_item(item)
+                except (KeyError, ValueError) as e:
+                    print(f"⚠️  영상 정보 파싱 실패 ({item.get('id')}): {e}")
+                    self.counters["parse_errors"] += 1
+                    checkpoint.mark_done([item.get("id")])
+
+        return stage
+
+    def _persist(self, checkpoint: CollectionCheckpoint) -> Callable[[Iterable[Dict]], Iterator[Dict]]:
+        def stage(videos: Iterable[Dict]) -> Iterator[Dict]:
+            chunk: List[Dict] = []
+
+            def flush() -> Dict:
+                result = self.collector.save_to_database(chunk)
+                self.counters["inserted"] += result["inserted"]
+                self.counters["updated"] += result["updated"]
+                if result.get("failed"):
+                    self.counters["save_failed"] += result["failed"]
+                else:
+                    checkpoint.mark_done(video["video_id"] for video in chunk)
+                return result
+
+            for video in videos:
+                chunk.append(video)
+                if len(chunk) >= self.persist_chunk_size:
+                    yield flush()
+                    chunk = []
+            if chunk:
+                yield flush()
+
+        return stage
+
+    # ===== 실행 =====
+    def run(self, known_ids: Optional[Container[str]] = None) -> Dict[str, Any]:
+        """
+        파이프라인 1회 실행
+
+        Args:
+            known_ids: 이미 저장된 영상 ID (검색 단계에서 새 영상 판단용, `in` 연산만 필요)
+
+        Returns:
+            counters, stages(단계별 처리량), queues(큐 점유율), plan(검색어별 리포트)
+        """
+        run_key = datetime.now(KST).strftime("%Y-%m-%d")
+        checkpoint = CollectionCheckpoint(self.checkpoint_path, run_key)
+        if checkpoint.load():
+            print(f"♻️  체크포인트에서 이어서 실행: 미저장 영상 {len(checkpoint.pending)}개, "
+                  f"검색어 {len(checkpoint.queries)}개 진행 기록")
+            published_after = datetime.fromisoformat(checkpoint.published_after)
+        else:
+            published_after = datetime.now(timezone.utc) - timedelta(days=self.days)
+            checkpoint.published_after = published_after.isoformat()
+
+        self.counters = {
+            key: 0 for key in (
+                "resumed_ids", "failed_batches", "missing_videos", "parse_errors",
+                "inserted", "updated", "save_failed",
+            )
+        }
+        self.plan_result = None
+
+        known = _KnownIds(known_ids, set(checkpoint.discovered))
+        stop = threading.Event()
+        ids_queue = BoundedQueue("ids", self.queue_size, stop)
+        items_queue = BoundedQueue("items", self.queue_size, stop)
+        videos_queue = BoundedQueue("videos", self.queue_size, stop)
+
+        stages = [
+            _Stage("discover", self._discover(checkpoint, published_after, known, stop), stop, outbox=ids_queue),
+            _Stage("fetch", self._fetch(checkpoint), stop, inbox=ids_queue, outbox=items_queue),
+            _Stage("parse", self._parse(checkpoint), stop, inbox=items_queue, outbox=videos_queue),
+            _Stage("persist", self._persist(checkpoint), stop, inbox=videos_queue),
+        ]
+        started = time.perf_counter()
+        for stage in stages:
+            stage.start()
+        for stage in stages:
+            stage.join()
+
+        failed = stop.is_set() or self.counters["failed_batches"] or self.counters["save_failed"]
+        if not failed:
+            checkpoint.complete()
+
+        if self.plan_result is not None:
+            # 체크포인트에서 이어받은 몫은 지난 실행에서 이미 셌으므로 이번 실행 사용량만 더함
+            self.collector.quota_used += self.plan_result["units_spent"]
+
+        result = {
+            "completed": not failed,
+            "resumed": checkpoint.resumed,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "counters": dict(self.counters),
+            "stages": [stage.stats() for stage in stages],
+            "queues": [queue.stats() for queue in (ids_queue, items_queue, videos_queue)],
+            "plan": self.plan_result["queries"] if self.plan_result else [],
+        }
+        self.print_report(result)
+        return result
+
+    @staticmethod
+    def print_report(result: Dict[str, Any]) -> None:
+        counters = result["counters"]
+        status = "완료" if result["completed"] else "중단 (다음 실행에서 이어서 처리)"
+        print(
+            f"🚚 수집 파이프라인 {status}: 신규 {counters['inserted']}개, 갱신 {counters['updated']}개 "
+            f"({result['elapsed_seconds']}초)"
+        )
+        for stage in result["stages"]:
+            print(
+                f"   - [{stage['stage']}] 입력 {stage['items_in'] if stage['items_in'] is not None else '-'}, "
+                f"출력 {stage['items_out']}, {stage['throughput_per_second']}/초"
+            )
+        for queue in result["queues"]:
+            print(
+                f"   - 큐 {queue['queue']}: 최대 {queue['max_occupancy']}/{queue['capacity']}, "
+                f"평균 {queue['avg_occupancy']}, 앞 단계 대기 {queue['producer_blocked_seconds']}초"
+            )
+
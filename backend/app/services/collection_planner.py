@@ -0,0 +1,381 @@
+"""
+YouTube 수집 계획기
+여러 검색어/지역을 가중치에 따라 할당량 예산 안에서 페이지 단위로 검색하고,
+새 영상이 더 나오지 않는 검색어는 일찍 멈춰 남은 예산을 다른 검색어에 넘깁니다.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from queue import Empty, Queue
+from threading import Event, Lock
+from typing import Any, Callable, Container, Dict, List, NamedTuple, Optional, Sequence
+
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+from app.core.config import settings
+
+# search.list 1회(1페이지, 최대 50개) 비용
+SEARCH_COST = 100
+
+# 더 검색해도 소용없는 중단 사유 (재개 시 건너뜀)
+FINAL_STOP_REASONS = ("low_yield", "no_more_pages")
+
+
+class QuerySpec(NamedTuple):
+    """검색어 하나의 수집 설정"""
+    query: str
+    region: str = "KR"
+    weight: float = 1.0
+    language: str = "ko"
+    order: str = "viewCount"
+
+
+# 기본 검색어 (가중치가 클수록 예산을 더 많이 배정)
+DEFAULT_QUERIES: List[QuerySpec] = [
+    QuerySpec("뷰티 메이크업", weight=3.0),
+    QuerySpec("올리브영 추천", weight=3.0),
+    QuerySpec("화장품 리뷰", weight=2.0),
+    QuerySpec("스킨케어 루틴", weight=2.0),
+    QuerySpec("겟레디윗미 GRWM", weight=1.0),
+    QuerySpec("다이소 뷰티", weight=1.0),
+    QuerySpec("쿠션 파운데이션 비교", weight=1.0),
+    QuerySpec("립 틴트 추천", weight=1.0),
+]
+
+
+def _default_client_factory(api_key: str):
+    # googleapiclient 객체는 스레드 간에 공유하면 안 되므로 키(작업자)마다 따로 생성
+    return build('youtube', 'v3', developerKey=api_key, cache_discovery=False)
+
+
+def _is_quota_error(error: HttpError) -> bool:
+    return error.resp.status == 403 and b"quota" in (error.content or b"").lower()
+
+
+class _QueryState:
+    """검색어별 진행 상태 (작업자 사이를 오가며 이어서 페이지를 넘김)"""
+
+    def __init__(self, spec: QuerySpec, allocated_units: int):
+        self.spec = spec
+        self.allocated_units = allocated_units
+        self.units_used = 0
+        self.pages = 0
+        self.results = 0
+        self.new_videos = 0
+        self.low_yield_streak = 0
+        self.page_token: Optional[str] = None
+        self.stop_reason: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        spec = self.spec
+        return f"{spec.query}|{spec.region}|{spec.language}|{spec.order}"
+
+    @property
+    def remaining_units(self) -> int:
+        return self.allocated_units - self.units_used
+
+    def to_checkpoint(self) -> Dict[str, Any]:
+        return {
+            "units_used": self.units_used,
+            "pages": self.pages,
+            "results": self.results,
+            "new_videos": self.new_videos,
+            "low_yield_streak": self.low_yield_streak,
+            "page_token": self.page_token,
+            "stop_reason": self.stop_reason,
+        }
+
+    def restore(self, data: Dict[str, Any]) -> None:
+        for name, value in data.items():
+            if hasattr(self, name) and name != "key":
+                setattr(self, name, value)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "query": self.spec.query,
+            "region": self.spec.region,
+            "weight": self.spec.weight,
+            "pages": self.pages,
+            "units_used": self.units_used,
+            "results": self.results,
+            "new_videos": self.new_videos,
+            "yield_per_100_units": round(self.new_videos * 100 / self.units_used, 1) if self.units_used else 0.0,
+            "stop_reason": self.stop_reason,
+        }
+
+
+class CollectionPlanner:
+    """
+    다중 검색어 수집 계획기
+
+    - 예산(할당량 포인트)을 검색어 가중치 비율로 나눠 페이지 수로 배정
+    - pageToken으로 페이지를 넘기며, 새 영상 비율이 min_new_ratio 미만인 페이지가
+      patience번 연속 나오면 해당 검색어 중단
+    - 1차 배정이 끝난 뒤 남은 예산은 예산 소진으로 멈춘(아직 수확 중인) 검색어에 다시 배정
+    - API 키마다 작업자 스레드 하나가 공유 큐에서 검색어를 꺼내 처리
+      (할당량이 소진된 키의 작업자는 검색어를 큐에 돌려놓고 종료)
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        queries: Optional[Sequence[QuerySpec]] = None,
+        budget_units: int = 8000,
+        min_new_ratio: float = 0.1,
+        patience: int = 2,
+        page_size: int = 50,
+        client_factory: Callable[[str], Any] = _default_client_factory
+    ):
+        if not api_keys:
+            raise ValueError("사용 가능한 YouTube API 키가 없습니다.")
+
+        self.api_keys = list(dict.fromkeys(api_keys))
+        self.queries = list(queries or DEFAULT_QUERIES)
+        self.budget_units = budget_units
+        self.min_new_ratio = min_new_ratio
+        self.patience = patience
+        self.page_size = page_size
+        self.client_factory = client_factory
+
+        self._lock = Lock()
+        self._seen: set = set()
+        self._exhausted_keys: set = set()
+        self._on_page: Optional[Callable[[_QueryState, List[str]], None]] = None
+        self._cancelled = Event()
+
+    def cancel(self) -> None:
+        """진행 중인 run()을 다음 페이지 전에 멈춤"""
+        self._cancelled.set()
+
+    # ===== 예산 배정 =====
+    def _allocate(self, states: List[_QueryState], budget: int) -> int:
+        """가중치 비율로 페이지 단위 예산 배정 (남는 페이지는 가중치 큰 순으로), 배정한 포인트 반환"""
+        pages = budget // SEARCH_COST
+        total_weight = sum(state.spec.weight for state in states)
+        if pages <= 0 or total_weight <= 0:
+            return 0
+
+        shares = [(pages * state.spec.weight / total_weight, state) for state in states]
+        given = 0
+        for share, state in shares:
+            state.allocated_units += int(share) * SEARCH_COST
+            given += int(share)
+
+        by_remainder = sorted(shares, key=lambda item: item[0] - int(item[0]), reverse=True)
+        for _, state in by_remainder[:pages - given]:
+            state.allocated_units += SEARCH_COST
+
+        return pages * SEARCH_COST
+
+    # ===== 실행 =====
+    def run(
+        self,
+        published_after: Optional[datetime] = None,
+        known_ids: Optional[Container[str]] = None,
+        on_page: Optional[Callable[[_QueryState, List[str]], None]] = None,
+        resume: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        계획 실행
+
+        Args:
+            published_after: 이 시각 이후 업로드된 영상만 검색 (기본값: 최근 7일)
+            known_ids: 이미 저장된 영상 ID (새 영상 판단에 사용, `in` 연산만 필요)
+            on_page: 페이지마다 (검색어 상태, 새 영상 ID)로 호출 (작업자 스레드에서 호출되며,
+                     여기서 대기하면 검색도 멈추므로 다음 단계의 처리 속도에 맞춰짐)
+            resume: 이전 실행의 검색어별 상태 (_QueryState.to_checkpoint() 결과, key 기준)
+
+        Returns:
+            {"video_ids": 새로 찾은 영상 ID 목록, "units_used"(이어받은 몫 포함), "units_spent"(이번 실행),
+             "budget_units", "queries": 검색어별 리포트}
+        """
+        if published_after is None:
+            published_after = datetime.now(timezone.utc) - timedelta(days=7)
+        elif published_after.tzinfo is None:
+            published_after = published_after.replace(tzinfo=timezone.utc)
+        published_after_str = published_after.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        self._seen = set()
+        self._exhausted_keys = set()
+        known_ids = known_ids if known_ids is not None else ()
+        found: List[str] = []
+
+        self._on_page = on_page
+        self._cancelled.clear()
+
+        states = [_QueryState(spec, 0) for spec in self.queries]
+        for state in states:
+            if resume and state.key in resume:
+                state.restore(resume[state.key])
+        restored_units = sum(state.units_used for state in states)
+        remaining_budget = self.budget_units - restored_units
+        started = time.perf_counter()
+
+        # 1차: 가중치 배정 / 2차 이후: 예산 소진으로 멈춘 검색어에 남은 예산 재배정
+        active = [state for state in states if state.stop_reason not in FINAL_STOP_REASONS]
+        while active and remaining_budget >= SEARCH_COST:
+            for state in active:
+                state.stop_reason = None
+                state.allocated_units = state.units_used
+
+            spent_before = sum(state.units_used for state in states)
+            allocated = self._allocate(active, remaining_budget)
+            if not allocated:
+                break
+
+            self._run_round(active, published_after_str, known_ids, found)
+
+            spent = sum(state.units_used for state in states) - spent_before
+            remaining_budget -= spent
+            if len(self._exhausted_keys) == len(self.api_keys) or spent == 0 or self._cancelled.is_set():
+                break
+
+            active = [state for state in states if state.stop_reason == "budget"]
+
+        units_used = sum(state.units_used for state in states)
+        result = {
+            "video_ids": found,
+            "units_used": units_used,
+            "units_spent": units_used - restored_units,
+            "budget_units": self.budget_units,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+            "queries": sorted(
+                (state.report() for state in states),
+                key=lambda row: row["yield_per_100_units"],
+                reverse=True,
+            ),
+        }
+        self.print_report(result)
+        return result
+
+    def _run_round(self, states: List[_QueryState], published_after: str,
+                   known_ids: Container[str], found: List[str]) -> None:
+        pending: "Queue[_QueryState]" = Queue()
+        for state in states:
+            if state.remaining_units >= SEARCH_COST:
+                pending.put(state)
+            else:
+                state.stop_reason = "budget"
+
+        keys = [key for key in self.api_keys if key not in self._exhausted_keys]
+        with ThreadPoolExecutor(max_workers=len(keys), thread_name_prefix="collection-planner") as pool:
+            for key in keys:
+                pool.submit(self._worker, key, pending, published_after, known_ids, found)
+
+        # 모든 키의 할당량이 소진돼 처리하지 못한 검색어
+        while True:
+            try:
+                pending.get_nowait().stop_reason = "quota_exceeded"
+            except Empty:
+                break
+
+    def _worker(self, api_key: str, pending: "Queue[_QueryState]", published_after: str,
+                known_ids: Container[str], found: List[str]) -> None:
+        try:
+            client = self.client_factory(api_key)
+        except Exception as e:
+            print(f"❌ YouTube 클라이언트 생성 실패: {e}")
+            return
+
+        while True:
+            try:
+                state = pending.get_nowait()
+            except Empty:
+                return
+
+            try:
+                self._run_query(client, state, published_after, known_ids, found)
+            except HttpError as e:
+                if _is_quota_error(e):
+                    # 이 키는 더 쓸 수 없으므로 검색어를 다른 작업자에게 넘김
+                    with self._lock:
+                        self._exhausted_keys.add(api_key)
+                    pending.put(state)
+                    print("⚠️  API 키 할당량 소진, 남은 검색어는 다른 키로 처리합니다.")
+                    return
+                state.stop_reason = "error"
+                print(f"❌ 검색 오류 ({state.spec.query}): {e}")
+
+    def _run_query(self, client, state: _QueryState, published_after: str,
+                   known_ids: Container[str], found: List[str]) -> None:
+        spec = state.spec
+
+        while state.remaining_units >= SEARCH_COST:
+            if self._cancelled.is_set():
+                state.stop_reason = "cancelled"
+                return
+
+            params = {
+                "part": "id",
+                "q": spec.query,
+                "type": "video",
+                "regionCode": spec.region,
+                "relevanceLanguage": spec.language,
+                "maxResults": self.page_size,
+                "publishedAfter": published_after,
+                "order": spec.order,
+            }
+            if state.page_token:
+                params["pageToken"] = state.page_token
+
+            response = client.search().list(**params).execute()
+            state.units_used += SEARCH_COST
+            state.pages += 1
+
+            ids = [
+                item["id"]["videoId"] for item in response.get("items", [])
+                if item.get("id", {}).get("videoId")
+            ]
+            with self._lock:
+                new_ids = [
+                    video_id for video_id in ids
+                    if video_id not in self._seen and video_id not in known_ids
+                ]
+                self._seen.update(ids)
+                found.extend(new_ids)
+
+            state.results += len(ids)
+            state.new_videos += len(new_ids)
+            state.page_token = response.get("nextPageToken")
+
+            if len(new_ids) < self.min_new_ratio * max(len(ids), 1):
+                state.low_yield_streak += 1
+            else:
+                state.low_yield_streak = 0
+
+            if not state.page_token:
+                state.stop_reason = "no_more_pages"
+            elif state.low_yield_streak >= self.patience:
+                state.stop_reason = "low_yield"
+
+            if self._on_page is not None:
+                self._on_page(state, new_ids)
+            if state.stop_reason:
+                return
+
+        state.stop_reason = "budget"
+
+    @staticmethod
+    def print_report(result: Dict[str, Any]) -> None:
+        print(
+            f"📋 수집 계획 결과: 새 영상 {len(result['video_ids'])}개, "
+            f"할당량 {result['units_used']}/{result['budget_units']} ({result['elapsed_seconds']}초)"
+        )
+        for row in result["queries"]:
+            print(
+                f"   - {row['query']} [{row['region']}] 페이지 {row['pages']}, "
+                f"새 영상 {row['new_videos']}개, 100포인트당 {row['yield_per_100_units']}개 "
+                f"({row['stop_reason']})"
+            )
+
+
+def get_collection_api_keys() -> List[str]:
+    """수집에 사용할 API 키 목록 (로테이션 키가 없으면 기본 키)"""
+    from app.utils.youtube_api import YouTubeAPIKeyManager
+
+    try:
+        return YouTubeAPIKeyManager().get_all_keys()
+    except ValueError:
+        return [settings.YOUTUBE_API_KEY] if settings.YOUTUBE_API_KEY else []
@@ -0,0 +1,388 @@
+"""
+크리에이터 탐색 인덱스 (브랜드 매칭)
+협찬 가능한(is_active, sponsorship_available) 프로필만 메모리에 NumPy 배열로 올려 두고
+구독자 수 / 평균 조회수 / 협찬 단가 범위, 선호 카테고리, 이름·소개 검색을 DB 왕복 없이 처리합니다.
+
+- 첫 탐색 때 전체 적재, 이후 refresh_seconds마다 updated_at이 바뀐 행만 가져와 반영 (증분)
+- 같은 프로세스의 프로필 생성/수정은 저장 직후 upsert()로 바로 반영
+- 삭제된 행은 증분으로 알 수 없으므로 full_rebuild_minutes마다 전체 재적재
+- 인덱스를 아직 만들지 못했으면 DB 조회(CreatorProfileRepository.discover)로 대신 처리
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+
+from app.core.cache import SingleFlight
+from app.core.config import settings
+from app.db.postgrest import eq, gte
+from app.db.repositories import CreatorProfileRepository, creator_profiles
+
+# 응답에 쓰는 카드 필드 (app/api/creators.py CreatorProfileSummary와 같게 유지)
+SUMMARY_FIELDS = (
+    "id", "username", "display_name", "profile_image_url", "subscriber_count", "average_views",
+    "sponsorship_rate", "sponsorship_available", "preferred_categories", "created_at", "is_verified",
+)
+# 적재 컬럼 (검색용 bio, 제외 판단용 is_active, 증분 기준 updated_at 추가)
+INDEX_COLUMNS = ",".join(SUMMARY_FIELDS + ("bio", "is_active", "updated_at"))
+
+# 증분 하한을 조회 시작 시각보다 이만큼 앞당김 (앱 서버와 DB 시계 차이 여유)
+_CLOCK_MARGIN_SECONDS = 60
+
+# 전체 재적재 시 통째로 교체하는 저장 구조 속성
+_STORAGE = ("_slots", "_free", "_size", "_alive", "_subscribers", "_views", "_rate", "_created",
+            "_id_rank", "_id_rank_stale", "_rows", "_text", "_category_slots")
+
+# 정렬 키 → (배열 이름, 내림차순 여부)
+SORT_KEYS = {
+    "subscribers": ("_subscribers", True),
+    "views": ("_views", True),
+    "rate": ("_rate", False),
+    "recent": ("_created", True),
+}
+
+
+class DiscoveryQuery(NamedTuple):
+    min_subscribers: Optional[int] = None
+    max_subscribers: Optional[int] = None
+    min_views: Optional[int] = None
+    max_views: Optional[int] = None
+    min_rate: Optional[int] = None
+    max_rate: Optional[int] = None
+    categories: Tuple[str, ...] = ()  # 하나라도 겹치면 포함
+    text: Optional[str] = None  # display_name / bio 부분 일치 (대소문자 무시)
+    sort: str = "subscribers"
+    limit: int = 20
+    offset: int = 0
+
+
+def _timestamp(value: Optional[str]) -> float:
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def _is_listed(row: Dict[str, Any]) -> bool:
+    return bool(row.get("is_active", True)) and bool(row.get("sponsorship_available", True))
+
+
+class CreatorDiscoveryIndex:
+    """
+    협찬 가능 프로필 필터 인덱스
+
+    - 슬롯(행 번호)별 NumPy 배열: 구독자 수, 평균 조회수, 협찬 단가, 생성 시각, 사용 여부
+    - 카테고리 → 슬롯 집합 (역색인)
+    - 검색용 소문자 텍스트(display_name + bio)와 응답용 카드 행은 슬롯별 리스트
+    범위 조건은 배열 비교로 한 번에 거르고, 텍스트 검색은 남은 후보에만 적용합니다.
+    """
+
+    def __init__(
+        self,
+        repository: CreatorProfileRepository,
+        refresh_seconds: float = 60,
+        full_rebuild_minutes: float = 360,
+        page_size: int = 1000,
+    ):
+        self.repository = repository
+        self.refresh_seconds = refresh_seconds
+        self.full_rebuild_minutes = full_rebuild_minutes
+        self.page_size = page_size
+
+        self._reset(1024)
+        self.ready = False
+        self._loaded_at = 0.0
+        self._refreshed_at = 0.0
+        self._failed_at = 0.0
+        self._watermark: Optional[str] = None  # 다음 증분 반영의 updated_at 하한
+        self._flights = SingleFlight()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._startup_task: Optional[asyncio.Task] = None
+
+        self.searches = 0
+        self.fallbacks = 0
+        self.incremental_rows = 0
+
+    # ===== 저장 구조 =====
+    def _reset(self, capacity: int) -> None:
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0  # 한 번이라도 쓴 슬롯 수
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._subscribers = np.zeros(capacity, dtype=np.int64)
+        self._views = np.zeros(capacity, dtype=np.int64)
+        self._rate = np.zeros(capacity, dtype=np.int64)
+        self._created = np.zeros(capacity, dtype=np.float64)
+        # id 순위 (같은 정렬 값 사이의 순서, DB 조회의 ",id" 정렬과 같게) - 새 id가 들어오면 다시 계산
+        self._id_rank = np.zeros(capacity, dtype=np.int64)
+        self._id_rank_stale = True
+        self._rows: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._text: List[str] = [""] * capacity
+        self._category_slots: Dict[str, Set[int]] = {}
+
+    def _build(self, rows: List[Dict[str, Any]]) -> None:
+        self._reset(max(1024, len(rows)))
+        for row in rows:
+            self.upsert(row)
+
+    def _grow(self) -> None:
+        capacity = len(self._alive) * 2
+        for name in ("_alive", "_subscribers", "_views", "_rate", "_created", "_id_rank"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+        self._rows.extend([None] * (capacity - len(self._rows)))
+        self._text.extend([""] * (capacity - len(self._text)))
+
+    def _allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == len(self._alive):
+            self._grow()
+        self._size += 1
+        return self._size - 1
+
+    def _clear_slot(self, slot: int) -> None:
+        for category in self._rows[slot]["preferred_categories"] or ():
+            slots = self._category_slots.get(category)
+            if slots is not None:
+                slots.discard(slot)
+                if not slots:
+                    del self._category_slots[category]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, profile_id: str) -> bool:
+        return str(profile_id) in self._slots
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """프로필 행 반영 (협찬 불가/비활성 행은 제거)"""
+        if not row or not row.get("id"):
+            return
+        profile_id = str(row["id"])
+        if not _is_listed(row):
+            self.remove(profile_id)
+            return
+
+        slot = self._slots.get(profile_id)
+        if slot is None:
+            slot = self._allocate()
+            self._slots[profile_id] = slot
+            self._id_rank_stale = True
+        else:
+            self._clear_slot(slot)
+
+        card = {field: row.get(field) for field in SUMMARY_FIELDS}
+        card["id"] = profile_id
+        card["preferred_categories"] = list(card["preferred_categories"] or [])
+        self._rows[slot] = card
+        self._text[slot] = f"{row.get('display_name') or ''}\n{row.get('bio') or ''}".lower()
+        self._subscribers[slot] = row.get("subscriber_count") or 0
+        self._views[slot] = row.get("average_views") or 0
+        self._rate[slot] = row.get("sponsorship_rate") or 0
+        self._created[slot] = _timestamp(row.get("created_at"))
+        self._alive[slot] = True
+        for category in card["preferred_categories"]:
+            self._category_slots.setdefault(category, set()).add(slot)
+
+    def remove(self, profile_id: str) -> None:
+        slot = self._slots.pop(str(profile_id), None)
+        if slot is None:
+            return
+        self._clear_slot(slot)
+        self._alive[slot] = False
+        self._rows[slot] = None
+        self._text[slot] = ""
+        self._free.append(slot)
+
+    # ===== 검색 =====
+    def search(self, query: DiscoveryQuery) -> Tuple[List[Dict[str, Any]], int]:
+        """→ (정렬된 페이지 행, 조건에 맞는 전체 수)"""
+        n = self._size
+        mask = self._alive[:n].copy()
+        for values, low, high in (
+            (self._subscribers, query.min_subscribers, query.max_subscribers),
+            (self._views, query.min_views, query.max_views),
+            (self._rate, query.min_rate, query.max_rate),
+        ):
+            if low is not None:
+                mask &= values[:n] >= low
+            if high is not None:
+                mask &= values[:n] <= high
+
+        if query.categories:
+            in_category = np.zeros(n, dtype=bool)
+            for category in query.categories:
+                slots = self._category_slots.get(category)
+                if slots:
+                    in_category[np.fromiter(slots, dtype=np.int64, count=len(slots))] = True
+            mask &= in_category
+
+        candidates = np.flatnonzero(mask)
+        if query.text:
+            needle = query.text.lower()
+            text = self._text
+            candidates = np.fromiter((slot for slot in candidates if needle in text[slot]), dtype=np.int64)
+
+        total = len(candidates)
+        end = query.offset + query.limit
+        if query.offset >= total:
+            return [], total
+
+        name, descending = SORT_KEYS[query.sort]
+        keys = getattr(self, name)[candidates]
+        ties = self._tie_ranks()[candidates]
+        if descending:
+            keys, ties = -keys, -ties
+        if end < total:
+            # end번째 값 이하인 후보만 골라서 정렬 (그 값과 같은 후보는 모두 포함해야 id 순서가 맞음)
+            kth = np.partition(keys, end - 1)[end - 1]
+            top = np.flatnonzero(keys <= kth)
+            order = top[np.lexsort((ties[top], keys[top]))]
+        else:
+            order = np.lexsort((ties, keys))
+
+        rows = self._rows
+        return [rows[slot] for slot in candidates[order[query.offset:end]]], total
+
+    def _tie_ranks(self) -> np.ndarray:
+        """슬롯별 id 순위 (빈 슬롯은 검색 후보가 아니므로 값이 무엇이든 상관없음)"""
+        if self._id_rank_stale:
+            n = self._size
+            rows = self._rows
+            by_id = sorted(range(n), key=lambda slot: rows[slot]["id"] if rows[slot] else "")
+            self._id_rank[by_id] = np.arange(n)
+            self._id_rank_stale = False
+        return self._id_rank
+
+    async def discover(self, query: DiscoveryQuery) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        탐색 (인덱스 우선, 준비 전이면 DB 조회)
+
+        Returns:
+            (페이지 행, 전체 수 - DB 조회로 처리한 경우 None)
+        """
+        if await self.ensure_fresh():
+            self.searches += 1
+            return self.search(query)
+        self.fallbacks += 1
+        rows = await self.repository.discover(**query._asdict(), columns=",".join(SUMMARY_FIELDS))
+        return rows, None
+
+    # ===== 적재 =====
+    def start(self) -> None:
+        """앱 시작 시 첫 적재를 백그라운드로 시작 (태스크 참조를 들고 있어 도중에 회수되지 않음)"""
+        if self._startup_task is None or self._startup_task.done():
+            self._startup_task = asyncio.create_task(self.ensure_fresh())
+
+    async def ensure_fresh(self) -> bool:
+        """
+        필요하면 적재/갱신 → 인덱스 사용 가능 여부
+
+        첫 적재만 기다리고, 증분 반영과 주기적 전체 재적재는 백그라운드에서 실행합니다.
+        적재에 실패하면 refresh_seconds 동안은 다시 시도하지 않습니다 (그동안은 DB 조회).
+        """
+        now = time.time()
+        if not self.ready:
+            if now - self._failed_at < self.refresh_seconds:
+                return False
+            try:
+                await self._flights.run("_load_all", self._load_all)
+            except Exception as e:
+                self._failed_at = time.time()
+                print(f"❌ 크리에이터 탐색 인덱스 적재 오류: {e}")
+                return False
+            return True
+
+        if now - self._loaded_at > self.full_rebuild_minutes * 60:
+            self._run_in_background(self._load_all)
+        elif now - self._refreshed_at > self.refresh_seconds:
+            self._run_in_background(self._load_changes)
+        return True
+
+    def _run_in_background(self, job) -> None:
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def run_logged():
+            try:
+                await self._flights.run(job.__name__, job)
+            except Exception as e:
+                print(f"❌ 크리에이터 탐색 인덱스 갱신 오류: {e}")
+            finally:
+                # 실패해도 다음 주기까지는 다시 시도하지 않음
+                self._refreshed_at = time.time()
+
+        self._refresh_task = asyncio.create_task(run_logged())
+
+    def _mark_refreshed(self, started: float) -> None:
+        """
+        조회를 시작한 시각(서버 시계 오차 여유를 뺌)을 다음 증분 하한으로 기록
+
+        id 순으로 읽는 동안 이미 지나간 행이 수정될 수 있으므로, 읽은 행들의 최대 updated_at이 아니라
+        조회 시작 시각을 기준으로 잡아 다음 증분에서 다시 읽습니다 (같은 행을 두 번 반영해도 결과는 같음).
+        """
+        self._watermark = datetime.fromtimestamp(started - _CLOCK_MARGIN_SECONDS, timezone.utc).isoformat()
+        self._refreshed_at = started
+
+    async def _load_all(self) -> None:
+        """
+        협찬 가능 프로필 전체 적재 후 한 번에 교체 (적재 중에도 기존 인덱스로 검색)
+
+        적재 중 upsert()된 행은 교체로 사라지지만 updated_at이 증분 하한 이후라 다음 증분에서 다시 반영됩니다.
+        """
+        started = time.time()
+        rows: List[Dict[str, Any]] = []
+        async for page in self.repository.scan(
+            {"is_active": eq(True), "sponsorship_available": eq(True)},
+            columns=INDEX_COLUMNS, page_size=self.page_size,
+        ):
+            rows.extend(page)
+
+        # 새 저장 구조는 스레드에서 만들고 교체만 이벤트 루프에서 (수만 건 반영 중에도 요청 처리)
+        fresh = CreatorDiscoveryIndex(self.repository)
+        await asyncio.to_thread(fresh._build, rows)
+        for name in _STORAGE:
+            setattr(self, name, getattr(fresh, name))
+        self.ready = True
+        self._loaded_at = started
+        self._mark_refreshed(started)
+        print(f"✅ 크리에이터 탐색 인덱스 적재 완료: {len(self)}명 ({time.time() - started:.1f}초)")
+
+    async def _load_changes(self) -> None:
+        """마지막 반영 이후 updated_at이 바뀐 행 반영 (협찬 불가로 바뀐 행은 제거)"""
+        started = time.time()
+        filters = {"updated_at": gte(self._watermark)} if self._watermark else {}
+        async for page in self.repository.scan(filters, columns=INDEX_COLUMNS, page_size=self.page_size):
+            for row in page:
+                self.upsert(row)
+            self.incremental_rows += len(page)
+        self._mark_refreshed(started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "profiles": len(self),
+            "categories": len(self._category_slots),
+            "searches": self.searches,
+            "fallbacks": self.fallbacks,
+            "incremental_rows": self.incremental_rows,
+            "watermark": self._watermark,
+            "loaded_at": self._loaded_at or None,
+            "refreshed_at": self._refreshed_at or None,
+        }
+
+
+# 전역 인스턴스
+creator_discovery_index = CreatorDiscoveryIndex(
+    creator_profiles,
+    refresh_seconds=settings.CREATOR_DISCOVERY_REFRESH_SECONDS,
+    full_rebuild_minutes=settings.CREATOR_DISCOVERY_FULL_REBUILD_MINUTES,
+    page_size=settings.CREATOR_DISCOVERY_PAGE_SIZE,
+)
@@ -0,0 +1,349 @@
+"""
+영상 수집 결과 분배 서비스
+YouTube에서 한 번 가져온 영상 레코드를 여러 저장소(sink)로 나눠 보냅니다.
+
+- VideoDataSink: SQLAlchemy VideoData 대량 UPSERT + 통계 시계열 샘플
+- TrendEngineSink: 새로 저장된 영상만 트렌드 엔진/급상승 감지기에 반영
+- VideoReportSink: 아직 리포트가 없는 영상만 분석해 Supabase video_reports에 저장
+
+sink마다 배치 크기가 다르고, 한 sink의 실패는 그 sink의 해당 배치에만 영향을 줍니다.
+"""
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.db.bulk import bulk_upsert
+from app.models.models import VideoData, VideoStatsSnapshot
+from app.services.known_ids import known_report_index, known_video_index
+from app.services.report_cache import report_cache
+
+
+class IngestionSink:
+    """
+    저장소 기본 클래스
+
+    write(records, context)는 처리 결과 카운터 dict를 반환하고, 실패하면 예외를 던집니다.
+    context는 한 번의 실행 동안 sink들이 공유하는 dict입니다 (예: 새로 저장된 영상 ID).
+    needs_previous가 True면 이 sink의 배치를 보내기 전에 목록에서 앞선 sink들을 먼저 비웁니다.
+    """
+
+    name = "sink"
+    needs_previous = False
+
+    def __init__(self, batch_size: int = 100):
+        if batch_size <= 0:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+        self.batch_size = batch_size
+
+    def write(self, records: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, int]:
+        raise NotImplementedError
+
+    def close(self, context: Dict[str, Any]) -> None:
+        """실행이 끝난 뒤 한 번 호출 (상태 파일 저장 등)"""
+
+
+class VideoDataSink(IngestionSink):
+    """VideoData 대량 UPSERT (이미 있는 영상은 통계만 갱신) + VideoStatsSnapshot 샘플"""
+
+    name = "video_data"
+    COLUMNS = (
+        "video_id", "channel_id", "title", "description", "tags",
+        "view_count", "like_count", "comment_count", "duration", "published_at", "thumbnail_url",
+    )
+
+    def __init__(self, batch_size: Optional[int] = None, session_factory=None):
+        super().__init__(batch_size or settings.VIDEO_UPSERT_CHUNK_SIZE)
+        if session_factory is None:
+            from app.db.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    def write(self, records: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, int]:
+        rows = [{column: record.get(column) for column in self.COLUMNS} for record in records]
+        db = self.session_factory()
+        try:
+            result = bulk_upsert(
+                db,
+                VideoData,
+                rows,
+                key="video_id",
+                update_columns=["view_count", "like_count", "comment_count"],
+                chunk_size=self.batch_size,
+            )
+            # 수집 시점 통계도 시계열의 한 샘플로 기록 (속도 계산용)
+            captured_at = datetime.now(timezone.utc)
+            db.execute(insert(VideoStatsSnapshot), [
+                {
+                    'video_id': row['video_id'],
+                    'captured_at': captured_at,
+                    'view_count': row['view_count'],
+                    'like_count': row['like_count'],
+                    'comment_count': row['comment_count'],
+                }
+                for row in rows
+            ])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        context.setdefault("inserted_ids", set()).update(result.inserted_keys)
+        # 다음 검색부터 상세 조회 없이 건너뛰도록 알려진 ID 필터에 추가
+        known_video_index.add(result.inserted_keys)
+        return {"inserted": result.inserted, "updated": result.updated}
+
+    def close(self, context: Dict[str, Any]) -> None:
+        known_video_index.save()
+
+
+class TrendEngineSink(IngestionSink):
+    """
+    트렌드 엔진/급상승 감지기 반영
+
+    기존 영상을 중복 집계하지 않도록 앞선 VideoDataSink가 새로 저장한 영상만 반영하므로
+    sink 목록에서 VideoDataSink 뒤에 두어야 합니다.
+    """
+
+    name = "trend_engine"
+    needs_previous = True
+
+    def write(self, records: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, int]:
+        from app.services.rising_trends import rising_trend_detector
+        from app.services.trend_engine import trend_engine
+
+        inserted = context.get("inserted_ids", set())
+        new_videos = [record for record in records if record['video_id'] in inserted]
+        trend_engine.ingest(new_videos)
+        rising_trend_detector.reload_if_changed()
+        rising_trend_detector.ingest(new_videos)
+        return {"ingested": len(new_videos), "skipped": len(records) - len(new_videos)}
+
+    def close(self, context: Dict[str, Any]) -> None:
+        from app.services.rising_trends import rising_trend_detector
+
+        rising_trend_detector.save()
+
+
+ANALYSIS_ERROR_MARKER = "# 분석 오류"
+
+
+def is_failed_analysis(analysis: Dict[str, Any]) -> bool:
+    """분석기가 예외 대신 돌려준 오류 결과인지 (점수 0 또는 "# 분석 오류" 리포트)"""
+    report = analysis.get('analysis_report') or ""
+    return not analysis.get('success_score') or report.startswith(ANALYSIS_ERROR_MARKER)
+
+
+def _default_analyze(record: Dict[str, Any]) -> Dict[str, Any]:
+    from app.services.video_analyzer import generate_analysis_report
+
+    return generate_analysis_report(record)
+
+
+class VideoReportSink(IngestionSink):
+    """
+    Supabase video_reports 저장
+
+    리포트 ID 필터(known_report_index)에 있는 영상은 조회 없이 건너뛰고,
+    배치마다 이미 있는 video_id를 한 번에 조회해 건너뛰고, 나머지만 analyze로 분석한 뒤
+    한 번의 insert로 저장합니다. 분석 실패는 그 영상만 건너뜁니다.
+    저장된 리포트 행은 context["reports"]에 모입니다.
+
+    analyze(record)는 analysis_report, success_score, trending_keywords를 담은 dict를 반환해야 합니다.
+    accept(record)가 있으면 True인 영상만 분석합니다 (예: 뷰티 키워드 필터, 나머지는 filtered로 집계).
+    점수가 0이거나 오류 리포트인 결과는 저장하지 않고 failed로 세어, 다음 실행에서 다시 분석합니다.
+    """
+
+    name = "video_reports"
+
+    def __init__(self, batch_size: int = 10, analyze: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                 client=None, accept: Optional[Callable[[Dict[str, Any]], bool]] = None):
+        super().__init__(batch_size)
+        self.analyze = analyze or _default_analyze
+        self._client = client
+        self.accept = accept
+
+    @property
+    def client(self):
+        if self._client is None:
+            from app.db.supabase_client import supabase
+            self._client = supabase
+        return self._client
+
+    def write(self, records: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, int]:
+        filtered = 0
+        if self.accept is not None:
+            accepted = [record for record in records if self.accept(record)]
+            filtered = len(records) - len(accepted)
+            records = accepted
+
+        # VideoData에 있는지와 무관하게 video_reports 기준으로만 판단
+        new_records = [record for record in records if record['video_id'] not in known_report_index]
+        known = len(records) - len(new_records)
+        if not new_records:
+            return {"inserted": 0, "skipped": known, "failed": 0, "filtered": filtered}
+
+        existing = self.client.table('video_reports')\
+            .select('video_id')\
+            .in_('video_id', [record['video_id'] for record in new_records])\
+            .execute()
+        existing_ids = {row['video_id'] for row in existing.data or []}
+        # 다른 프로세스가 저장한 리포트도 다음부터는 조회 없이 건너뛰도록
+        known_report_index.add(existing_ids)
+
+        rows = []
+        failed = 0
+        for record in new_records:
+            if record['video_id'] in existing_ids:
+                continue
+            try:
+                analysis = self.analyze(record)
+            except Exception as e:
+                print(f"⚠️  영상 분석 실패 ({record['video_id']}): {e}")
+                failed += 1
+                continue
+            if is_failed_analysis(analysis):
+                # 오류/안내 문구를 저장하면 존재 확인에 걸려 제대로 된 리포트가 영영 만들어지지 않음
+                print(f"⚠️  영상 분석 실패 ({record['video_id']}): {analysis['analysis_report'][:80]!r}")
+                failed += 1
+                continue
+            rows.append(self._to_row(record, analysis))
+
+        if rows:
+            result = self.client.table('video_reports').insert(rows).execute()
+            context.setdefault("reports", []).extend(result.data or [])
+            report_cache.invalidate_lists()
+            known_report_index.add(row['video_id'] for row in rows)
+            for row in rows:
+                print(f"💾 리포트 저장 완료: {row['title'][:50]}... (점수: {row['success_score']}점)")
+
+        return {"inserted": len(rows), "skipped": known + len(existing_ids), "failed": failed, "filtered": filtered}
+
+    @staticmethod
+    def _to_row(record: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+        published_at = record.get('published_at')
+        if isinstance(published_at, datetime):
+            published_at = published_at.isoformat()
+
+        return {
+            'video_id': record['video_id'],
+            'video_url': record.get('video_url') or f"https://www.youtube.com/watch?v={record['video_id']}",
+            'title': record['title'],
+            'channel_name': record.get('channel_name'),
+            'view_count': record.get('view_count'),
+            'like_count': record.get('like_count'),
+            'comment_count': record.get('comment_count'),
+            'published_at': published_at,
+            'thumbnail_url': record.get('thumbnail_url'),
+            'analysis_report': analysis['analysis_report'],
+            'success_score': analysis['success_score'],
+            'trending_keywords': analysis.get('trending_keywords', []),
+        }
+
+    def close(self, context: Dict[str, Any]) -> None:
+        known_report_index.save()
+
+
+class IngestionService:
+    """
+    영상 레코드를 sink 목록으로 분배
+
+    - ingest(): sink별 버퍼에 쌓고 batch_size가 차면 그 sink로 보냄
+    - flush(): 남은 버퍼를 모두 보내고 close() 호출 후 sink별 결과 반환
+    - needs_previous인 sink는 앞선 sink를 먼저 비운 뒤 보내므로 앞 sink의 결과(context)를 볼 수 있음
+    - sink.write()가 예외를 던지면 그 배치만 실패로 기록하고 다른 sink/다음 배치는 계속 진행
+    """
+
+    def __init__(self, sinks: List[IngestionSink]):
+        names = [sink.name for sink in sinks]
+        if len(set(names)) != len(names):
+            raise ValueError(f"sink 이름이 중복되었습니다: {names}")
+
+        self.sinks = sinks
+        self.context: Dict[str, Any] = {}
+        self._buffers: Dict[str, List[Dict[str, Any]]] = {sink.name: [] for sink in sinks}
+        self._stats: Dict[str, Dict[str, Any]] = {
+            sink.name: {
+                "sink": sink.name,
+                "batch_size": sink.batch_size,
+                "batches": 0,
+                "records": 0,
+                "failed_batches": 0,
+                "failed_records": 0,
+                "counters": {},
+                "seconds": 0.0,
+                "last_error": None,
+            }
+            for sink in sinks
+        }
+
+    def ingest(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            for index, sink in enumerate(self.sinks):
+                buffer = self._buffers[sink.name]
+                buffer.append(record)
+                if len(buffer) >= sink.batch_size:
+                    self._flush(index)
+
+    def flush(self) -> Dict[str, Dict[str, Any]]:
+        for index in range(len(self.sinks)):
+            self._flush(index)
+        for sink in self.sinks:
+            try:
+                sink.close(self.context)
+            except Exception as e:
+                print(f"⚠️  [{sink.name}] 마무리 실패: {e}")
+                self._stats[sink.name]["last_error"] = str(e)
+        return self.stats()
+
+    def run(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """ingest + flush"""
+        self.ingest(records)
+        return self.flush()
+
+    def _flush(self, index: int) -> None:
+        sink = self.sinks[index]
+        if sink.needs_previous:
+            for previous in range(index):
+                self._flush(previous)
+
+        buffer = self._buffers[sink.name]
+        if buffer:
+            self._buffers[sink.name] = []
+            self._write(sink, buffer)
+
+    def _write(self, sink: IngestionSink, batch: List[Dict[str, Any]]) -> None:
+        stats = self._stats[sink.name]
+        started = time.perf_counter()
+        try:
+            counters = sink.write(batch, self.context) or {}
+        except Exception as e:
+            stats["failed_batches"] += 1
+            stats["failed_records"] += len(batch)
+            stats["last_error"] = str(e)
+            print(f"❌ [{sink.name}] {len(batch)}개 저장 실패: {e}")
+            counters = {}
+        finally:
+            stats["seconds"] += time.perf_counter() - started
+
+        stats["batches"] += 1
+        stats["records"] += len(batch)
+        for key, value in counters.items():
+            stats["counters"][key] = stats["counters"].get(key, 0) + value
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {**stats, "counters": dict(stats["counters"]), "seconds": round(stats["seconds"], 3)}
+            for name, stats in self._stats.items()
+        }
+
+    @staticmethod
+    def print_report(report: Dict[str, Dict[str, Any]]) -> None:
+        for stats in report.values():
+            counters = ", ".join(f"{key} {value}" for key, value in stats["counters"].items()) or "-"
+            failed = f", 실패 배치 {stats['failed_batches']}개" if stats["failed_batches"] else ""
+            print(f"   - [{stats['sink']}] {stats['records']}개 / 배치 {stats['batches']}개 ({counters}){failed}")
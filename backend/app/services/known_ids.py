@@ -0,0 +1,315 @@
+"""
+이미 알고 있는 영상 ID 필터
+저장소별로 이미 있는 영상 ID를 Bloom 필터로 들고 있다가,
+수집 단계에서 네트워크 호출 전에 메모리에서 걸러냅니다.
+
+- known_video_index: VideoData (검색 결과의 상세 조회 생략)
+- known_report_index: Supabase video_reports (Gemini 분석·존재 확인 조회 생략)
+
+두 저장소는 따로 채워지므로 (리포트만 있는 영상, VideoData에만 있는 영상) 필터도 따로 둡니다.
+
+Bloom 필터 특성상 "없음"은 확실하고 "있음"은 fp_rate 확률로 틀릴 수 있습니다.
+즉 새 영상이 그 확률만큼 건너뛰어질 수 있으며, 이미 있는 영상을 다시 처리하는 일은 없습니다.
+"""
+import math
+import os
+import threading
+import time
+from hashlib import blake2b
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _hash_pair(key: str):
+    digest = blake2b(key.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class BloomFilter:
+    """
+    고정 크기 Bloom 필터 (비트 배열 + 이중 해싱)
+
+    - 비트 수 m = -n·ln(p) / (ln 2)², 해시 수 k = (m / n)·ln 2
+    - i번째 위치 = ((h1 + i·h2) mod 2^64) mod m (blake2b 128비트를 둘로 나눠 h1, h2로 사용)
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate는 0과 1 사이여야 합니다.")
+
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.n_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)))
+        self.n_hashes = max(1, int(round(self.n_bits / capacity * math.log(2))))
+        self.bits = np.zeros((self.n_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key: str) -> List[int]:
+        h1, h2 = _hash_pair(key)
+        # add_many(uint64 벡터 연산)와 같은 위치가 나오도록 2^64 모듈러로 맞춤
+        return [((h1 + i * h2) & _MASK64) % self.n_bits for i in range(self.n_hashes)]
+
+    def add(self, key: str) -> bool:
+        """추가 (이미 있었던 것으로 보이면 False)"""
+        bits = self.bits
+        added = False
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def add_many(self, keys: Iterable[str]) -> int:
+        """여러 개를 한 번에 추가 (위치 계산/비트 설정을 벡터 연산으로), 추가 시도한 개수 반환"""
+        pairs = np.array([_hash_pair(key) for key in keys], dtype=np.uint64).reshape(-1, 2)
+        if not len(pairs):
+            return 0
+
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        # uint64 오버플로는 2^64 모듈러 연산이라 그대로 두고 마지막에 m으로 나눔
+        with np.errstate(over="ignore"):
+            positions = (pairs[:, :1] + steps * pairs[:, 1:]) % np.uint64(self.n_bits)
+        positions = positions.ravel()
+        np.bitwise_or.at(
+            self.bits,
+            (positions >> np.uint64(3)).astype(np.int64),
+            (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)),
+        )
+        self.count += len(pairs)
+        return len(pairs)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def fill_ratio(self) -> float:
+        return float(np.unpackbits(self.bits).sum()) / self.n_bits
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        """현재 채워진 비율 기준 거짓 양성 확률 추정치"""
+        return self.fill_ratio ** self.n_hashes
+
+    # ===== 저장/복원 =====
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                bits=self.bits,
+                meta=np.array([self.capacity, self.n_bits, self.n_hashes, self.count], dtype=np.int64),
+                fp_rate=np.float64(self.fp_rate),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        with np.load(path, allow_pickle=False) as state:
+            capacity, n_bits, n_hashes, count = (int(v) for v in state["meta"])
+            bloom = cls(capacity, float(state["fp_rate"]))
+            if (bloom.n_bits, bloom.n_hashes) != (n_bits, n_hashes):
+                raise ValueError("Bloom 필터 파일의 크기 정보가 맞지 않습니다.")
+            bloom.bits = state["bits"].copy()
+            bloom.count = count
+        return bloom
+
+
+class KnownVideoIndex:
+    """
+    한 저장소(source)에 이미 있는 영상 ID 인덱스 (프로세스 전역, 파일로 공유)
+
+    - rebuild(): source("video_data" 또는 "video_reports")에서 전체 재구성
+    - add(): 새로 저장한 영상 반영 (save()로 파일에 기록)
+    - filter_new(): 모르는 ID만 남기고, 걸러낸 개수를 "아낀 호출 수"로 집계
+    - `video_id in index` 형태로 수집 계획기의 known_ids로도 사용 가능
+    """
+
+    SOURCES = ("video_data", "video_reports")
+
+    def __init__(self, path: Optional[str], source: str = "video_data", capacity: int = 200000,
+                 fp_rate: float = 0.001):
+        if source not in self.SOURCES:
+            raise ValueError(f"알 수 없는 source입니다: {source}")
+        self.path = path
+        self.source = source
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, fp_rate)
+        self._loaded_mtime: Optional[float] = None
+        self.built_at: Optional[float] = None
+
+        self.checks = 0
+        self.skipped = 0
+
+    def __contains__(self, video_id: str) -> bool:
+        with self._lock:
+            self.checks += 1
+            if video_id in self._bloom:
+                self.skipped += 1
+                return True
+            return False
+
+    def filter_new(self, video_ids: Iterable[str]) -> List[str]:
+        """이미 아는 ID를 뺀 목록 (순서 유지)"""
+        return [video_id for video_id in video_ids if video_id not in self]
+
+    def add(self, video_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._bloom.add_many(video_ids)
+
+    # ===== 재구성/저장 =====
+    def rebuild(self, db=None) -> int:
+        """
+        source 저장소의 영상 ID로 새 필터를 만들어 교체
+
+        용량은 설정값과 현재 ID 수의 2배 중 큰 값으로 잡아, 데이터가 늘어도 거짓 양성 비율을 유지합니다.
+        """
+        if self.source == "video_reports":
+            video_ids = self._load_ids_from_supabase()
+        else:
+            video_ids = self._load_ids_from_db(db)
+
+        bloom = BloomFilter(max(self.capacity, len(video_ids) * 2), self.fp_rate)
+        bloom.add_many(video_ids)
+
+        with self._lock:
+            self._bloom = bloom
+            self.built_at = time.time()
+        self.save()
+        return len(video_ids)
+
+    @staticmethod
+    def _load_ids_from_db(db=None) -> List[str]:
+        from app.db.database import SessionLocal
+        from app.models.models import VideoData
+
+        own_session = db is None
+        db = db or SessionLocal()
+        try:
+            return [video_id for (video_id,) in db.query(VideoData.video_id).execution_options(yield_per=10000)]
+        finally:
+            if own_session:
+                db.close()
+
+    @staticmethod
+    def _load_ids_from_supabase(page_size: int = 1000) -> List[str]:
+        try:
+            from app.db.supabase_client import supabase
+        except Exception as e:
+            raise RuntimeError(f"Supabase 클라이언트를 사용할 수 없습니다: {e}") from e
+
+        # 조회가 중간에 실패하면 예외를 그대로 던짐 (일부만 담긴 필터로 기존 파일을 덮어쓰지 않도록)
+        video_ids: List[str] = []
+        start = 0
+        while True:
+            result = supabase.table('video_reports')\
+                .select('video_id')\
+                .range(start, start + page_size - 1)\
+                .execute()
+            rows = result.data or []
+            video_ids.extend(row['video_id'] for row in rows if row.get('video_id'))
+            if len(rows) < page_size:
+                break
+            start += page_size
+        return video_ids
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            self._bloom.save(self.path)
+            self._loaded_mtime = os.path.getmtime(self.path)
+
+    def load(self) -> bool:
+        """파일에서 복원 (파일이 없거나 읽을 수 없으면 False)"""
+        if not self.path or not os.path.exists(self.path):
+            return False
+        try:
+            bloom = BloomFilter.load(self.path)
+        except Exception as e:
+            print(f"⚠️  알려진 영상 ID 필터({self.source})를 읽을 수 없습니다: {e}")
+            return False
+
+        with self._lock:
+            self._bloom = bloom
+            self._loaded_mtime = os.path.getmtime(self.path)
+            self.built_at = self._loaded_mtime
+        return True
+
+    def reload_if_changed(self) -> None:
+        """다른 프로세스가 파일을 갱신했으면 다시 읽기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        if self._loaded_mtime is None or os.path.getmtime(self.path) > self._loaded_mtime:
+            self.load()
+
+    def ensure_ready(self, max_age_hours: float = 24, background: bool = False) -> None:
+        """
+        파일이 없거나 max_age_hours보다 오래됐으면 재구성, 아니면 파일에서 읽기
+
+        background=True면 재구성을 별도 스레드에서 실행하고 바로 반환합니다 (앱 기동용).
+        """
+        if self.path and os.path.exists(self.path):
+            age_hours = (time.time() - os.path.getmtime(self.path)) / 3600
+            if age_hours < max_age_hours and self.load():
+                return
+
+        if background:
+            threading.Thread(target=self._rebuild_logged, name=f"known-ids-{self.source}", daemon=True).start()
+        else:
+            self._rebuild_logged()
+
+    def _rebuild_logged(self) -> None:
+        try:
+            count = self.rebuild()
+            print(f"✅ 알려진 영상 ID 필터({self.source}) 재구성 완료: {count}개")
+        except Exception as e:
+            print(f"⚠️  알려진 영상 ID 필터({self.source}) 재구성 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        bloom = self._bloom
+        return {
+            "source": self.source,
+            "video_ids": bloom.count,
+            "capacity": bloom.capacity,
+            "bits": bloom.n_bits,
+            "hashes": bloom.n_hashes,
+            "target_fp_rate": bloom.fp_rate,
+            "estimated_fp_rate": round(bloom.estimated_fp_rate, 6),
+            "checks": self.checks,
+            "calls_avoided": self.skipped,
+            "built_at": self.built_at,
+        }
+
+
+# 전역 인스턴스
+known_video_index = KnownVideoIndex(
+    settings.KNOWN_IDS_PATH,
+    source="video_data",
+    capacity=settings.KNOWN_IDS_CAPACITY,
+    fp_rate=settings.KNOWN_IDS_FP_RATE,
+)
+known_report_index = KnownVideoIndex(
+    settings.KNOWN_REPORT_IDS_PATH,
+    source="video_reports",
+    capacity=settings.KNOWN_IDS_CAPACITY,
+    fp_rate=settings.KNOWN_IDS_FP_RATE,
+)
@@ -0,0 +1,91 @@
+"""
+단건 예측 결과 캐시
+같은 제목을 조금씩 고쳐 반복 요청하는 경우를 위해 정규화된 입력 기준으로 결과를 재사용
+"""
+import re
+import unicodedata
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.cache import LRUCache
+from app.core.config import settings
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+CacheKey = Tuple[str, str, Tuple[str, ...]]
+
+
+def _normalize_text(text: Optional[str]) -> str:
+    """NFC 정규화 + 공백 정리"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def normalize_prediction_input(
+    title: str,
+    description: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> CacheKey:
+    """
+    (title, description, tags)를 캐시 키로 정규화
+
+    - 유니코드 NFC 정규화
+    - 연속 공백을 하나로 합치고 앞뒤 공백 제거
+    - 태그는 빈 값을 제외하고 정렬 (순서 무관)
+    """
+    normalized_tags = sorted({t for t in (_normalize_text(tag) for tag in tags or []) if t})
+    return (
+        _normalize_text(title),
+        _normalize_text(description),
+        tuple(normalized_tags),
+    )
+
+
+class PredictionCache:
+    """
+    예측 결과 LRU 캐시
+
+    모델/키워드 사전 버전이 바뀌면 저장된 결과를 모두 버립니다.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        self._cache = LRUCache(max_size=max_size)
+        self._version: Optional[str] = None
+        self._version_lock = Lock()
+        self.invalidations = 0
+
+    def _check_version(self, version: str) -> None:
+        """버전이 바뀌었으면 캐시 비우기"""
+        if version == self._version:
+            return
+
+        with self._version_lock:
+            if version != self._version:
+                if self._version is not None:
+                    self._cache.clear()
+                    self.invalidations += 1
+                self._version = version
+
+    def get(self, key: CacheKey, version: str) -> Optional[Dict[str, Any]]:
+        self._check_version(version)
+        return self._cache.get(key)
+
+    def set(self, key: CacheKey, version: str, result: Dict[str, Any]) -> None:
+        self._check_version(version)
+        self._cache.set(key, result)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._cache.stats(),
+            "version": self._version,
+            "invalidations": self.invalidations,
+        }
+
+
+# 전역 인스턴스
+prediction_cache = PredictionCache(max_size=settings.PREDICTION_CACHE_SIZE)
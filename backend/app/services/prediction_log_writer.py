@@ -0,0 +1,196 @@
+"""
+예측 로그 비동기 기록기
+요청 핸들러는 로그를 큐에 넣기만 하고, 백그라운드 스레드가 모아서 일괄 INSERT
+"""
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.models import PredictionLog
+
+
+class PredictionLogWriter:
+    """
+    PredictionLog 버퍼링 기록기
+
+    - batch_size 개가 모이거나 flush_interval 초가 지나면 한 번에 INSERT
+    - 큐가 가득 찼을 때 정책: 'drop' (버리고 카운트) / 'block' (자리가 날 때까지 대기)
+    - 비동기 핸들러에서는 aenqueue() 사용 ('block' 대기를 이벤트 루프 밖 스레드에서)
+    - stop() 호출 시 남은 로그를 모두 기록한 뒤 종료
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        max_queue_size: int = 10000,
+        policy: str = "drop",
+        block_timeout: float = 1.0
+    ):
+        if policy not in ("drop", "block"):
+            raise ValueError(f"지원하지 않는 큐 정책입니다: {policy}")
+
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 메트릭
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.flush_count = 0
+        self.last_flush_ms: Optional[float] = None
+        self.max_flush_ms = 0.0
+        self._total_flush_ms = 0.0
+
+    def start(self) -> None:
+        """플러시 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="prediction-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 10.0) -> None:
+        """남은 로그를 기록하고 스레드 종료"""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+        # 스레드 종료 후에도 남아 있는 항목 정리
+        self._drain_and_flush()
+
+    def enqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        로그 레코드 추가
+
+        Returns:
+            큐에 들어갔으면 True, drop 정책으로 버려졌으면 False
+        """
+        try:
+            if self.policy == "block":
+                self._queue.put(record, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+        self.enqueued += 1
+        return True
+
+    async def aenqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        이벤트 루프에서 호출하는 enqueue
+
+        'block' 정책이라도 자리가 있으면 바로 넣고, 가득 찼을 때만 대기를 스레드로 넘겨
+        다른 요청 처리가 멈추지 않게 합니다.
+        """
+        if self.policy == "block":
+            try:
+                self._queue.put_nowait(record)
+            except queue.Full:
+                return await asyncio.to_thread(self.enqueue, record)
+            self.enqueued += 1
+            return True
+        return self.enqueue(record)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            batch = self._collect_batch()
+            if batch:
+                self._flush(batch)
+
+    def _collect_batch(self) -> List[Dict[str, Any]]:
+        """batch_size 개 또는 flush_interval 경과까지 수집"""
+        batch: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _drain_and_flush(self) -> None:
+        batch: List[Dict[str, Any]] = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+
+        if batch:
+            self._flush(batch)
+
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """일괄 INSERT (짧은 트랜잭션 하나)"""
+        started = time.perf_counter()
+        db = SessionLocal()
+
+        try:
+            db.execute(insert(PredictionLog), batch)
+            db.commit()
+            self.written += len(batch)
+        except Exception as e:
+            db.rollback()
+            self.failed += len(batch)
+            print(f"❌ 예측 로그 저장 오류 ({len(batch)}건): {e}")
+        finally:
+            db.close()
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.flush_count += 1
+        self.last_flush_ms = elapsed_ms
+        self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+        self._total_flush_ms += elapsed_ms
+
+    def stats(self) -> Dict[str, Any]:
+        """큐/플러시 메트릭 반환"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_max_size": self._queue.maxsize,
+            "policy": self.policy,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+            "flush_count": self.flush_count,
+            "last_flush_ms": round(self.last_flush_ms, 2) if self.last_flush_ms is not None else None,
+            "avg_flush_ms": round(self._total_flush_ms / self.flush_count, 2) if self.flush_count else None,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+
+# 전역 인스턴스
+prediction_log_writer = PredictionLogWriter(
+    batch_size=settings.PREDICTION_LOG_BATCH_SIZE,
+    flush_interval=settings.PREDICTION_LOG_FLUSH_INTERVAL_MS / 1000,
+    max_queue_size=settings.PREDICTION_LOG_QUEUE_SIZE,
+    policy=settings.PREDICTION_LOG_QUEUE_POLICY,
+)
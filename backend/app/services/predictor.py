@@ -3,8 +3,15 @@ AI 예측 서비스
 실제 머신러닝 모델을 로드하고 예측을 수행하는 서비스
 """
 from typing import Dict, List, Optional
+import hashlib
+import json
 import re
 
+import numpy as np
+
+from app.services.success_patterns import success_pattern_analyzer
+from app.services.text_features import normalize_for_ngrams, title_vectorizer
+
 class PredictorService:
     """
     떡상 예측 서비스
@@ -13,6 +20,13 @@ class PredictorService:
     실제로는 학습된 XGBoost/LightGBM 모델을 로드하여 사용
     """
     
+    # 모델이 바뀌면 올려야 하는 버전 (예측 캐시 무효화 기준)
+    MODEL_VERSION = "rule-v4"
+    
+    # 키워드 n-gram 중 이 비율 이상이 텍스트에 있으면 철자가 조금 달라도 매칭 (가중치는 비율만큼)
+    # 0.5면 앞부분만 같은 다른 단어("올리브 오일" → 올리브영)도 걸리므로 한 글자 끼어든 오타 정도만 허용
+    FUZZY_MATCH_THRESHOLD = 0.75
+    
     def __init__(self):
         # 실제로는 여기서 모델 파일(.pkl)을 로드
         # self.model = joblib.load('path/to/model.pkl')
@@ -32,6 +46,19 @@ class PredictorService:
             '세일': 0.25,
             '할인': 0.20
         }
+        # 키워드별 해시 n-gram (유사 매칭용, 요청마다 다시 만들지 않도록 미리 계산)
+        self._keyword_ngrams = title_vectorizer.transform(self.beauty_keywords)
+    
+    @property
+    def keyword_version(self) -> str:
+        """키워드 사전 버전 (사전 내용의 해시)"""
+        payload = json.dumps(self.beauty_keywords, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+    
+    @property
+    def version(self) -> str:
+        """모델 + 키워드 사전 + 성공 패턴(분석 스냅샷) 버전"""
+        return f"{self.MODEL_VERSION}:{self.keyword_version}:{success_pattern_analyzer.version or '-'}"
     
     def extract_features(self, title: str, description: Optional[str], tags: Optional[List[str]]) -> Dict:
         """
@@ -47,9 +74,16 @@ class PredictorService:
         if description:
             text += " " + description.lower()
         
-        for keyword, weight in self.beauty_keywords.items():
-            if keyword.lower() in text:
+        # 띄어쓰기/기호를 제거한 텍스트로도 매칭 ("내 돈 내 산" → "내돈내산")
+        compact_text = normalize_for_ngrams(text)
+        
+        containment = self._keyword_containment(compact_text)
+        for (keyword, weight), ratio in zip(self.beauty_keywords.items(), containment):
+            if keyword.lower() in text or normalize_for_ngrams(keyword) in compact_text:
                 features[f'keyword_{keyword}'] = weight
+            elif ratio >= self.FUZZY_MATCH_THRESHOLD:
+                # 오타/변형 표기 ("파운데이이션") - 겹치는 n-gram 비율만큼만 반영
+                features[f'keyword_{keyword}'] = round(weight * float(ratio), 4)
         
         # 특수문자/이모지 사용 여부
         features['has_emoji'] = 1 if re.search(r'[^\w\s,.]', title) else 0
@@ -59,6 +93,17 @@ class PredictorService:
         
         return features
     
+    def _keyword_containment(self, compact_text: str) -> np.ndarray:
+        """키워드마다 n-gram 중 텍스트에도 있는 비율 (해시 인덱스 기준, 키워드 전체를 한 번에 계산)"""
+        keywords = self._keyword_ngrams
+        text_indices, _ = title_vectorizer.transform_one(compact_text)
+        if not len(keywords.indices):
+            return np.zeros(keywords.n_rows)
+        hits = np.isin(keywords.indices, text_indices).astype(np.float64)
+        sizes = np.diff(keywords.indptr)
+        matched = np.add.reduceat(np.append(hits, 0.0), keywords.indptr[:-1])
+        return np.divide(matched, sizes, out=np.zeros(keywords.n_rows), where=sizes > 0)
+    
     def predict(self, title: str, description: Optional[str] = None, tags: Optional[List[str]] = None) -> Dict:
         """
         떡상 확률 예측
@@ -138,7 +183,25 @@ class PredictorService:
         # 썸네일 조언
         guidelines.append("\n📸 썸네일 팁: 얼굴 클로즈업 + 제품 이미지 조합이 클릭률이 가장 높습니다.")
         
-        # 업로드 시간 조언
-        guidelines.append("\n⏰ 최적 업로드 시간: 금요일 오후 7-9시")
+        # 업로드 시간/영상 길이 조언 (수집 데이터 기준, 없으면 기본값)
+        patterns = success_pattern_analyzer.get() or {}
+        best_upload_time = patterns.get("best_upload_time", "금요일 오후 7-9시")
+        guidelines.append(f"\n⏰ 최적 업로드 시간: {best_upload_time}")
+        if patterns.get("optimal_length"):
+            guidelines.append(f"\n🎬 조회수가 가장 잘 나오는 영상 길이: {patterns['optimal_length']}")
         
         return "\n".join(guidelines)
+
+
+# 전역 인스턴스
+_predictor: Optional[PredictorService] = None
+
+
+def get_predictor() -> PredictorService:
+    """예측 서비스 공유 인스턴스 반환"""
+    global _predictor
+    
+    if _predictor is None:
+        _predictor = PredictorService()
+    
+    return _predictor
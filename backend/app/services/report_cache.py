@@ -0,0 +1,98 @@
+"""
+영상 분석 리포트 읽기 캐시
+리포트는 저장 후 바뀌지 않으므로 ID별 항목은 만료 없이 보관하고,
+목록(최신순 / 성공 점수순) 앞 페이지는 새 리포트가 저장될 때 비웁니다.
+
+- 같은 프로세스의 저장 경로(generate_report, VideoReportSink)는 저장 직후 invalidate_lists() 호출
+- 다른 프로세스(cron)가 저장한 리포트는 목록 TTL이 지나면 반영
+- 같은 키의 동시 미스는 조회 한 번으로 합침 (공유된 리포트 페이지에 요청이 몰릴 때)
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from app.core.cache import LRUCache, SingleFlight
+from app.core.config import settings
+
+
+class VideoReportCache:
+    def __init__(self, max_reports: int = 2048, max_lists: int = 64,
+                 list_max_rows: int = 100, list_ttl_seconds: float = 300):
+        self._reports = LRUCache(max_size=max_reports)
+        # 키 → (행 목록, 만료 시각, 세대)
+        self._lists = LRUCache(max_size=max_lists)
+        self.list_max_rows = list_max_rows
+        self.list_ttl_seconds = list_ttl_seconds
+
+        self._generation = 0
+        self._flights = SingleFlight()
+        self.invalidations = 0
+
+    # ===== 단건 =====
+    async def get_report(self, report_id: str,
+                         loader: Callable[[], Awaitable[Optional[Dict[str, Any]]]]) -> Optional[Dict[str, Any]]:
+        """ID별 리포트 (없는 리포트는 캐시하지 않음)"""
+        report = self._reports.get(report_id)
+        if report is not None:
+            return report
+
+        report = await self._flights.run(("report", report_id), loader)
+        if report is not None:
+            self._reports.set(report_id, report)
+        return report
+
+    def put_report(self, report: Dict[str, Any]) -> None:
+        if report.get("id"):
+            self._reports.set(str(report["id"]), report)
+
+    # ===== 목록 =====
+    async def get_list(self, key: Hashable, rows_needed: int,
+                       loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+                       full_rows: bool = True) -> List[Dict[str, Any]]:
+        """
+        목록 페이지 (앞쪽 list_max_rows행 안의 페이지만 캐시)
+
+        조회 중에 invalidate_lists()가 호출되면 그 결과는 캐시에 넣지 않습니다.
+        full_rows가 False(요약 컬럼만 조회)면 행을 ID별 리포트 캐시에 넣지 않습니다.
+        """
+        if rows_needed > self.list_max_rows:
+            return await loader()
+
+        cached = self._lists.get(key)
+        if cached is not None and cached[1] > time.time() and cached[2] == self._generation:
+            return cached[0]
+
+        generation = self._generation
+        rows = await self._flights.run(("list", key, generation), loader)
+        if generation == self._generation:
+            self._lists.set(key, (rows, time.time() + self.list_ttl_seconds, generation))
+            if full_rows:
+                for row in rows:
+                    self.put_report(row)
+        return rows
+
+    def invalidate_lists(self) -> None:
+        """새 리포트 저장 후 호출 (목록 캐시 전체 무효화)"""
+        self._generation += 1
+        self._lists.clear()
+        self.invalidations += 1
+
+    def on_insert(self, report: Optional[Dict[str, Any]]) -> None:
+        if report:
+            self.put_report(report)
+        self.invalidate_lists()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "reports": self._reports.stats(),
+            "lists": self._lists.stats(),
+            "invalidations": self.invalidations,
+        }
+
+
+# 전역 인스턴스
+report_cache = VideoReportCache(
+    max_reports=settings.VIDEO_REPORT_CACHE_SIZE,
+    max_lists=settings.VIDEO_REPORT_LIST_CACHE_SIZE,
+    list_max_rows=settings.VIDEO_REPORT_LIST_CACHE_MAX_ROWS,
+    list_ttl_seconds=settings.VIDEO_REPORT_LIST_CACHE_TTL_SECONDS,
+)
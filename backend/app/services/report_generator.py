@@ -0,0 +1,108 @@
+"""
+영상 분석 리포트 생성 (POST /api/reports/generate)
+URL에서 video_id를 먼저 뽑아 저장된 리포트를 확인하고, 없을 때만 YouTube 조회 + Gemini 분석을 실행합니다.
+
+- 이미 리포트가 있는 영상은 Gemini를 호출하지 않고 저장된 리포트 반환
+- 같은 video_id 요청이 동시에 들어오면 처음 요청의 분석 결과를 함께 기다림 (분석 한 번)
+- YouTube/Gemini 호출은 동기 SDK라 스레드에서 실행 (분석 중에도 이벤트 루프가 다른 요청 처리)
+- 분석이 실패하면(API 키 없음, Gemini 오류) 저장하지 않고 AnalysisFailed (다음 요청에서 다시 분석)
+"""
+import asyncio
+from typing import Any, Dict, Optional
+
+from app.core.cache import SingleFlight
+from app.db.postgrest import PostgrestError
+from app.db.repositories import VideoReportRepository, video_reports
+from app.services.ingestion import is_failed_analysis
+from app.services.report_cache import VideoReportCache, report_cache
+from app.services.video_analyzer import extract_video_id, generate_analysis_report, get_video_metadata
+
+
+class AnalysisFailed(Exception):
+    """분석기가 오류 결과를 돌려줌 - 저장된 오류 리포트가 이후 요청을 계속 막지 않도록 저장하지 않음"""
+
+
+class ReportGenerator:
+    def __init__(self, repository: VideoReportRepository, cache: VideoReportCache):
+        self.repository = repository
+        self.cache = cache
+        self._flights = SingleFlight()
+
+        self.analyses = 0  # Gemini 분석 실행 수
+        self.existing = 0  # 저장된 리포트로 응답한 수
+        self.failed = 0  # 저장하지 않은 분석 실패 수
+
+    async def generate(self, video_url: str) -> Optional[Dict[str, Any]]:
+        """
+        리포트 조회 또는 생성
+
+        Returns:
+            저장된 리포트 행, URL이 유효하지 않거나 영상을 찾을 수 없으면 None
+        """
+        video_id = extract_video_id(video_url)
+        if not video_id:
+            return None
+        return await self._flights.run(video_id, lambda: self._get_or_create(video_id, video_url))
+
+    async def _get_or_create(self, video_id: str, video_url: str) -> Optional[Dict[str, Any]]:
+        existing = await self.repository.get_by_video_id(video_id)
+        if existing:
+            self.existing += 1
+            return existing
+
+        metadata = await asyncio.to_thread(get_video_metadata, video_id)
+        if not metadata:
+            return None
+
+        self.analyses += 1
+        analysis = await asyncio.to_thread(generate_analysis_report, metadata)
+        if is_failed_analysis(analysis):
+            self.failed += 1
+            raise AnalysisFailed(analysis['analysis_report'])
+
+        insert_data = {
+            'video_id': video_id,
+            'video_url': video_url,
+            'title': metadata['title'],
+            'channel_name': metadata.get('channel_name'),
+            'view_count': metadata.get('view_count'),
+            'like_count': metadata.get('like_count'),
+            'comment_count': metadata.get('comment_count'),
+            'published_at': metadata.get('published_at'),
+            'thumbnail_url': metadata.get('thumbnail_url'),
+            'analysis_report': analysis['analysis_report'],
+            'success_score': analysis.get('success_score'),
+            'trending_keywords': analysis.get('trending_keywords', [])
+        }
+
+        try:
+            created = await self.repository.create(insert_data)
+        except PostgrestError as e:
+            # 다른 프로세스(cron 수집 등)가 분석 중에 먼저 저장한 경우 그 리포트 사용
+            if e.status_code != 409:
+                raise
+            created = await self.repository.get_by_video_id(video_id)
+            if created:
+                self.existing += 1
+                return created
+            raise
+
+        if not created:
+            raise RuntimeError("리포트 저장에 실패했습니다.")
+
+        # 새 리포트가 목록에 바로 보이도록 목록 캐시 무효화
+        self.cache.on_insert(created)
+        return created
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "analyses": self.analyses,
+            "existing": self.existing,
+            "failed": self.failed,
+            "joined": self._flights.joined,
+            "in_flight": len(self._flights),
+        }
+
+
+# 전역 인스턴스
+report_generator = ReportGenerator(video_reports, report_cache)
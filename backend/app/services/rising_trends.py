@@ -0,0 +1,307 @@
+"""
+떠오르는 트렌드 감지기
+키워드별 시간 단위 카운트를 링 버퍼(NumPy 배열)로 유지하고,
+최근 구간이 과거 기준선 대비 얼마나 가속했는지로 급상승 키워드를 찾습니다.
+"""
+import os
+from datetime import datetime, timezone
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.text_features import tokenize_keywords
+
+
+def _epoch_hour(at: Optional[datetime]) -> int:
+    if at is None:
+        at = datetime.now(timezone.utc)
+    elif at.tzinfo is None:
+        at = at.replace(tzinfo=timezone.utc)
+    return int(at.timestamp() // 3600)
+
+
+class RisingTrendDetector:
+    """
+    슬라이딩 윈도우 급상승 키워드 감지기
+
+    - counts[키워드, 시간 버킷]: n_buckets 시간짜리 링 버퍼
+    - window_sum: 최근 window_hours 시간 합계, baseline_sum: 그 이전 구간 합계
+      두 합계는 버킷 이동/추가 시 증분으로 갱신하므로 조회는 O(K)
+    - 점수: 기준선 평균을 포아송 분산으로 본 z-score와 스무딩된 비율
+    """
+
+    def __init__(
+        self,
+        max_keywords: int = 5000,
+        n_buckets: int = 24 * 14,
+        window_hours: int = 24,
+        z_threshold: float = 2.0,
+        min_ratio: float = 1.5,
+        min_count: float = 3.0,
+        smoothing: float = 1.0,
+        state_path: Optional[str] = None
+    ):
+        if window_hours >= n_buckets:
+            raise ValueError("window_hours는 n_buckets보다 작아야 합니다.")
+
+        self.max_keywords = max_keywords
+        self.n_buckets = n_buckets
+        self.window_hours = window_hours
+        self.z_threshold = z_threshold
+        self.min_ratio = min_ratio
+        self.min_count = min_count
+        self.smoothing = smoothing
+        self.state_path = state_path
+
+        self._lock = Lock()
+        self._state_mtime: Optional[float] = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self.counts = np.zeros((self.max_keywords, self.n_buckets), dtype=np.float32)
+        self.window_sum = np.zeros(self.max_keywords, dtype=np.float64)
+        self.baseline_sum = np.zeros(self.max_keywords, dtype=np.float64)
+        self.keywords: List[Optional[str]] = [None] * self.max_keywords
+        self._rows: Dict[str, int] = {}
+        self._free_rows = list(range(self.max_keywords - 1, -1, -1))
+        self.current_hour: Optional[int] = None
+        self.first_hour: Optional[int] = None
+
+    # ===== 버킷 관리 =====
+    def _advance_to(self, hour: int) -> None:
+        """현재 시각을 hour까지 이동 (지나간 버킷은 윈도우 → 기준선 → 폐기 순으로 이동)"""
+        if self.current_hour is None:
+            self.current_hour = hour
+            self.first_hour = hour
+            return
+
+        steps = hour - self.current_hour
+        if steps <= 0:
+            return
+
+        if steps >= self.n_buckets:
+            # 보관 범위를 완전히 벗어나면 모든 기록 폐기
+            self.counts.fill(0)
+            self.window_sum.fill(0)
+            self.baseline_sum.fill(0)
+            self.current_hour = hour
+            self.first_hour = hour
+            return
+
+        for t in range(self.current_hour + 1, hour + 1):
+            leaving = (t - self.window_hours) % self.n_buckets
+            self.window_sum -= self.counts[:, leaving]
+            self.baseline_sum += self.counts[:, leaving]
+
+            reused = t % self.n_buckets  # 가장 오래된 버킷 (t - n_buckets)
+            self.baseline_sum -= self.counts[:, reused]
+            self.counts[:, reused] = 0
+
+        self.current_hour = hour
+
+    def _row_for(self, keyword: str) -> int:
+        row = self._rows.get(keyword)
+        if row is not None:
+            return row
+
+        if not self._free_rows:
+            # 가득 차면 보관 기간 전체 합이 가장 작은 키워드 제거
+            evicted = int(np.argmin(self.window_sum + self.baseline_sum))
+            self._release_row(evicted)
+
+        row = self._free_rows.pop()
+        self._rows[keyword] = row
+        self.keywords[row] = keyword
+        return row
+
+    def _release_row(self, row: int) -> None:
+        keyword = self.keywords[row]
+        if keyword is not None:
+            del self._rows[keyword]
+        self.keywords[row] = None
+        self.counts[row] = 0
+        self.window_sum[row] = 0
+        self.baseline_sum[row] = 0
+        self._free_rows.append(row)
+
+    # ===== 입력 =====
+    def add(self, keywords: Iterable[str], at: Optional[datetime] = None, weight: float = 1.0) -> None:
+        """키워드 관측 추가 (at 시각의 시간 버킷에 weight만큼)"""
+        hour = _epoch_hour(at)
+
+        with self._lock:
+            if self.current_hour is None or hour > self.current_hour:
+                self._advance_to(hour)
+
+            age = self.current_hour - hour
+            if age >= self.n_buckets:
+                return  # 보관 범위보다 오래된 관측은 무시
+
+            column = hour % self.n_buckets
+            in_window = age < self.window_hours
+            if self.first_hour is None or hour < self.first_hour:
+                self.first_hour = hour
+
+            for keyword in keywords:
+                row = self._row_for(keyword)
+                self.counts[row, column] += weight
+                if in_window:
+                    self.window_sum[row] += weight
+                else:
+                    self.baseline_sum[row] += weight
+
+    def ingest(self, videos: Iterable[Dict[str, Any]]) -> int:
+        """수집된 영상 dict 목록 반영 (published_at 시각 기준, 영상당 1회)"""
+        count = 0
+        for video in videos:
+            keywords = tokenize_keywords(video.get("title", ""), video.get("tags"))
+            self.add(keywords, at=video.get("published_at"))
+            count += 1
+        return count
+
+    # ===== 조회 =====
+    def _baseline_windows(self) -> float:
+        """기준선 구간이 윈도우 몇 개 분량인지 (수집 초기에는 실제 관측 기간 기준)"""
+        if self.current_hour is None or self.first_hour is None:
+            return 1.0
+        observed = min(self.current_hour - self.first_hour + 1, self.n_buckets)
+        return max((observed - self.window_hours) / self.window_hours, 1.0)
+
+    def rising(self, limit: int = 10, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        급상승 키워드 목록 (z-score 높은 순)
+
+        Args:
+            limit: 최대 개수
+            now: 기준 시각 (기본값: 현재 시각, 새 관측이 없어도 윈도우가 밀려나도록)
+
+        Returns:
+            [{"keyword", "current", "baseline", "ratio", "z_score"}, ...]
+        """
+        with self._lock:
+            if self.current_hour is None:
+                return []
+            self._advance_to(_epoch_hour(now))
+
+            current = self.window_sum
+            baseline = self.baseline_sum / self._baseline_windows()
+
+            z_scores = (current - baseline) / np.sqrt(baseline + self.smoothing)
+            ratios = (current + self.smoothing) / (baseline + self.smoothing)
+
+            mask = (
+                (z_scores >= self.z_threshold)
+                & (ratios >= self.min_ratio)
+                & (current >= self.min_count)
+            )
+            candidates = np.flatnonzero(mask)
+            if not len(candidates):
+                return []
+
+            if len(candidates) > limit:
+                top = np.argpartition(-z_scores[candidates], limit - 1)[:limit]
+                candidates = candidates[top]
+            candidates = candidates[np.argsort(-z_scores[candidates])]
+
+            return [
+                {
+                    "keyword": self.keywords[row],
+                    "current": float(current[row]),
+                    "baseline": round(float(baseline[row]), 2),
+                    "ratio": round(float(ratios[row]), 2),
+                    "z_score": round(float(z_scores[row]), 2),
+                }
+                for row in candidates
+            ]
+
+    def rising_keywords(self, limit: int = 10) -> List[str]:
+        """WeeklyReport.rising_trends 용 키워드 문자열 목록"""
+        return [item["keyword"] for item in self.rising(limit)]
+
+    # ===== 저장/복원 =====
+    def save(self, path: Optional[str] = None) -> None:
+        """버킷 상태를 .npz 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = path or self.state_path
+        if not path:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+
+        with self._lock:
+            rows = np.array(sorted(self._rows.values()), dtype=np.int64)
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(
+                    f,
+                    keywords=np.array([self.keywords[r] for r in rows], dtype=str),
+                    counts=self.counts[rows],
+                    current_hour=np.int64(self.current_hour if self.current_hour is not None else -1),
+                    first_hour=np.int64(self.first_hour if self.first_hour is not None else -1),
+                    n_buckets=np.int64(self.n_buckets),
+                )
+            os.replace(tmp_path, path)
+            self._state_mtime = os.path.getmtime(path)
+
+    def load(self, path: Optional[str] = None) -> bool:
+        """저장된 상태 복원 (설정이 달라졌거나 파일이 없으면 False)"""
+        path = path or self.state_path
+        if not path or not os.path.exists(path):
+            return False
+
+        with np.load(path, allow_pickle=False) as state:
+            if int(state["n_buckets"]) != self.n_buckets:
+                print(f"⚠️  버킷 수가 달라 급상승 트렌드 상태를 무시합니다: {path}")
+                return False
+
+            keywords = state["keywords"].tolist()[:self.max_keywords]
+            counts = state["counts"][:self.max_keywords]
+            current_hour = int(state["current_hour"])
+            first_hour = int(state["first_hour"])
+
+        with self._lock:
+            self._reset_state()
+            if current_hour < 0:
+                return True
+
+            self.current_hour = current_hour
+            self.first_hour = first_hour
+            for keyword in keywords:
+                self._row_for(keyword)
+            self.counts[:len(keywords)] = counts
+
+            # 윈도우/기준선 합계 재계산
+            ages = (current_hour - np.arange(self.n_buckets)) % self.n_buckets
+            window_cols = np.flatnonzero(ages < self.window_hours)
+            self.window_sum = self.counts[:, window_cols].sum(axis=1, dtype=np.float64)
+            self.baseline_sum = self.counts.sum(axis=1, dtype=np.float64) - self.window_sum
+            self._state_mtime = os.path.getmtime(path)
+
+        return True
+
+    def reload_if_changed(self) -> None:
+        """다른 프로세스(수집기)가 상태 파일을 갱신했으면 다시 읽기"""
+        path = self.state_path
+        if not path or not os.path.exists(path):
+            return
+        if self._state_mtime is None or os.path.getmtime(path) > self._state_mtime:
+            self.load(path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tracked_keywords": len(self._rows),
+            "max_keywords": self.max_keywords,
+            "current_hour": self.current_hour,
+            "window_hours": self.window_hours,
+            "n_buckets": self.n_buckets,
+        }
+
+
+# 전역 인스턴스
+rising_trend_detector = RisingTrendDetector(
+    max_keywords=settings.RISING_TRENDS_MAX_KEYWORDS,
+    n_buckets=settings.RISING_TRENDS_HISTORY_HOURS,
+    window_hours=settings.RISING_TRENDS_WINDOW_HOURS,
+    state_path=settings.RISING_TRENDS_STATE_PATH,
+)
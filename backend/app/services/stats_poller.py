@@ -0,0 +1,195 @@
+"""
+영상 통계 재수집기
+추적 중인 영상의 조회수/좋아요/댓글 수를 주기적으로 다시 가져와 VideoStatsSnapshot에 쌓고,
+최근 조회수 증가 속도가 빠른 영상부터 할당량 예산 안에서 더 자주 샘플링합니다.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.models import VideoData, VideoStatsSnapshot
+
+# videos.list 1회(최대 50개) 비용
+BATCH_SIZE = 50
+BATCH_COST = 1
+
+
+def _epoch_seconds(value: Optional[datetime]) -> float:
+    if value is None:
+        return np.nan
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def latest_samples(
+    db: Session,
+    since: datetime,
+    video_ids: Optional[Iterable[str]] = None
+) -> Dict[str, List[Tuple[float, int]]]:
+    """
+    영상별 최근 통계 샘플 2개 (최신순, [(epoch 초, 조회수), ...])
+
+    ROW_NUMBER() 윈도 함수로 한 번에 가져옵니다 (SQLite 3.25+, PostgreSQL).
+    """
+    rank = func.row_number().over(
+        partition_by=VideoStatsSnapshot.video_id,
+        order_by=VideoStatsSnapshot.captured_at.desc()
+    ).label("rank")
+    ranked = select(
+        VideoStatsSnapshot.video_id, VideoStatsSnapshot.captured_at, VideoStatsSnapshot.view_count, rank
+    ).where(VideoStatsSnapshot.captured_at >= since)
+    if video_ids is not None:
+        ranked = ranked.where(VideoStatsSnapshot.video_id.in_(list(video_ids)))
+    ranked = ranked.subquery()
+
+    samples: Dict[str, List[Tuple[float, int]]] = {}
+    rows = db.execute(
+        select(ranked.c.video_id, ranked.c.captured_at, ranked.c.view_count)
+        .where(ranked.c.rank <= 2)
+        .order_by(ranked.c.video_id, ranked.c.rank)
+    )
+    for video_id, captured_at, view_count in rows:
+        samples.setdefault(video_id, []).append((_epoch_seconds(captured_at), view_count or 0))
+    return samples
+
+
+def view_velocities(samples: Dict[str, List[Tuple[float, int]]]) -> Dict[str, float]:
+    """최근 두 샘플 사이 시간당 조회수 증가량 (샘플이 2개 이상인 영상만)"""
+    velocities = {}
+    for video_id, points in samples.items():
+        if len(points) < 2:
+            continue
+        (latest_at, latest_views), (previous_at, previous_views) = points[0], points[1]
+        hours = (latest_at - previous_at) / 3600.0
+        if hours > 0:
+            velocities[video_id] = max(latest_views - previous_views, 0) / hours
+    return velocities
+
+
+class StatsPoller:
+    """
+    속도 우선 통계 재수집기
+
+    우선순위 = (시간당 조회수 증가량 + 1) × 마지막 샘플 이후 경과 시간
+      - "마지막으로 본 뒤 놓친 조회수 추정치"로, 빠르게 크는 영상일수록 자주 뽑히고
+        느린 영상도 시간이 지나면 결국 다시 뽑힘
+      - 증가량은 최근 두 샘플 기준, 샘플이 부족하면 게시 후 평균 속도로 대신함
+      - 한 번도 샘플링하지 않은 영상이 가장 먼저
+      - min_interval 이내에 샘플링한 영상은 제외
+    """
+
+    def __init__(
+        self,
+        client,
+        budget_units: int = 200,
+        track_days: int = 14,
+        min_interval_minutes: int = 60
+    ):
+        self.client = client
+        self.budget_units = budget_units
+        self.track_days = track_days
+        self.min_interval_minutes = min_interval_minutes
+
+    def plan(self, db: Session, now: Optional[datetime] = None) -> List[str]:
+        """이번 실행에서 재수집할 영상 ID (우선순위 순, 예산 한도까지)"""
+        now = now or datetime.now(timezone.utc)
+        since = now - timedelta(days=self.track_days)
+
+        tracked = db.execute(
+            select(VideoData.video_id, VideoData.published_at, VideoData.view_count)
+            .where(VideoData.published_at >= since.replace(tzinfo=None))
+        ).all()
+        if not tracked:
+            return []
+
+        samples = latest_samples(db, since)
+        velocities = view_velocities(samples)
+        now_ts = now.timestamp()
+
+        video_ids = [row[0] for row in tracked]
+        published = np.array([_epoch_seconds(row[1]) for row in tracked])
+        views = np.array([row[2] or 0 for row in tracked], dtype=np.float64)
+        last_sampled = np.array([
+            samples[video_id][0][0] if video_id in samples else np.nan for video_id in video_ids
+        ])
+        velocity = np.array([velocities.get(video_id, np.nan) for video_id in video_ids])
+
+        # 샘플이 부족하면 게시 후 평균 속도
+        lifetime_hours = np.maximum((now_ts - np.nan_to_num(published, nan=now_ts)) / 3600.0, 1.0)
+        velocity = np.where(np.isnan(velocity), views / lifetime_hours, velocity)
+
+        hours_since = (now_ts - last_sampled) / 3600.0
+        priority = (velocity + 1.0) * hours_since
+        priority[np.isnan(last_sampled)] = np.inf
+        priority[hours_since < self.min_interval_minutes / 60.0] = -np.inf
+
+        eligible = np.flatnonzero(priority > -np.inf)
+        limit = self.budget_units // BATCH_COST * BATCH_SIZE
+        if len(eligible) > limit:
+            eligible = eligible[np.argpartition(-priority[eligible], limit - 1)[:limit]]
+        eligible = eligible[np.argsort(-priority[eligible], kind="stable")]
+
+        return [video_ids[i] for i in eligible]
+
+    def fetch(self, video_ids: List[str]) -> Tuple[List[Dict[str, Any]], int]:
+        """50개씩 statistics만 조회 → (통계 행 목록, 사용한 할당량)"""
+        stats: List[Dict[str, Any]] = []
+        units = 0
+
+        for i in range(0, len(video_ids), BATCH_SIZE):
+            batch = video_ids[i:i + BATCH_SIZE]
+            response = self.client.videos().list(part="statistics", id=",".join(batch)).execute()
+            units += BATCH_COST
+
+            for item in response.get("items", []):
+                statistics = item.get("statistics", {})
+                stats.append({
+                    "video_id": item["id"],
+                    "view_count": int(statistics.get("viewCount", 0)),
+                    "like_count": int(statistics.get("likeCount", 0)),
+                    "comment_count": int(statistics.get("commentCount", 0)),
+                })
+
+        return stats, units
+
+    def run(self, db: Session) -> Dict[str, Any]:
+        """
+        재수집 1회 실행
+
+        통계는 VideoStatsSnapshot에 추가하고, VideoData의 현재 통계도 같이 갱신합니다.
+        """
+        started = time.perf_counter()
+        captured_at = datetime.now(timezone.utc)
+
+        video_ids = self.plan(db, now=captured_at)
+        stats, units = self.fetch(video_ids)
+
+        if stats:
+            db.execute(insert(VideoStatsSnapshot), [{**row, "captured_at": captured_at} for row in stats])
+            # 테이블 수준 UPDATE + executemany (행마다 문장을 새로 만들지 않음)
+            table = VideoData.__table__
+            db.execute(
+                table.update()
+                .where(table.c.video_id == bindparam("b_video_id"))
+                .values(
+                    view_count=bindparam("b_view_count"),
+                    like_count=bindparam("b_like_count"),
+                    comment_count=bindparam("b_comment_count"),
+                ),
+                [{f"b_{key}": value for key, value in row.items()} for row in stats]
+            )
+            db.commit()
+
+        return {
+            "planned": len(video_ids),
+            "sampled": len(stats),
+            "missing": len(video_ids) - len(stats),  # 삭제/비공개 전환 등으로 응답에 없는 영상
+            "units_used": units,
+            "budget_units": self.budget_units,
+            "elapsed_seconds": round(time.perf_counter() - started, 2),
+        }
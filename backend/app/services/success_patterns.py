@@ -0,0 +1,201 @@
+"""
+성공 패턴 분석기
+분석 스냅샷 전체를 한 번의 벡터 연산으로 훑어
+영상 길이 구간별 / KST 요일×시각별 일평균 조회수와 신뢰구간을 계산합니다.
+"""
+import threading
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.analytics_snapshot import AnalyticsSnapshot
+
+WEEKDAY_NAMES = ["월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일"]
+
+# 영상 길이 구간 (초, 표시 이름)
+DURATION_BUCKETS: List[Tuple[int, int, str]] = [
+    (0, 60, "1분 미만 (쇼츠)"),
+    (60, 300, "1-5분"),
+    (300, 600, "5-10분"),
+    (600, 900, "10-15분"),
+    (900, 1200, "15-20분"),
+    (1200, 10 ** 9, "20분 이상"),
+]
+DURATION_EDGES = [low for low, _, _ in DURATION_BUCKETS] + [DURATION_BUCKETS[-1][1]]
+
+# 패턴으로 인정하기 위한 최소 영상 수
+MIN_SAMPLES = 5
+
+# 95% 신뢰구간
+Z_95 = 1.96
+
+
+def format_hour(hour: int) -> str:
+    if hour == 0:
+        return "자정"
+    if hour < 12:
+        return f"오전 {hour}시"
+    if hour == 12:
+        return "낮 12시"
+    return f"오후 {hour - 12}시"
+
+
+def _group_log_stats(keys: np.ndarray, log_values: np.ndarray, n_groups: int):
+    """그룹별 (개수, 로그 평균, 로그 표준오차)"""
+    valid = keys >= 0
+    keys = keys[valid]
+    log_values = log_values[valid]
+
+    counts = np.bincount(keys, minlength=n_groups)[:n_groups]
+    sums = np.bincount(keys, weights=log_values, minlength=n_groups)[:n_groups]
+    sq_sums = np.bincount(keys, weights=log_values ** 2, minlength=n_groups)[:n_groups]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        variances = (sq_sums - counts * means ** 2) / (counts - 1)
+        stderr = np.sqrt(np.clip(variances, 0, None) / counts)
+
+    return counts, means, stderr
+
+
+def compute_success_patterns(
+    view_count: np.ndarray,
+    duration: np.ndarray,
+    published_at: np.ndarray,
+    as_of: float,
+    utc_offset_hours: int = 9,
+    min_samples: int = MIN_SAMPLES,
+    top_slots: int = 5
+) -> Dict[str, Any]:
+    """
+    영상 배열로부터 성공 패턴 계산
+
+    - 지표: 일평균 조회수 = 조회수 / 게시 후 경과일(최소 1일)
+    - 분포가 크게 치우쳐 있어 log1p 공간에서 평균과 95% 신뢰구간을 구한 뒤 되돌림 (기하평균)
+    - 최적 구간은 신뢰구간 하한 기준으로 골라 표본이 적은 구간이 뽑히지 않도록 함
+
+    Args:
+        view_count, duration, published_at: 같은 길이의 배열 (published_at은 epoch 초, 결측은 음수)
+        as_of: 경과일 계산 기준 시각 (epoch 초)
+    """
+    published_at = np.asarray(published_at, dtype=np.int64)
+    duration = np.asarray(duration)
+    has_date = published_at >= 0
+
+    age_days = np.maximum((as_of - published_at) / 86400.0, 1.0)
+    views_per_day = np.asarray(view_count, dtype=np.float64) / age_days
+    log_vpd = np.log1p(np.clip(views_per_day, 0, None))
+
+    # 영상 길이 구간
+    n_buckets = len(DURATION_BUCKETS)
+    duration_keys = np.digitize(duration, DURATION_EDGES) - 1
+    duration_keys[(duration < 0) | (duration_keys >= n_buckets) | ~has_date] = -1
+
+    # KST 요일×시각 (168칸)
+    local = published_at + utc_offset_hours * 3600
+    slot_keys = ((local // 86400 + 3) % 7) * 24 + (local // 3600) % 24
+    slot_keys = np.where(has_date, slot_keys, -1)
+
+    def _summaries(keys, n_groups, labels):
+        counts, means, stderr = _group_log_stats(keys, log_vpd, n_groups)
+        rows = []
+        for i in np.flatnonzero(counts >= min_samples):
+            rows.append({
+                **labels(i),
+                "count": int(counts[i]),
+                "views_per_day": round(float(np.expm1(means[i])), 1),
+                "ci_low": round(float(np.expm1(means[i] - Z_95 * stderr[i])), 1),
+                "ci_high": round(float(np.expm1(means[i] + Z_95 * stderr[i])), 1),
+            })
+        return rows
+
+    durations = _summaries(duration_keys, n_buckets, lambda i: {"bucket": DURATION_BUCKETS[i][2]})
+    slots = _summaries(
+        slot_keys, 168,
+        lambda i: {
+            "weekday": int(i // 24),
+            "hour": int(i % 24),
+            "label": f"{WEEKDAY_NAMES[i // 24]} {format_hour(int(i % 24))}",
+        }
+    )
+    slots.sort(key=lambda row: row["ci_low"], reverse=True)
+
+    patterns: Dict[str, Any] = {
+        "sample_size": int(has_date.sum()),
+        "duration_buckets": durations,
+        "upload_slots": slots[:top_slots],
+    }
+    if durations:
+        patterns["optimal_length"] = max(durations, key=lambda row: row["ci_low"])["bucket"]
+    if slots:
+        patterns["best_upload_time"] = slots[0]["label"]
+
+    return patterns
+
+
+class SuccessPatternAnalyzer:
+    """
+    스냅샷 버전별 성공 패턴 캐시
+
+    get()/version은 캐시된 값만 읽고 계산하지 않습니다 (예측 요청 안에서 전체 스냅샷 계산을 하지 않도록).
+    check_interval초가 지났으면 스냅샷이 바뀌었는지 백그라운드 스레드에서 확인해 다시 계산하고,
+    스냅샷 내보내기 작업은 내보낸 직후 refresh()로 바로 계산합니다.
+    """
+
+    def __init__(self, snapshot_dir: str, check_interval: float = 60.0):
+        self.snapshot_dir = snapshot_dir
+        self.check_interval = check_interval
+        self._lock = Lock()
+        self._patterns: Optional[Dict[str, Any]] = None
+        self._version: Optional[str] = None
+        self._checked_at = 0.0
+
+    @property
+    def version(self) -> Optional[str]:
+        """현재 패턴이 계산된 스냅샷 버전 (없으면 None)"""
+        return self._version
+
+    def get(self) -> Optional[Dict[str, Any]]:
+        """최신 스냅샷 기준 성공 패턴 (아직 계산 전이거나 스냅샷이 없으면 None)"""
+        if time.time() - self._checked_at >= self.check_interval:
+            self.refresh(background=True)
+        return self._patterns
+
+    def refresh(self, background: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        스냅샷이 바뀌었으면 성공 패턴을 다시 계산
+
+        background=True면 별도 스레드에서 실행하고 바로 반환합니다 (요청 핸들러/앱 시작용).
+        """
+        if background:
+            self._checked_at = time.time()
+            threading.Thread(target=self.refresh, name="success-patterns", daemon=True).start()
+            return self._patterns
+
+        with self._lock:
+            self._checked_at = time.time()
+            try:
+                snapshot = AnalyticsSnapshot.open_current(self.snapshot_dir)
+                if snapshot is None or snapshot.version == self._version:
+                    return self._patterns
+
+                patterns = compute_success_patterns(
+                    snapshot.column("view_count"),
+                    snapshot.column("duration"),
+                    snapshot.column("published_at"),
+                    as_of=snapshot.meta["exported_at"],
+                )
+                patterns["version"] = snapshot.version
+                self._patterns = patterns
+                self._version = snapshot.version
+            except Exception as e:
+                print(f"❌ 성공 패턴 계산 오류: {e}")
+
+            return self._patterns
+
+
+# 전역 인스턴스
+success_pattern_analyzer = SuccessPatternAnalyzer(settings.ANALYTICS_SNAPSHOT_DIR)
@@ -0,0 +1,228 @@
+"""
+한/영 혼합 텍스트 피처 추출
+문자 n-gram + 해싱 트릭으로 고정 차원의 희소 벡터를 만듭니다.
+"""
+import re
+import unicodedata
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+# 한글/영문/숫자만 남기고 공백·기호·이모지는 제거 ("내 돈 내 산" → "내돈내산")
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_for_ngrams(text: str) -> str:
+    """NFC 정규화 + 소문자 + 공백/기호 제거"""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFC", text).lower()
+    return _NON_WORD_RE.sub("", text)
+
+
+# 키워드 토큰 분리: 공백/기호 기준, 해시태그(#)는 떼어냄
+_TOKEN_SPLIT_RE = re.compile(r"[^\w]+", re.UNICODE)
+
+# 트렌드 키워드에서 제외할 불용어
+KEYWORD_STOPWORDS = frozenset({
+    "the", "and", "for", "with", "you", "my", "of", "in", "to", "a", "is", "on",
+    "shorts", "short", "vlog", "ep", "feat",
+    "그리고", "하는", "있는", "없는", "이런", "저런", "그냥", "진짜", "완전", "정말", "너무",
+})
+
+
+def tokenize_keywords(title: str, tags: Optional[Iterable[str]] = None) -> List[str]:
+    """
+    제목/태그에서 트렌드 키워드 후보 추출 (영상 단위 중복 제거)
+
+    - 제목은 공백/기호 기준으로 단어 분리
+    - 태그는 공백을 제거한 하나의 키워드로 취급 ("퍼스널 컬러" → "퍼스널컬러")
+    - 2글자 미만, 숫자만 있는 토큰, 불용어 제외
+    """
+    seen = set()
+    keywords = []
+
+    candidates = _TOKEN_SPLIT_RE.split(unicodedata.normalize("NFC", title or "").lower())
+    candidates.extend(normalize_for_ngrams(tag) for tag in tags or [])
+
+    for token in candidates:
+        token = token.strip("_")
+        if len(token) < 2 or token.isdigit() or token in KEYWORD_STOPWORDS or token in seen:
+            continue
+        seen.add(token)
+        keywords.append(token)
+
+    return keywords
+
+
+class SparseRows(NamedTuple):
+    """CSR 형식의 희소 행렬 (scipy 없이 numpy 배열만 사용)"""
+    indptr: np.ndarray  # (n_rows + 1,) int64
+    indices: np.ndarray  # (nnz,) int32, 행 안에서 오름차순
+    data: np.ndarray  # (nnz,) float32
+    n_features: int
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        start, end = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:end], self.data[start:end]
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros((self.n_rows, self.n_features), dtype=np.float32)
+        rows = np.repeat(np.arange(self.n_rows), np.diff(self.indptr))
+        dense[rows, self.indices] = self.data
+        return dense
+
+    def dot_row(self, indices: np.ndarray, data: np.ndarray) -> np.ndarray:
+        """모든 행과 하나의 희소 벡터의 내적 (정규화된 벡터면 코사인 유사도)"""
+        if not len(indices):
+            return np.zeros(self.n_rows, dtype=np.float32)
+        order = np.argsort(indices)
+        q_indices, q_data = indices[order], data[order]
+        pos = np.minimum(np.searchsorted(q_indices, self.indices), len(q_indices) - 1)
+        weights = np.where(q_indices[pos] == self.indices, q_data[pos], 0.0)
+        products = self.data * weights
+        return np.add.reduceat(
+            np.append(products, 0.0), self.indptr[:-1]
+        ).astype(np.float32) * (np.diff(self.indptr) > 0)
+
+
+class HashingNgramVectorizer:
+    """
+    문자 n-gram 해싱 벡터라이저
+
+    - 기본 2~4-gram, 2^18 차원
+    - 해시는 zlib.crc32 를 사용해 프로세스/실행마다 결과가 동일
+      (파이썬 내장 hash()는 PYTHONHASHSEED에 따라 달라지므로 사용하지 않음)
+    - 해시 충돌 편향을 줄이기 위해 부호 해싱(alternate sign) 적용
+    - 행 단위 L2 정규화
+    """
+
+    # n-gram → 해시 코드 메모이제이션 최대 크기
+    MAX_MEMO_SIZE = 1_000_000
+
+    def __init__(
+        self,
+        n_features: int = 2 ** 18,
+        ngram_range: Tuple[int, int] = (2, 4),
+        alternate_sign: bool = True,
+        normalize: bool = True
+    ):
+        if not 0 < n_features <= 2 ** 30:
+            raise ValueError("n_features는 1 이상 2^30 이하여야 합니다.")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError(f"잘못된 ngram_range입니다: {ngram_range}")
+
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.alternate_sign = alternate_sign
+        self.normalize = normalize
+        # 해시 코드 = (인덱스 << 1) | 음수 부호 여부
+        self._memo: Dict[str, int] = {}
+
+    def ngrams(self, text: str) -> List[str]:
+        """정규화된 텍스트의 문자 n-gram 목록"""
+        compact = normalize_for_ngrams(text)
+        min_n, max_n = self.ngram_range
+        grams = []
+        length = len(compact)
+
+        # n-gram보다 짧은 텍스트는 텍스트 전체를 하나의 토큰으로 사용
+        if 0 < length < min_n:
+            return [compact]
+
+        for n in range(min_n, max_n + 1):
+            grams.extend([compact[i:i + n] for i in range(length - n + 1)])
+        return grams
+
+    def _hash(self, gram: str) -> int:
+        cached = self._memo.get(gram)
+        if cached is not None:
+            return cached
+
+        h = zlib.crc32(gram.encode("utf-8"))
+        negative = 1 if self.alternate_sign and (h >> 31) else 0
+        code = ((h % self.n_features) << 1) | negative
+
+        if len(self._memo) >= self.MAX_MEMO_SIZE:
+            self._memo.clear()
+        self._memo[gram] = code
+        return code
+
+    def transform(self, texts: Iterable[str]) -> SparseRows:
+        """
+        텍스트 배치를 희소 행렬로 변환
+
+        n-gram 해싱 후 (행, 열) 정렬과 중복 합산, 정규화는 배치 전체에 대해 한 번에 수행합니다.
+        """
+        counts: List[int] = []
+        hashed: List[int] = []
+        memo = self._memo
+
+        for text in texts:
+            grams = self.ngrams(text)
+            counts.append(len(grams))
+            # 다른 스레드의 _hash()가 메모를 비울 수 있으므로 확인과 조회를 한 번에 (get)
+            hashed.extend([code if (code := memo.get(gram)) is not None else self._hash(gram) for gram in grams])
+
+        n_rows = len(counts)
+        if not hashed:
+            return SparseRows(
+                indptr=np.zeros(n_rows + 1, dtype=np.int64),
+                indices=np.zeros(0, dtype=np.int32),
+                data=np.zeros(0, dtype=np.float32),
+                n_features=self.n_features,
+            )
+
+        codes = np.fromiter(hashed, dtype=np.int64, count=len(hashed))
+        rows_arr = np.repeat(np.arange(n_rows, dtype=np.int64), counts)
+        cols_arr = codes >> 1
+        vals_arr = (1 - 2 * (codes & 1)).astype(np.float32)
+
+        # (행, 열) 기준 정렬 후 같은 칸끼리 합산
+        keys = rows_arr * self.n_features + cols_arr
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        vals_arr = vals_arr[order]
+
+        boundaries = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        summed = np.add.reduceat(vals_arr, boundaries)
+        unique_keys = keys[boundaries]
+
+        # 부호 해싱으로 0이 된 칸은 제거
+        nonzero = summed != 0
+        summed = summed[nonzero]
+        unique_keys = unique_keys[nonzero]
+
+        out_rows = unique_keys // self.n_features
+        out_cols = (unique_keys % self.n_features).astype(np.int32)
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(out_rows, minlength=n_rows), out=indptr[1:])
+
+        if self.normalize and len(summed):
+            norms = np.sqrt(np.bincount(out_rows, weights=summed.astype(np.float64) ** 2, minlength=n_rows))
+            summed = (summed / norms[out_rows]).astype(np.float32)
+
+        return SparseRows(indptr=indptr, indices=out_cols, data=summed.astype(np.float32), n_features=self.n_features)
+
+    def transform_one(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """단일 텍스트 변환 (indices, data)"""
+        return self.transform([text]).row(0)
+
+    def similarity(self, text_a: str, text_b: str) -> float:
+        """두 텍스트의 코사인 유사도 (normalize=True 기준)"""
+        matrix = self.transform([text_a, text_b])
+        idx_a, val_a = matrix.row(0)
+        idx_b, val_b = matrix.row(1)
+        common, pos_a, pos_b = np.intersect1d(idx_a, idx_b, assume_unique=True, return_indices=True)
+        if not len(common):
+            return 0.0
+        return float(np.dot(val_a[pos_a], val_b[pos_b]))
+
+
+# 전역 인스턴스 (기본 설정, 프로세스 간 동일한 결과 보장)
+title_vectorizer = HashingNgramVectorizer()
@@ -0,0 +1,223 @@
+"""
+실시간 트렌딩 키워드 엔진
+Space-Saving 알고리즘으로 조회수 가중 상위 키워드를 고정 메모리에서 추적합니다.
+"""
+import heapq
+import threading
+import time
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.text_features import tokenize_keywords
+
+
+class _Counter:
+    """키워드별 카운터 (weight: 조회수 합 추정치, error: 과대추정 상한, count: 영상 수)"""
+    __slots__ = ("weight", "error", "count")
+
+    def __init__(self, weight: float, error: float, count: int):
+        self.weight = weight
+        self.error = error
+        self.count = count
+
+
+class TrendEngine:
+    """
+    조회수 가중 Heavy-Hitters 엔진 (Weighted Space-Saving)
+
+    - 카운터 수가 capacity를 넘지 않으므로 코퍼스 크기와 무관하게 메모리 고정
+    - 가득 찬 상태에서 새 키워드가 들어오면 가장 작은 카운터를 교체
+      (교체된 카운터의 값은 error로 남겨 과대추정 폭을 기록)
+    - 상위 K 결과는 갱신이 있을 때만 다시 계산하고, 그 외 조회는 캐시된 목록 슬라이스
+    """
+
+    def __init__(self, capacity: int = 2000):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+
+        self.capacity = capacity
+        self._counters: Dict[str, _Counter] = {}
+        # 최소 카운터 탐색용 힙 (weight, keyword) - 갱신 시 지연 삭제
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = Lock()
+        self._ranked: Optional[List[Dict[str, Any]]] = None
+
+        self.videos_ingested = 0
+        self.last_rebuild_at: Optional[float] = None
+
+    def _pop_min(self) -> Tuple[str, _Counter]:
+        """현재 가장 작은 카운터 반환 (오래된 힙 항목은 건너뜀)"""
+        while True:
+            weight, keyword = heapq.heappop(self._heap)
+            counter = self._counters.get(keyword)
+            if counter is not None and counter.weight == weight:
+                return keyword, counter
+
+    def _push(self, keyword: str, counter: _Counter) -> None:
+        heapq.heappush(self._heap, (counter.weight, keyword))
+
+        # 지연 삭제로 쌓인 힙 항목 정리
+        if len(self._heap) > self.capacity * 4:
+            self._heap = [(c.weight, k) for k, c in self._counters.items()]
+            heapq.heapify(self._heap)
+
+    def _update(self, keyword: str, weight: float) -> None:
+        counter = self._counters.get(keyword)
+
+        if counter is not None:
+            counter.weight += weight
+            counter.count += 1
+        elif len(self._counters) < self.capacity:
+            counter = _Counter(weight, 0.0, 1)
+            self._counters[keyword] = counter
+        else:
+            evicted_keyword, evicted = self._pop_min()
+            del self._counters[evicted_keyword]
+            counter = _Counter(evicted.weight + weight, evicted.weight, 1)
+            self._counters[keyword] = counter
+
+        self._push(keyword, counter)
+
+    def add_video(self, title: str, tags: Optional[Iterable[str]], view_count: int) -> None:
+        """영상 한 개 반영 (키워드마다 조회수만큼 가중)"""
+        weight = float(max(view_count or 0, 1))
+        keywords = tokenize_keywords(title, tags)
+
+        with self._lock:
+            for keyword in keywords:
+                self._update(keyword, weight)
+            self.videos_ingested += 1
+            self._ranked = None
+
+    def ingest(self, videos: Iterable[Dict[str, Any]]) -> int:
+        """수집된 영상 dict 목록 반영 (title, tags, view_count 사용)"""
+        count = 0
+        for video in videos:
+            self.add_video(video.get("title", ""), video.get("tags"), video.get("view_count", 0))
+            count += 1
+        return count
+
+    def _rank(self) -> List[Dict[str, Any]]:
+        ranked = self._ranked
+        if ranked is not None:
+            return ranked
+
+        with self._lock:
+            items = sorted(self._counters.items(), key=lambda item: item[1].weight, reverse=True)
+            top_weight = items[0][1].weight if items else 1.0
+
+            ranked = [
+                {
+                    "keyword": keyword,
+                    "impact_score": round(counter.weight / top_weight, 4),
+                    "video_count": counter.count,
+                    # 교체로 물려받은 값(error)은 빼고 실제 관측된 조회수 기준 평균
+                    "avg_views": round((counter.weight - counter.error) / counter.count, 1),
+                    "error_bound": counter.error,
+                }
+                for keyword, counter in items
+            ]
+            self._ranked = ranked
+
+        return ranked
+
+    def top_k(self, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        상위 K 키워드
+
+        Returns:
+            TrendKeyword 형식 dict 리스트 (keyword, impact_score, video_count, avg_views)
+        """
+        return [
+            {key: value for key, value in item.items() if key != "error_bound"}
+            for item in self._rank()[:k]
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._heap.clear()
+            self._ranked = None
+            self.videos_ingested = 0
+
+    def rebuild_from_db(self, db, batch_size: int = 1000) -> int:
+        """
+        VideoData 전체를 다시 읽어 엔진 재구성
+
+        Args:
+            db: SQLAlchemy 세션
+            batch_size: 한 번에 가져올 행 수
+
+        Returns:
+            반영한 영상 수
+        """
+        from app.models.models import VideoData
+
+        rows = db.query(VideoData.title, VideoData.tags, VideoData.view_count)\
+            .execution_options(yield_per=batch_size)
+
+        fresh = TrendEngine(capacity=self.capacity)
+        count = 0
+        for title, tags, view_count in rows:
+            fresh.add_video(title, tags, view_count)
+            count += 1
+
+        # 재구성이 끝난 뒤 한 번에 교체 (재구성 중에도 기존 결과로 응답)
+        with self._lock:
+            self._counters = fresh._counters
+            self._heap = fresh._heap
+            self._ranked = None
+            self.videos_ingested = fresh.videos_ingested
+            self.last_rebuild_at = time.time()
+
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "capacity": self.capacity,
+            "tracked_keywords": len(self._counters),
+            "videos_ingested": self.videos_ingested,
+            "last_rebuild_at": self.last_rebuild_at,
+        }
+
+
+# 전역 인스턴스
+trend_engine = TrendEngine(capacity=settings.TREND_ENGINE_CAPACITY)
+_last_refresh_attempt: Optional[float] = None
+
+
+def refresh_trend_engine(max_age_minutes: Optional[int] = None, background: bool = False) -> None:
+    """
+    마지막 재구성 후 max_age_minutes가 지났으면 DB에서 다시 구성
+
+    수집기(cron)가 별도 프로세스에서 저장한 영상도 반영하기 위해 사용합니다.
+    background=True면 재구성을 별도 스레드에서 실행하고 바로 반환합니다 (요청 핸들러용).
+    """
+    global _last_refresh_attempt
+
+    if max_age_minutes is None:
+        max_age_minutes = settings.TREND_ENGINE_REFRESH_MINUTES
+
+    now = time.time()
+    if _last_refresh_attempt is not None and now - _last_refresh_attempt < max_age_minutes * 60:
+        return
+    _last_refresh_attempt = now
+
+    if background:
+        threading.Thread(target=_rebuild_trend_engine, name="trend-engine-rebuild", daemon=True).start()
+    else:
+        _rebuild_trend_engine()
+
+
+def _rebuild_trend_engine() -> None:
+    from app.db.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        count = trend_engine.rebuild_from_db(db)
+        print(f"✅ 트렌드 엔진 재구성 완료: 영상 {count}개")
+    except Exception as e:
+        print(f"❌ 트렌드 엔진 재구성 오류: {e}")
+    finally:
+        db.close()
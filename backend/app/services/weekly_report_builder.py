@@ -0,0 +1,197 @@
+"""
+주간 AI 리포트 생성기
+ISO 주차 단위로 VideoData를 한 번 훑어 키워드/성공 패턴/급상승 트렌드를 계산하고
+마크다운/HTML까지 미리 렌더링해 WeeklyReport 행으로 저장합니다.
+"""
+import html
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.models import VideoData, WeeklyReport
+from app.services.rising_trends import RisingTrendDetector
+from app.services.success_patterns import compute_success_patterns
+from app.services.text_features import tokenize_keywords
+from app.services.trend_engine import TrendEngine
+
+KST = timezone(timedelta(hours=9))
+
+
+def current_iso_week(now: Optional[datetime] = None) -> Tuple[int, int]:
+    """KST 기준 현재 (ISO 연도, 주차)"""
+    now = now or datetime.now(KST)
+    iso = now.astimezone(KST).isocalendar()
+    return iso[0], iso[1]
+
+
+def iso_week_range(year: int, week: int) -> Tuple[datetime, datetime]:
+    """ISO 주차의 [시작, 끝) 시각 (KST 월요일 00시 기준)"""
+    monday = date.fromisocalendar(year, week, 1)
+    start = datetime(monday.year, monday.month, monday.day, tzinfo=KST)
+    return start, start + timedelta(days=7)
+
+
+class WeeklyReportBuilder:
+    """주간 리포트 생성기"""
+
+    # 급상승 판단 기준선 (직전 몇 주 평균과 비교)
+    RISING_BASELINE_WEEKS = 4
+
+    def __init__(self, db: Session, keyword_limit: int = 10, rising_limit: int = 10):
+        self.db = db
+        self.keyword_limit = keyword_limit
+        self.rising_limit = rising_limit
+
+    def compute(self, year: int, week: int) -> Dict[str, Any]:
+        """
+        해당 주차 데이터를 한 번만 순회하며 집계
+
+        급상승 트렌드는 그 주차 영상과 직전 RISING_BASELINE_WEEKS주 영상을 함께 읽어
+        주차 끝 시각 기준으로 계산합니다 (지난 주차를 다시 만들어도 그 주의 급상승 키워드).
+
+        Returns:
+            top_keywords, success_patterns, rising_trends, total_videos_analyzed
+        """
+        start, end = iso_week_range(year, week)
+        baseline_start = start - timedelta(weeks=self.RISING_BASELINE_WEEKS)
+        start_utc = start.astimezone(timezone.utc).replace(tzinfo=None)
+
+        keywords = TrendEngine(capacity=1000)
+        rising = RisingTrendDetector(
+            n_buckets=(self.RISING_BASELINE_WEEKS + 1) * 7 * 24,
+            window_hours=7 * 24,
+        )
+        total = 0
+
+        # 성공 패턴 계산용 (그 주차 영상만)
+        view_counts: List[int] = []
+        durations: List[int] = []
+        published: List[int] = []
+
+        rows = self.db.query(
+            VideoData.title, VideoData.tags, VideoData.view_count, VideoData.duration, VideoData.published_at
+        ).filter(
+            VideoData.published_at >= baseline_start.astimezone(timezone.utc).replace(tzinfo=None),
+            VideoData.published_at < end.astimezone(timezone.utc).replace(tzinfo=None)
+        ).execution_options(yield_per=1000)
+
+        for title, tags, view_count, duration, published_at in rows:
+            rising.add(tokenize_keywords(title, tags), at=published_at)
+            if published_at < start_utc:
+                continue
+            total += 1
+            keywords.add_video(title, tags, view_count or 0)
+            view_counts.append(view_count or 0)
+            durations.append(duration if duration is not None else -1)
+            published.append(int(published_at.replace(tzinfo=timezone.utc).timestamp()))
+
+        # 지난 주차는 주차 끝, 이번 주는 현재 시각 기준 경과일
+        as_of = min(end, datetime.now(KST)).timestamp()
+
+        return {
+            "top_keywords": keywords.top_k(self.keyword_limit),
+            "success_patterns": self._success_patterns(view_counts, durations, published, as_of),
+            # 주차 마지막 시간 버킷까지를 윈도우로 (end 시각 버킷은 다음 주차)
+            "rising_trends": [
+                item["keyword"] for item in rising.rising(self.rising_limit, now=end - timedelta(seconds=1))
+            ],
+            "total_videos_analyzed": total,
+        }
+
+    def _success_patterns(self, view_counts: List[int], durations: List[int], published: List[int],
+                          as_of: float) -> Dict[str, Any]:
+        """해당 주차에 게시된 영상 기준 성공 패턴 (전체 스냅샷 패턴은 예측 API에서 사용)"""
+        patterns = compute_success_patterns(
+            np.array(view_counts, dtype=np.int64),
+            np.array(durations, dtype=np.int64),
+            np.array(published, dtype=np.int64),
+            as_of=as_of,
+        )
+        return {
+            key: patterns[key]
+            for key in ("optimal_length", "best_upload_time", "duration_buckets", "upload_slots", "sample_size")
+            if key in patterns
+        }
+
+    def render_markdown(self, year: int, week: int, data: Dict[str, Any]) -> str:
+        lines = [
+            f"# {year}년 {week}주차 뷰티 트렌드 리포트",
+            "",
+            f"분석 영상 수: {data['total_videos_analyzed']:,}개",
+            "",
+            "## 🔥 인기 키워드",
+        ]
+        for i, item in enumerate(data["top_keywords"], 1):
+            lines.append(
+                f"{i}. **{item['keyword']}** - 영상 {item['video_count']:,}개, 평균 조회수 {item['avg_views']:,.0f}회"
+            )
+        if not data["top_keywords"]:
+            lines.append("- 집계된 키워드가 없습니다.")
+
+        lines += ["", "## 🎯 성공 패턴"]
+        patterns = data["success_patterns"]
+        if patterns.get("optimal_length"):
+            lines.append(f"- 최적 영상 길이: {patterns['optimal_length']}")
+        if patterns.get("best_upload_time"):
+            lines.append(f"- 최적 업로드 시간: {patterns['best_upload_time']}")
+        if not patterns:
+            lines.append("- 패턴을 계산하기에 데이터가 부족합니다.")
+
+        lines += ["", "## 📈 떠오르는 트렌드"]
+        lines += [f"- {keyword}" for keyword in data["rising_trends"]] or ["- 급상승 키워드가 없습니다."]
+
+        return "\n".join(lines) + "\n"
+
+    def render_html(self, year: int, week: int, data: Dict[str, Any]) -> str:
+        esc = html.escape
+        keyword_items = "".join(
+            f"<li><strong>{esc(item['keyword'])}</strong> - 영상 {item['video_count']:,}개, "
+            f"평균 조회수 {item['avg_views']:,.0f}회</li>"
+            for item in data["top_keywords"]
+        ) or "<li>집계된 키워드가 없습니다.</li>"
+
+        patterns = data["success_patterns"]
+        pattern_items = "".join(
+            f"<li>{esc(label)}: {esc(str(patterns[key]))}</li>"
+            for key, label in (("optimal_length", "최적 영상 길이"), ("best_upload_time", "최적 업로드 시간"))
+            if patterns.get(key)
+        ) or "<li>패턴을 계산하기에 데이터가 부족합니다.</li>"
+
+        rising_items = "".join(
+            f"<li>{esc(keyword)}</li>" for keyword in data["rising_trends"]
+        ) or "<li>급상승 키워드가 없습니다.</li>"
+
+        return (
+            f"<h1>{year}년 {week}주차 뷰티 트렌드 리포트</h1>"
+            f"<p>분석 영상 수: {data['total_videos_analyzed']:,}개</p>"
+            f"<h2>🔥 인기 키워드</h2><ol>{keyword_items}</ol>"
+            f"<h2>🎯 성공 패턴</h2><ul>{pattern_items}</ul>"
+            f"<h2>📈 떠오르는 트렌드</h2><ul>{rising_items}</ul>"
+        )
+
+    def build(self, year: int, week: int) -> WeeklyReport:
+        """주간 리포트 계산 후 저장 (같은 주차가 있으면 갱신)"""
+        data = self.compute(year, week)
+
+        report = self.db.query(WeeklyReport).filter(
+            WeeklyReport.year == year,
+            WeeklyReport.week_number == week
+        ).first()
+
+        if report is None:
+            report = WeeklyReport(year=year, week_number=week)
+            self.db.add(report)
+
+        report.top_keywords = data["top_keywords"]
+        report.success_patterns = data["success_patterns"]
+        report.rising_trends = data["rising_trends"]
+        report.total_videos_analyzed = data["total_videos_analyzed"]
+        report.report_markdown = self.render_markdown(year, week, data)
+        report.report_html = self.render_html(year, week, data)
+        report.generated_at = datetime.now(timezone.utc)
+
+        self.db.commit()
+        self.db.refresh(report)
+        return report
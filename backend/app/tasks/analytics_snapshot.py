@@ -0,0 +1,39 @@
+"""
+분석 스냅샷 내보내기 작업
+VideoData를 컬럼형 스냅샷으로 내보냅니다. (Cron Job 또는 일일 수집 후 호출)
+"""
+import time
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services.analytics_snapshot import export_snapshot
+from app.services.success_patterns import success_pattern_analyzer
+
+
+def run_snapshot_export():
+    """VideoData → 컬럼형 스냅샷"""
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        version = export_snapshot(
+            db,
+            settings.ANALYTICS_SNAPSHOT_DIR,
+            keep=settings.ANALYTICS_SNAPSHOT_KEEP
+        )
+        elapsed = time.perf_counter() - started
+        print(f"✅ 분석 스냅샷 생성 완료: {version} ({elapsed:.1f}초)")
+        
+        # 같은 프로세스의 성공 패턴도 새 스냅샷 기준으로 바로 다시 계산 (예측 요청은 계산된 값만 읽음)
+        success_pattern_analyzer.refresh()
+        return version
+    except Exception as e:
+        print(f"❌ 분석 스냅샷 생성 오류: {e}")
+        return None
+    finally:
+        db.close()
+
+
+# CLI 실행용
+if __name__ == "__main__":
+    run_snapshot_export()
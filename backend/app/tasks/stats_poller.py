@@ -0,0 +1,43 @@
+"""
+영상 통계 재수집 작업
+추적 중인 영상의 통계를 다시 가져와 조회수 증가 속도 시계열을 쌓습니다. (Cron Job, 매시간 권장)
+"""
+from googleapiclient.discovery import build
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.services.stats_poller import StatsPoller
+
+
+def run_stats_poll():
+    """속도 우선순위로 통계 재수집 1회"""
+    if not settings.YOUTUBE_API_KEY:
+        print("❌ YOUTUBE_API_KEY가 설정되지 않았습니다.")
+        return None
+
+    db = SessionLocal()
+
+    try:
+        poller = StatsPoller(
+            build('youtube', 'v3', developerKey=settings.YOUTUBE_API_KEY, cache_discovery=False),
+            budget_units=settings.STATS_POLL_BUDGET_UNITS,
+            track_days=settings.STATS_POLL_TRACK_DAYS,
+            min_interval_minutes=settings.STATS_POLL_MIN_INTERVAL_MINUTES,
+        )
+        result = poller.run(db)
+        print(
+            f"✅ 통계 재수집 완료: {result['sampled']}/{result['planned']}개 "
+            f"(할당량 {result['units_used']}/{result['budget_units']}, {result['elapsed_seconds']}초)"
+        )
+        return result
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 통계 재수집 오류: {e}")
+        return None
+    finally:
+        db.close()
+
+
+# CLI 실행용
+if __name__ == "__main__":
+    run_stats_poll()
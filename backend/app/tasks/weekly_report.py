@@ -0,0 +1,42 @@
+"""
+주간 리포트 생성 작업
+Cron Job에서 매일 호출해 이번 주 리포트를 갱신하고, 주가 바뀐 직후에는 지난주 리포트를 확정합니다.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.db.database import SessionLocal
+from app.services.weekly_report_builder import KST, WeeklyReportBuilder, current_iso_week
+
+
+def run_weekly_report(year: Optional[int] = None, week: Optional[int] = None):
+    """
+    주간 리포트 생성
+
+    Args:
+        year, week: 대상 ISO 주차 (기본값: 이번 주 + 월요일에는 지난주도 함께)
+    """
+    if year and week:
+        targets = [(year, week)]
+    else:
+        now = datetime.now(KST)
+        targets = [current_iso_week(now)]
+        if now.weekday() == 0:
+            targets.insert(0, current_iso_week(now - timedelta(days=7)))
+
+    db = SessionLocal()
+    try:
+        builder = WeeklyReportBuilder(db)
+        for target_year, target_week in targets:
+            report = builder.build(target_year, target_week)
+            print(f"✅ {target_year}년 {target_week}주차 리포트 생성 완료 (영상 {report.total_videos_analyzed}개)")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 주간 리포트 생성 오류: {e}")
+    finally:
+        db.close()
+
+
+# CLI 실행용
+if __name__ == "__main__":
+    run_weekly_report()
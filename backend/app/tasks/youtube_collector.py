@@ -4,14 +4,30 @@ YouTube Data API v3 정책을 완벽히 준수하는 데이터 수집 시스템
 """
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 import time
 import os
 
 from app.core.config import settings
-from app.db.database import SessionLocal
-from app.models.models import VideoData
+from app.db.database import SessionLocal, engine
+from app.db.retention import delete_in_chunks, ensure_index, record_retention_run
+from app.models.models import VideoData, VideoStatsSnapshot
+from app.services.collection_pipeline import CollectionPipeline
+from app.services.collection_planner import SEARCH_COST, CollectionPlanner, get_collection_api_keys
+from app.services.ingestion import IngestionService, TrendEngineSink, VideoDataSink, VideoReportSink
+from app.services.known_ids import KnownVideoIndex, known_report_index, known_video_index
+from app.tasks.analytics_snapshot import run_snapshot_export
+from app.tasks.weekly_report import run_weekly_report
+
+# 급상승 영상 중 분석 리포트를 만들 영상 (카테고리 26은 뷰티 외 How-to/스타일 영상도 포함하므로 제목으로 한 번 더 거름)
+REPORT_BEAUTY_KEYWORDS = ['메이크업', '뷰티', '화장', '스킨케어', '피부', '립스틱', '파운데이션', '아이섀도', '블러쉬', '마스카라']
+
+
+def is_beauty_video(record: Dict) -> bool:
+    title = record.get('title') or ''
+    return any(keyword in title for keyword in REPORT_BEAUTY_KEYWORDS)
+
 
 class YouTubeCollector:
     """
@@ -32,6 +48,7 @@ class YouTubeCollector:
         self.youtube = build('youtube', 'v3', developerKey=self.api_key)
         self.quota_used = 0
         self.quota_limit = settings.YOUTUBE_QUOTA_LIMIT
+        self.last_plan_report: List[Dict] = []
     
     def search_beauty_videos(self, max_results: int = 50, published_after: Optional[datetime] = None) -> List[str]:
         """
@@ -76,6 +93,63 @@ class YouTubeCollector:
             print(f"❌ YouTube API 오류: {e}")
             return []
     
+    def plan_search(self, days: int = 7) -> List[str]:
+        """
+        수집 계획기로 여러 검색어를 검색해 새 영상 ID 목록 반환
+        
+        검색 예산은 COLLECTION_SEARCH_BUDGET과 남은 할당량 중 작은 값이며,
+        상세 조회(videos.list) 몫으로 검색 페이지 100개당 1포인트를 남겨 둡니다.
+        """
+        published_after = datetime.now(timezone.utc) - timedelta(days=days)
+        result = self._build_planner().run(
+            published_after=published_after,
+            known_ids=self._known_video_ids()
+        )
+        self.quota_used += result["units_used"]
+        self.last_plan_report = result["queries"]
+        
+        return result["video_ids"]
+    
+    def _build_planner(self) -> CollectionPlanner:
+        remaining = self.quota_limit - self.quota_used
+        budget = min(settings.COLLECTION_SEARCH_BUDGET, remaining * SEARCH_COST // (SEARCH_COST + 1))
+        
+        return CollectionPlanner(
+            get_collection_api_keys() or [self.api_key],
+            budget_units=budget,
+            min_new_ratio=settings.COLLECTION_MIN_NEW_RATIO,
+            patience=settings.COLLECTION_PATIENCE,
+        )
+    
+    def run_pipeline(self, days: int = 7) -> Dict:
+        """
+        검색 → 상세 조회 → 파싱 → 저장을 스트리밍 파이프라인으로 실행
+        
+        중간에 중단되면 같은 날 다시 실행했을 때 체크포인트에서 이어서 처리합니다.
+        """
+        pipeline = CollectionPipeline(
+            self,
+            self._build_planner(),
+            checkpoint_path=settings.COLLECTION_CHECKPOINT_PATH,
+            queue_size=settings.COLLECTION_QUEUE_SIZE,
+            persist_chunk_size=settings.VIDEO_UPSERT_CHUNK_SIZE,
+            days=days,
+        )
+        result = pipeline.run(known_ids=self._known_video_ids())
+        self.last_plan_report = result["plan"]
+        
+        return result
+    
+    def _known_video_ids(self) -> KnownVideoIndex:
+        """
+        VideoData에 이미 저장한 영상 ID 필터 (계획기가 새 영상만 세고, 아는 영상은 상세 조회 전에 거르도록)
+        
+        파일이 오래됐으면 VideoData에서 재구성합니다.
+        """
+        known_video_index.ensure_ready(settings.KNOWN_IDS_MAX_AGE_HOURS)
+        known_video_index.reload_if_changed()
+        return known_video_index
+    
     def get_video_details(self, video_ids: List[str]) -> List[Dict]:
         """
         영상 상세 정보 조회 (일괄 처리)
@@ -95,32 +169,40 @@ class YouTubeCollector:
         
         for i in range(0, len(video_ids), batch_size):
             batch = video_ids[i:i+batch_size]
-            
-            try:
-                request = self.youtube.videos().list(
-                    part="snippet,statistics,contentDetails",
-                    id=",".join(batch)
-                )
-                
-                response = request.execute()
-                self.quota_used += 1  # videos.list = 1 포인트
-                
-                for item in response.get('items', []):
-                    video_data = self._parse_video_item(item)
-                    all_videos.append(video_data)
-                
-                print(f"✅ {len(batch)}개 영상 상세 정보 조회 완료 (할당량: {self.quota_used}/{self.quota_limit})")
-                
-                # API 호출 간 짧은 대기 (Rate Limiting 방지)
-                time.sleep(0.1)
-                
-            except HttpError as e:
-                print(f"❌ 영상 정보 조회 오류: {e}")
-                # 지수 백오프: 에러 발생 시 대기 후 재시도
-                time.sleep(2)
+            items = self.fetch_video_items(batch) or []
+            all_videos.extend(self._parse_video_item(item) for item in items)
         
         return all_videos
     
+    def fetch_video_items(self, batch: List[str]) -> Optional[List[Dict]]:
+        """
+        영상 50개 이하의 원본 API 응답 항목 조회 (videos.list 1회)
+        
+        Returns:
+            응답 항목 리스트 (삭제/비공개 영상은 빠짐), 오류가 나면 None
+        """
+        try:
+            request = self.youtube.videos().list(
+                part="snippet,statistics,contentDetails",
+                id=",".join(batch)
+            )
+            
+            response = request.execute()
+            self.quota_used += 1  # videos.list = 1 포인트
+            
+            print(f"✅ {len(batch)}개 영상 상세 정보 조회 완료 (할당량: {self.quota_used}/{self.quota_limit})")
+            
+            # API 호출 간 짧은 대기 (Rate Limiting 방지)
+            time.sleep(0.1)
+            
+            return response.get('items', [])
+            
+        except HttpError as e:
+            print(f"❌ 영상 정보 조회 오류: {e}")
+            # 지수 백오프: 에러 발생 시 대기 후 재시도
+            time.sleep(2)
+            return None
+    
     def _parse_video_item(self, item: Dict) -> Dict:
         """
         API 응답을 파싱하여 필요한 데이터만 추출
@@ -143,7 +225,9 @@ class YouTubeCollector:
             'comment_count': int(statistics.get('commentCount', 0)),
             'duration': duration,
             'published_at': datetime.fromisoformat(snippet['publishedAt'].replace('Z', '+00:00')),
-            'thumbnail_url': snippet['thumbnails']['high']['url']
+            'thumbnail_url': snippet['thumbnails']['high']['url'],
+            'channel_name': snippet.get('channelTitle', ''),
+            'video_url': f"https://www.youtube.com/watch?v={item['id']}"
         }
     
     def _parse_duration(self, duration_str: str) -> int:
@@ -161,60 +245,128 @@ class YouTubeCollector:
         
         return hours * 3600 + minutes * 60 + seconds
     
-    def save_to_database(self, videos: List[Dict]):
+    def save_to_database(self, videos: List[Dict]) -> Dict[str, int]:
         """
         수집한 영상 데이터를 데이터베이스에 저장
+        
+        video_id 기준 대량 UPSERT로 저장하며, 이미 있는 영상은 통계 정보만 갱신합니다.
+        새로 저장된 영상은 트렌드 엔진/급상승 감지기에도 반영합니다.
+        
+        Returns:
+            {"inserted": 새로 저장한 영상 수, "updated": 통계를 갱신한 영상 수, "failed": 저장 실패 영상 수}
         """
-        db = SessionLocal()
+        report = IngestionService([VideoDataSink(), TrendEngineSink()]).run(videos)
+        stats = report[VideoDataSink.name]
+        counters = stats["counters"]
+        if not stats["failed_records"]:
+            print(f"✅ {len(videos)}개 영상 데이터 저장 완료 "
+                  f"(신규 {counters.get('inserted', 0)}개, 갱신 {counters.get('updated', 0)}개)")
+        
+        return {
+            "inserted": counters.get("inserted", 0),
+            "updated": counters.get("updated", 0),
+            "failed": stats["failed_records"],
+        }
+    
+    def fetch_trending_videos(self, max_results: int = 50) -> List[Dict]:
+        """
+        한국 급상승 영상 중 Howto & Style(뷰티 포함) 카테고리 조회 (videos.list 1회 = 1포인트)
         
+        Returns:
+            _parse_video_item 형식의 영상 레코드 리스트
+        """
         try:
-            for video in videos:
-                # 기존 데이터 확인
-                existing = db.query(VideoData).filter(
-                    VideoData.video_id == video['video_id']
-                ).first()
-                
-                if existing:
-                    # 업데이트 (통계 정보 갱신)
-                    existing.view_count = video['view_count']
-                    existing.like_count = video['like_count']
-                    existing.comment_count = video['comment_count']
-                    existing.updated_at = datetime.now()
-                else:
-                    # 새 데이터 삽입
-                    new_video = VideoData(**video)
-                    db.add(new_video)
-            
-            db.commit()
-            print(f"✅ {len(videos)}개 영상 데이터 저장 완료")
-            
-        except Exception as e:
-            db.rollback()
-            print(f"❌ 데이터베이스 저장 오류: {e}")
-        finally:
-            db.close()
+            response = self.youtube.videos().list(
+                part="snippet,statistics,contentDetails",
+                chart="mostPopular",
+                regionCode="KR",
+                videoCategoryId="26",
+                maxResults=min(max_results, 50)
+            ).execute()
+            self.quota_used += 1
+        except HttpError as e:
+            print(f"❌ 급상승 영상 조회 오류: {e}")
+            return []
+        
+        return [self._parse_video_item(item) for item in response.get('items', [])]
     
-    def cleanup_old_data(self):
+    def ingest_trending(self, max_results: int = 50, with_reports: bool = True,
+                        analyze=None, report_filter=is_beauty_video) -> Dict[str, Dict]:
+        """
+        급상승 영상을 한 번만 가져와 VideoData, 트렌드 엔진, (선택) video_reports에 함께 저장
+        
+        일일 수집과 collect_trending_videos.py가 모두 이 메서드를 쓰므로 급상승 차트 조회 코드는 여기 하나뿐입니다.
+        
+        Args:
+            with_reports: 아직 리포트가 없는 영상을 분석해 Supabase video_reports에도 저장
+            analyze: 리포트 분석 함수 (없으면 video_analyzer.generate_analysis_report)
+            report_filter: 리포트를 만들 영상 조건 (기본: 제목에 뷰티 키워드, None이면 전체)
+        
+        Returns:
+            sink별 처리 결과
+        """
+        videos = self.fetch_trending_videos(max_results)
+        print(f"📺 급상승 영상 {len(videos)}개 조회 (할당량: {self.quota_used}/{self.quota_limit})")
+        
+        sinks = [VideoDataSink(), TrendEngineSink()]
+        if with_reports:
+            known_report_index.ensure_ready(settings.KNOWN_IDS_MAX_AGE_HOURS)
+            known_report_index.reload_if_changed()
+            sinks.append(VideoReportSink(batch_size=settings.INGESTION_REPORT_BATCH_SIZE, analyze=analyze,
+                                         accept=report_filter))
+        
+        report = IngestionService(sinks).run(videos)
+        IngestionService.print_report(report)
+        return report
+    
+    def cleanup_old_data(self) -> Dict:
         """
         30일 이상 지난 데이터 삭제 (API 정책 준수)
+        
+        updated_at 인덱스를 이용해 청크 단위로 나눠 삭제하므로
+        큰 테이블에서도 쓰기 잠금이 짧게 유지됩니다.
         """
         db = SessionLocal()
+        cutoff_date = datetime.now() - timedelta(days=settings.DATA_RETENTION_DAYS)
+        metrics: Dict = {}
         
         try:
-            cutoff_date = datetime.now() - timedelta(days=settings.DATA_RETENTION_DAYS)
-            
-            deleted_count = db.query(VideoData).filter(
-                VideoData.updated_at < cutoff_date
-            ).delete()
+            ensure_index(engine, VideoData, "updated_at")
+            metrics = delete_in_chunks(
+                db,
+                VideoData,
+                VideoData.updated_at,
+                cutoff_date,
+                chunk_size=settings.RETENTION_DELETE_CHUNK_SIZE,
+                pause_seconds=settings.RETENTION_DELETE_PAUSE_MS / 1000,
+            )
+            record_retention_run(db, VideoData.__tablename__, cutoff_date, metrics)
             
-            db.commit()
-            print(f"✅ {deleted_count}개의 오래된 데이터 삭제 완료 (30일 정책 준수)")
+            # 통계 시계열도 같은 보존 기간 적용
+            ensure_index(engine, VideoStatsSnapshot, "captured_at")
+            snapshot_metrics = delete_in_chunks(
+                db,
+                VideoStatsSnapshot,
+                VideoStatsSnapshot.captured_at,
+                cutoff_date,
+                chunk_size=settings.RETENTION_DELETE_CHUNK_SIZE,
+                pause_seconds=settings.RETENTION_DELETE_PAUSE_MS / 1000,
+            )
+            record_retention_run(db, VideoStatsSnapshot.__tablename__, cutoff_date, snapshot_metrics)
+            print(
+                f"✅ {metrics['rows_deleted']}개의 오래된 데이터 삭제 완료 (30일 정책 준수, "
+                f"청크 {metrics['chunks']}개, 최대 잠금 {metrics['lock_ms_max']:.0f}ms, "
+                f"소요 {metrics['duration_ms']:.0f}ms)"
+            )
             
         except Exception as e:
             db.rollback()
             print(f"❌ 데이터 정리 오류: {e}")
+            record_retention_run(db, VideoData.__tablename__, cutoff_date, metrics, error=str(e))
         finally:
             db.close()
+        
+        return metrics
     
     def run_daily_collection(self):
         """
@@ -227,24 +379,33 @@ class YouTubeCollector:
         # 1. 오래된 데이터 정리
         self.cleanup_old_data()
         
-        # 2. 최근 7일 영상 검색
-        video_ids = self.search_beauty_videos(max_results=50)
+        # 2~4. 최근 7일 영상 검색 → 상세 조회 → 저장 (스트리밍, 체크포인트로 재개 가능)
+        result = self.run_pipeline()
+        counters = dict(result["counters"])
         
-        if not video_ids:
-            print("⚠️  검색 결과가 없습니다.")
-            return
+        # 급상승 영상은 한 번만 조회해 VideoData / 트렌드 엔진 / video_reports에 함께 반영
+        trending = self.ingest_trending(
+            max_results=settings.INGESTION_TRENDING_MAX_RESULTS,
+            with_reports=settings.INGESTION_TRENDING_REPORTS,
+        )
+        for key in ("inserted", "updated"):
+            counters[key] += trending[VideoDataSink.name]["counters"].get(key, 0)
         
-        # 3. 영상 상세 정보 조회
-        videos = self.get_video_details(video_ids)
+        if not counters["inserted"] and not counters["updated"]:
+            print("⚠️  저장된 영상이 없습니다.")
+            return
         
-        # 4. 데이터베이스에 저장
-        if videos:
-            self.save_to_database(videos)
+        # 5. 분석 스냅샷 갱신 후 이번 주 리포트 갱신
+        run_snapshot_export()
+        run_weekly_report()
         
         print("=" * 50)
         print(f"✅ 일일 데이터 수집 완료")
-        print(f"   - 수집 영상: {len(videos)}개")
+        print(f"   - 수집 영상: 신규 {counters['inserted']}개, 갱신 {counters['updated']}개")
         print(f"   - 할당량 사용: {self.quota_used}/{self.quota_limit}")
+        known_stats = known_video_index.stats()
+        print(f"   - 이미 아는 영상 건너뜀: {known_stats['calls_avoided']}개 "
+              f"(확인 {known_stats['checks']}개, 추정 거짓 양성 {known_stats['estimated_fp_rate']:.4%})")
         print("=" * 50)
 
 
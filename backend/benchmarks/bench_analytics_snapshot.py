@@ -0,0 +1,75 @@
+"""
+컬럼형 분석 스냅샷 집계 벤치마크
+합성 영상 100만 개로 스냅샷을 만든 뒤 주요 group-by/백분위 집계 시간을 측정합니다.
+
+실행: python benchmarks/bench_analytics_snapshot.py [행 수]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.analytics_snapshot import AnalyticsSnapshot, write_snapshot
+
+DURATION_EDGES = [0, 60, 300, 600, 900, 1200, 10 ** 9]
+
+
+def make_snapshot(base_dir: str, rows: int, vocab_size: int = 5000, seed: int = 42) -> str:
+    rng = np.random.default_rng(seed)
+    keywords_per_video = rng.integers(3, 10, size=rows)
+    kw_indptr = np.concatenate(([0], np.cumsum(keywords_per_video)))
+
+    columns = {
+        "video_id": np.array([f"v{i:010d}" for i in range(rows)], dtype="U16"),
+        "view_count": rng.lognormal(10, 2, size=rows).astype(np.int64),
+        "like_count": rng.lognormal(6, 2, size=rows).astype(np.int64),
+        "comment_count": rng.lognormal(4, 2, size=rows).astype(np.int64),
+        "duration": rng.integers(10, 3600, size=rows).astype(np.int32),
+        "published_at": rng.integers(1_750_000_000, 1_760_000_000, size=rows).astype(np.int64),
+    }
+    kw_ids = rng.zipf(1.3, size=int(kw_indptr[-1])) % vocab_size
+    vocab = [f"keyword{i}" for i in range(vocab_size)]
+
+    return write_snapshot(base_dir, columns, kw_indptr, kw_ids.astype(np.int32), vocab)
+
+
+def timed(label: str, fn, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    print(f"  {label:<40} {best * 1000:8.1f} ms")
+
+
+def run(rows: int = 1_000_000):
+    with tempfile.TemporaryDirectory() as base_dir:
+        print("=" * 60)
+        print(f"📊 분석 스냅샷 벤치마크 ({rows:,}개 영상)")
+        print("=" * 60)
+
+        started = time.perf_counter()
+        make_snapshot(base_dir, rows)
+        print(f"  스냅샷 생성 (합성 데이터)                {(time.perf_counter() - started) * 1000:8.1f} ms")
+
+        snapshot = AnalyticsSnapshot.open_current(base_dir)
+        n_buckets = len(DURATION_EDGES) - 1
+
+        timed("길이 구간별 평균 조회수", lambda: snapshot.aggregate(
+            snapshot.duration_bucket(DURATION_EDGES), n_buckets, agg="mean"))
+        timed("길이 구간별 조회수 p90", lambda: snapshot.aggregate(
+            snapshot.duration_bucket(DURATION_EDGES), n_buckets, agg="percentile", q=90))
+        timed("KST 게시 시각별 중앙값", lambda: snapshot.aggregate(
+            snapshot.publish_hour(), 24, agg="percentile", q=50))
+        timed("요일×시각(168칸) 평균 조회수", lambda: snapshot.aggregate(
+            snapshot.publish_weekday() * 24 + snapshot.publish_hour(), 168, agg="mean"))
+        timed("키워드별 평균 조회수 상위 20", lambda: snapshot.keyword_aggregate(top=20, min_count=10))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,102 @@
+"""
+API 동시성 벤치마크 (워커 1개 기준 초당 요청 수)
+동시 클라이언트 100개가 GET /api/creators/@{username}을 계속 호출할 때의 처리량과 지연 시간을 비교합니다.
+
+- sync SDK: async def 핸들러 안에서 동기 Supabase SDK .execute() 호출 (이벤트 루프가 DB 응답을 기다리며 멈춤)
+- async repository: 현재 핸들러 (app/db/repositories.py, httpx.AsyncClient)
+
+앱은 httpx.ASGITransport로 이벤트 루프 하나에서 실행하므로 uvicorn 워커 1개와 같은 조건이며,
+Supabase 대신 응답 지연을 준 로컬 PostgREST 스텁 서버에 요청합니다.
+
+실행: python benchmarks/bench_api_concurrency.py [--clients 100] [--requests 2000] [--latency-ms 20]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+
+from bench_creator_profile import PROFILE, STUB_KEY, start_stub_server, sync_handler
+from app.api import creators
+from app.core.config import settings
+from app.db.postgrest import postgrest
+from app.db.supabase_client import SupabaseClientPool
+
+
+def build_app(handler) -> FastAPI:
+    app = FastAPI()
+    app.add_api_route("/api/creators/@{username}", handler, methods=["GET"])
+    return app
+
+
+async def drive(app: FastAPI, clients: int, requests: int, username: str):
+    """clients개 작업이 요청 requests개를 나눠 보냄 → (초당 요청 수, 지연 시간 배열 ms)"""
+    transport = httpx.ASGITransport(app=app)
+    latencies = []
+    remaining = [requests]
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker():
+            while remaining[0] > 0:
+                remaining[0] -= 1
+                started = time.perf_counter()
+                response = await client.get(f"/api/creators/@{username}")
+                latencies.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+
+        # 워밍업 (연결 풀 채우기)
+        await asyncio.gather(*(client.get(f"/api/creators/@{username}") for _ in range(clients)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    return requests / elapsed, np.array(latencies)
+
+
+def run(clients: int, requests: int, latency_ms: float):
+    server, url = start_stub_server(latency_ms)
+    settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY = url, STUB_KEY
+    username = PROFILE["username"]
+    print(f"로컬 PostgREST 스텁: {url} (응답 지연 {latency_ms}ms), "
+          f"연결 풀 최대 {settings.SUPABASE_HTTP_MAX_CONNECTIONS}개")
+
+    pool = SupabaseClientPool()
+    pool.start()
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        results["sync SDK"] = loop.run_until_complete(
+            drive(build_app(sync_handler(pool.get)), clients, requests, username)
+        )
+        results["async repository"] = loop.run_until_complete(
+            drive(build_app(creators.get_profile), clients, requests, username)
+        )
+        loop.run_until_complete(postgrest.aclose())
+    finally:
+        pool.close()
+        loop.close()
+        server.terminate()
+
+    print(f"\n동시 클라이언트 {clients}개, 요청 {requests}개 (워커 1개)")
+    print(f"{'방식':<20}{'요청/초':>10}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for name, (rps, latencies) in results.items():
+        p50, p99 = np.percentile(latencies, [50, 99])
+        print(f"{name:<20}{rps:>10.1f}{p50:>10.1f}{p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    run(args.clients, args.requests, args.latency_ms)
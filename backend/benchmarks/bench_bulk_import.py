@@ -0,0 +1,230 @@
+"""
+대량 가져오기 벤치마크 (POST /api/newsletter/import, POST /api/creators/import)
+NDJSON / CSV 파일을 64KB씩 스트리밍 업로드해 처리 시간과 가져오기 중 최대 메모리(tracemalloc)를 측정합니다.
+
+- newsletter: SQLite 임시 파일 DB에 email 기준 청크 UPSERT (앞의 절반은 이미 있는 구독자 → updated)
+  기존 방식(POST /api/newsletter/subscribe를 행마다 호출)과 처리량도 비교합니다.
+- creators: PostgREST 대역이 받은 청크를 그대로 돌려줌 (DB 제약 위반 흉내 행 포함 → 청크를 반씩 나눠 재시도)
+
+파일에는 검증 실패 행(잘못된 이메일/필수 필드 누락/깨진 JSON)을 약 1% 섞고,
+보고서의 saved / failed / inserted / updated가 생성한 파일과 맞는지 확인합니다.
+메모리는 파일 크기와 관계없이 청크 크기만큼만 늘어나야 합니다.
+
+실행: python benchmarks/bench_bulk_import.py [--sizes 10000,100000] [--baseline 2000]
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api import creators, newsletter
+from app.db import repositories
+from app.db.database import Base, get_db
+from app.db.postgrest import AsyncPostgrest, PostgrestDataError
+from app.models.models import NewsletterSubscriber
+
+UPLOAD_CHUNK = 64 * 1024
+DB_REJECTED_PREFIX = "dbreject"
+
+
+class _EchoPostgrest(AsyncPostgrest):
+    """UPSERT 본문을 select 컬럼만 골라 돌려주는 PostgREST 대역 (DB_REJECTED_PREFIX username이 있으면 400)"""
+
+    async def _request(self, method, table, params=None, json=None, prefer=None):
+        if any(row["username"].startswith(DB_REJECTED_PREFIX) for row in json):
+            raise PostgrestDataError(400, 'new row violates check constraint "creator_profiles_rate_check"',
+                                 code="23514")
+        names = params["select"].split(",")
+        return [{name: row.get(name) for name in names} for row in json]
+
+
+class _NoIndex:
+    def upsert(self, row):
+        pass
+
+
+def subscriber_lines(count: int, fmt: str, offset: int = 0):
+    """(줄 목록 생성기, 예상 유효 행 수, 예상 실패 수)"""
+    bad = 0
+    lines = []
+    if fmt == "csv":
+        lines.append("email,name,creator_type,subscriber_count_range")
+    for i in range(count):
+        n = i + offset
+        if i % 100 == 99:
+            bad += 1
+            if fmt == "csv":
+                lines.append(f"not-an-email-{n},이름,뷰티,")
+            else:
+                lines.append('{"email": "broken' if i % 200 == 199 else json.dumps({"name": "no email"}))
+            continue
+        record = {"email": f"user{n}@example.com", "name": f"구독자 {n}", "creator_type": "뷰티",
+                  "subscriber_count_range": "1만-5만"}
+        if fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="").writerow(record.values())
+            lines.append(buffer.getvalue())
+        else:
+            lines.append(json.dumps(record, ensure_ascii=False))
+    return lines, count - bad, bad
+
+
+def profile_lines(count: int, fmt: str):
+    bad = rejected = 0
+    lines = []
+    if fmt == "csv":
+        lines.append("username,display_name,bio,sponsorship_rate,subscriber_count,preferred_categories,email")
+    for i in range(count):
+        username = f"creator{i}"
+        if i % 100 == 99:
+            bad += 1
+            username = None  # 필수 필드 누락
+        elif i % 1000 == 500:
+            rejected += 1
+            username = f"{DB_REJECTED_PREFIX}{i}"
+        record = {"username": username, "display_name": f"크리에이터 {i}",
+                  "bio": "데일리 메이크업, \"쿨톤\" 루틴\n두 줄 소개", "sponsorship_rate": 1000000,
+                  "subscriber_count": 10000 + i, "preferred_categories": ["메이크업", "스킨케어"],
+                  "email": f"creator{i}@example.com"}
+        if username is None:
+            record.pop("username")
+        if fmt == "csv":
+            buffer = io.StringIO()
+            row = {**record, "preferred_categories": "|".join(record["preferred_categories"])}
+            csv.writer(buffer, lineterminator="").writerow(
+                [row.get(name, "") for name in lines[0].split(",")])
+            lines.append(buffer.getvalue())
+        else:
+            lines.append(json.dumps(record, ensure_ascii=False))
+    return lines, count - bad - rejected, bad + rejected
+
+
+async def upload(lines):
+    """줄 목록을 UPLOAD_CHUNK 바이트씩 보내는 본문 스트림 (파일 전체를 bytes로 만들지 않음)"""
+    buffer = []
+    size = 0
+    for line in lines:
+        encoded = (line + "\n").encode("utf-8")
+        buffer.append(encoded)
+        size += len(encoded)
+        if size >= UPLOAD_CHUNK:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+async def post_import(app: FastAPI, path: str, lines, fmt: str, trace: bool):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        if trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+        response = await client.post(path, params={"format": fmt}, content=upload(lines))
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if trace else 0
+        if trace:
+            tracemalloc.stop()
+    response.raise_for_status()
+    return response.json(), elapsed, peak
+
+
+def make_newsletter_app(path: str) -> FastAPI:
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[NewsletterSubscriber.__table__])
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def _get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(newsletter.router, prefix="/api/newsletter")
+    app.dependency_overrides[get_db] = _get_db
+    return app
+
+
+async def baseline_subscribe(app: FastAPI, count: int) -> float:
+    """기존 방식: 행마다 POST /api/newsletter/subscribe → 초당 행 수"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        for i in range(count):
+            response = await client.post("/api/newsletter/subscribe",
+                                         json={"email": f"baseline{i}@example.com", "name": f"구독자 {i}"})
+            response.raise_for_status()
+        return count / (time.perf_counter() - started)
+
+
+def check(report, valid: int, failed: int, extra=None) -> str:
+    ok = report["saved"] == valid and report["failed"] == failed and report["rows"] == valid + failed
+    for name, expected in (extra or {}).items():
+        ok &= report.get(name) == expected
+    return "O" if ok else f"X {report | {'errors': report['errors'][:3]}}"
+
+
+def run(sizes, baseline: int):
+    creators.creator_discovery_index = _NoIndex()
+    repositories.creator_profiles.db = _EchoPostgrest()
+    creator_app = FastAPI()
+    creator_app.include_router(creators.router, prefix="/api/creators")
+
+    loop = asyncio.new_event_loop()
+    print(f"{'대상':<12}{'형식':<8}{'행 수':>10}{'시간(s)':>10}{'행/초':>10}{'최대 메모리':>12}  검증")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            for size in sizes:
+                for fmt in ("ndjson", "csv"):
+                    # newsletter: 절반을 먼저 넣어 두고 전체를 가져옴 → 앞 절반은 updated
+                    app = make_newsletter_app(f"{tmp}/newsletter_{size}_{fmt}.db")
+                    half, half_valid, _ = subscriber_lines(size // 2, fmt)
+                    loop.run_until_complete(post_import(app, "/api/newsletter/import", half, fmt, False))
+                    lines, valid, failed = subscriber_lines(size, fmt)
+                    report, elapsed, _ = loop.run_until_complete(
+                        post_import(app, "/api/newsletter/import", lines, fmt, False))
+                    _, _, peak = loop.run_until_complete(
+                        post_import(app, "/api/newsletter/import", lines, fmt, True))
+                    result = check(report, valid, failed, {"updated": half_valid, "inserted": valid - half_valid})
+                    print(f"{'newsletter':<12}{fmt:<8}{size:>10,}{elapsed:>10.2f}{size / elapsed:>10,.0f}"
+                          f"{peak / 1024 / 1024:>10.1f}MB  {result}")
+
+                    lines, valid, failed = profile_lines(size, fmt)
+                    report, elapsed, _ = loop.run_until_complete(
+                        post_import(creator_app, "/api/creators/import", lines, fmt, False))
+                    _, _, peak = loop.run_until_complete(
+                        post_import(creator_app, "/api/creators/import", lines, fmt, True))
+                    print(f"{'creators':<12}{fmt:<8}{size:>10,}{elapsed:>10.2f}{size / elapsed:>10,.0f}"
+                          f"{peak / 1024 / 1024:>10.1f}MB  {check(report, valid, failed)}")
+
+            if baseline:
+                app = make_newsletter_app(f"{tmp}/newsletter_baseline.db")
+                rate = loop.run_until_complete(baseline_subscribe(app, baseline))
+                print(f"\n기존 방식 (행마다 /subscribe, {baseline:,}행): {rate:,.0f}행/초")
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--baseline", type=int, default=2000)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(",")], args.baseline)
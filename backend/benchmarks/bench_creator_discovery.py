@@ -0,0 +1,227 @@
+"""
+크리에이터 탐색 벤치마크 (GET /api/creators/discover)
+협찬 가능 프로필 N명을 탐색 인덱스에 적재하고, 무작위 조건(범위/카테고리/검색어/정렬)으로 조회한 지연 시간을 측정합니다.
+
+- index: CreatorDiscoveryIndex.search() 한 번
+- api: 라우터 전체 (쿼리 파싱 + 인덱스 검색 + 응답 모델 검증/직렬화, httpx.ASGITransport)
+
+결과는 같은 조건을 파이썬으로 전부 훑은 결과와 비교해 검증하고, 일부 프로필을 수정/비활성화한 뒤(증분 반영)에도 다시 확인합니다.
+적재는 메모리 저장소에서 하므로 PostgREST 왕복은 빠집니다.
+
+실행: python benchmarks/bench_creator_discovery.py [--profiles 100000] [--queries 500]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+
+from app.api import creators
+from app.services import creator_discovery
+from app.services.creator_discovery import CreatorDiscoveryIndex, DiscoveryQuery
+
+CATEGORIES = ["메이크업", "스킨케어", "헤어", "네일", "향수", "패션", "다이어트", "브이로그", "리뷰", "남성뷰티",
+              "바디케어", "클렌징", "선케어", "색조", "뷰티디바이스"]
+WORDS = ["데일리", "루틴", "꿀팁", "리뷰", "하울", "겟레디윗미", "올리브영", "쿨톤", "웜톤", "민감성", "여드름", "모공"]
+
+
+class _MemoryRepository:
+    """scan()만 흉내 내는 메모리 저장소 (updated_at 필터 지원)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def scan(self, filters=None, columns="*", page_size=1000):
+        filters = filters or {}
+        rows = self.rows
+        if "sponsorship_available" in filters:
+            rows = [row for row in rows if row["is_active"] and row["sponsorship_available"]]
+        if "updated_at" in filters:
+            since = filters["updated_at"].split(".", 1)[1]
+            rows = [row for row in rows if row["updated_at"] >= since]
+        for start in range(0, len(rows), page_size):
+            yield rows[start:start + page_size]
+
+
+def sample_profiles(count: int, rng: random.Random):
+    profiles = []
+    for i in range(count):
+        subscribers = int(10 ** rng.uniform(3, 6.5))
+        profiles.append({
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "username": f"creator{i}",
+            "display_name": f"{rng.choice(WORDS)}{rng.choice(['랩', '언니', '오빠', '로그', 'TV'])} {i}",
+            "bio": " ".join(rng.sample(WORDS, 4)) + " 영상을 올립니다.",
+            "profile_image_url": None,
+            "subscriber_count": subscribers,
+            "average_views": int(subscribers * rng.uniform(0.05, 0.6)),
+            "sponsorship_rate": int(subscribers * rng.uniform(2, 20)) // 10000 * 10000 + 100000,
+            "sponsorship_available": rng.random() > 0.2,
+            "preferred_categories": rng.sample(CATEGORIES, rng.randint(1, 4)),
+            "created_at": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00+00:00",
+            "is_verified": rng.random() > 0.9,
+            "is_active": rng.random() > 0.05,
+            "updated_at": "2025-01-01T00:00:00+00:00",
+        })
+    return profiles
+
+
+def random_query(rng: random.Random) -> DiscoveryQuery:
+    fields = {}
+    if rng.random() < 0.7:
+        low = int(10 ** rng.uniform(3, 5.5))
+        fields["min_subscribers"] = low
+        if rng.random() < 0.5:
+            fields["max_subscribers"] = low * rng.randint(2, 20)
+    if rng.random() < 0.4:
+        fields["min_views"] = int(10 ** rng.uniform(2.5, 4.5))
+    if rng.random() < 0.5:
+        fields["max_rate"] = rng.choice([500000, 1000000, 3000000, 10000000])
+    if rng.random() < 0.6:
+        fields["categories"] = tuple(rng.sample(CATEGORIES, rng.randint(1, 3)))
+    if rng.random() < 0.3:
+        fields["text"] = rng.choice(WORDS)
+    return DiscoveryQuery(sort=rng.choice(["subscribers", "views", "rate", "recent"]),
+                          limit=20, offset=rng.choice([0, 0, 0, 20, 100]), **fields)
+
+
+# DB 조회(CreatorProfileRepository.DISCOVERY_ORDER)와 같은 정렬 - 값이 같으면 id 순: (필드, 내림차순)
+BRUTE_FORCE_ORDER = {
+    "subscribers": ("subscriber_count", True),
+    "views": ("average_views", True),
+    "rate": ("sponsorship_rate", False),
+    "recent": ("created_at", True),
+}
+
+
+def brute_force(rows, query: DiscoveryQuery):
+    """조건에 맞는 id 목록 (정렬 값, id 순)"""
+    matched = []
+    for row in rows:
+        if not (row["is_active"] and row["sponsorship_available"]):
+            continue
+        checks = [
+            (row["subscriber_count"], query.min_subscribers, query.max_subscribers),
+            (row["average_views"], query.min_views, query.max_views),
+            (row["sponsorship_rate"], query.min_rate, query.max_rate),
+        ]
+        if any((low is not None and value < low) or (high is not None and value > high)
+               for value, low, high in checks):
+            continue
+        if query.categories and not set(query.categories) & set(row["preferred_categories"]):
+            continue
+        if query.text and query.text.lower() not in f"{row['display_name']}\n{row['bio']}".lower():
+            continue
+        matched.append(row)
+    field, descending = BRUTE_FORCE_ORDER[query.sort]
+    matched.sort(key=lambda row: (row[field], row["id"]), reverse=descending)
+    return [row["id"] for row in matched]
+
+
+def verify(index: CreatorDiscoveryIndex, rows, queries) -> int:
+    """전체 수와 페이지 행이 전수 조사 결과와 맞는지 확인 → 틀린 조회 수"""
+    wrong = 0
+    for query in queries:
+        page, total = index.search(query)
+        expected = brute_force(rows, query)
+        if total != len(expected) or [row["id"] for row in page] != expected[query.offset:query.offset + query.limit]:
+            wrong += 1
+    return wrong
+
+
+def verify_tie_paging(count: int = 2000, limit: int = 20) -> int:
+    """구독자 수가 모두 같은 프로필을 offset으로 끝까지 넘겼을 때 빠지거나 겹친 수"""
+    rows = sample_profiles(count, random.Random(1))
+    for row in rows:
+        row.update(subscriber_count=50000, sponsorship_available=True, is_active=True)
+    index = CreatorDiscoveryIndex(_MemoryRepository(rows), refresh_seconds=3600)
+    index._build(rows)
+    seen = []
+    for offset in range(0, count, limit):
+        page, _ = index.search(DiscoveryQuery(sort="subscribers", limit=limit, offset=offset))
+        seen.extend(row["id"] for row in page)
+    return count - len(set(seen)) + len(seen) - len(set(seen))
+
+
+def percentiles(samples):
+    return np.percentile(samples, [50, 99])
+
+
+async def measure_api(app: FastAPI, queries):
+    samples = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for query in queries:
+            params = {key: value for key, value in query._asdict().items()
+                      if value not in (None, ()) and key not in ("text", "categories")}
+            if query.text:
+                params["q"] = query.text
+            if query.categories:
+                params["categories"] = list(query.categories)
+            started = time.perf_counter()
+            response = await client.get("/api/creators/discover", params=params)
+            samples.append((time.perf_counter() - started) * 1000)
+            response.raise_for_status()
+    return samples
+
+
+def run(profiles: int, queries: int):
+    rng = random.Random(0)
+    rows = sample_profiles(profiles, rng)
+    index = CreatorDiscoveryIndex(_MemoryRepository(rows), refresh_seconds=3600)
+    creator_discovery.creator_discovery_index = creators.creator_discovery_index = index
+
+    loop = asyncio.new_event_loop()
+    try:
+        started = time.perf_counter()
+        loop.run_until_complete(index.ensure_fresh())
+        print(f"프로필 {profiles:,}명 중 협찬 가능 {len(index):,}명 적재 ({time.perf_counter() - started:.2f}초)")
+
+        query_list = [random_query(rng) for _ in range(queries)]
+        index_samples = []
+        for query in query_list:
+            started = time.perf_counter()
+            index.search(query)
+            index_samples.append((time.perf_counter() - started) * 1000)
+
+        app = FastAPI()
+        app.include_router(creators.router, prefix="/api/creators")
+        api_samples = loop.run_until_complete(measure_api(app, query_list))
+
+        wrong = verify(index, rows, query_list[:100])
+
+        # 증분 반영: 일부 프로필 수정/협찬 불가 처리 후 다시 검증
+        for row in rng.sample(rows, 1000):
+            row["subscriber_count"] = int(row["subscriber_count"] * rng.uniform(0.5, 2))
+            row["sponsorship_available"] = rng.random() > 0.3
+            row["updated_at"] = "2099-01-01T00:00:00+00:00"
+        index._watermark = "2098-01-01T00:00:00+00:00"
+        loop.run_until_complete(index._load_changes())
+        wrong_after = verify(index, rows, query_list[100:200])
+    finally:
+        loop.close()
+
+    print(f"\n무작위 조건 {queries}회 (범위/카테고리/검색어/정렬 조합, 페이지당 20행)")
+    print(f"{'방식':<10}{'p50(ms)':>10}{'p99(ms)':>10}{'최대(ms)':>10}")
+    for name, samples in (("index", index_samples), ("api", api_samples)):
+        p50, p99 = percentiles(samples)
+        print(f"{name:<10}{p50:>10.2f}{p99:>10.2f}{max(samples):>10.2f}")
+    print(f"\n검증: 전수 조사와 다른 조회 {wrong}/100, 증분 반영(1,000명) 후 {wrong_after}/100")
+    print(f"      같은 구독자 수 2,000명 페이지 넘김 시 빠지거나 겹친 프로필 {verify_tie_paging()}명")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=500)
+    args = parser.parse_args()
+    run(args.profiles, args.queries)
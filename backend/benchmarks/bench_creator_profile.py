@@ -0,0 +1,176 @@
+"""
+크리에이터 프로필 조회 지연 시간 벤치마크
+GET /api/creators/@{username} 핸들러를 두 방식으로 반복 호출해 p50/p99를 비교합니다.
+
+- before: 요청마다 create_client()로 Supabase 클라이언트를 새로 만듦 (기존 방식)
+- shared sync: 프로세스 공유 동기 클라이언트 (keep-alive 연결 풀 재사용)
+- async repository: 현재 핸들러 (app/db/repositories.py, httpx.AsyncClient)
+
+기본은 로컬 PostgREST 스텁 서버(HTTP/1.1 keep-alive)에 요청하며,
+--url/--key를 주면 실제 Supabase 프로젝트에 요청합니다 (creator_profiles에 해당 username이 있어야 함).
+
+실행: python benchmarks/bench_creator_profile.py [--requests 300] [--latency-ms 2] [--url URL --key KEY --username NAME]
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from supabase import create_client
+
+from fastapi import HTTPException
+
+from app.api import creators
+from app.db.postgrest import postgrest
+from app.db.supabase_client import SupabaseClientPool
+
+# 형식만 맞춘 가짜 키 (스텁 서버는 검사하지 않음)
+STUB_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.c3R1Yg"
+
+PROFILE = {
+    "id": "00000000-0000-0000-0000-000000000001",
+    "username": "beautylab",
+    "display_name": "뷰티랩",
+    "bio": "데일리 메이크업",
+    "profile_image_url": None,
+    "youtube_channel_id": None,
+    "youtube_channel_url": None,
+    "subscriber_count": 120000,
+    "average_views": 45000,
+    "sponsorship_rate": 1500000,
+    "sponsorship_available": True,
+    "preferred_categories": ["메이크업", "스킨케어"],
+    "email": None,
+    "contact_method": None,
+    "contact_value": None,
+    "featured_videos": [],
+    "created_at": "2025-01-01T00:00:00+00:00",
+    "is_verified": False,
+    "is_active": True,
+}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """creator_profiles 조회에 PROFILE 한 건을 돌려주는 PostgREST 스텁"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK로 40ms씩 밀리는 것 방지
+    body = json.dumps([PROFILE]).encode("utf-8")
+    latency_ms = 0.0
+
+    def do_GET(self):
+        # postgrest-py는 GET에도 본문("{}")을 보내므로 읽어서 버려야 keep-alive 연결이 유지됨
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve_stub(latency_ms: float, port_queue, handler) -> None:
+    handler.latency_ms = latency_ms
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stub_server(latency_ms: float, handler=_StubHandler):
+    """
+    스텁 서버를 별도 프로세스로 실행 → (프로세스, URL)
+
+    같은 프로세스의 스레드로 띄우면 측정 대상 이벤트 루프와 GIL을 나눠 써서 결과가 왜곡됩니다.
+    """
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve_stub, args=(latency_ms, port_queue, handler), daemon=True)
+    process.start()
+    return process, f"http://127.0.0.1:{port_queue.get(timeout=10)}"
+
+
+def sync_handler(get_client):
+    """동기 SDK를 쓰던 기존 get_profile 핸들러"""
+    async def get_profile(username: str):
+        supabase = get_client()
+        result = supabase.table("creator_profiles").select("*").eq("username", username).eq("is_active", True).execute()
+        if not result.data:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return result.data[0]
+    return get_profile
+
+
+def measure(loop, handler, username: str, requests: int, warmup: int = 10) -> np.ndarray:
+    for _ in range(warmup):
+        loop.run_until_complete(handler(username))
+
+    samples = np.empty(requests)
+    for i in range(requests):
+        started = time.perf_counter()
+        loop.run_until_complete(handler(username))
+        samples[i] = (time.perf_counter() - started) * 1000
+    return samples
+
+
+def run(requests: int, latency_ms: float, url: str = None, key: str = None, username: str = PROFILE["username"]):
+    server = None
+    if not url:
+        server, url = start_stub_server(latency_ms)
+        key = STUB_KEY
+        print(f"로컬 PostgREST 스텁: {url} (응답 지연 {latency_ms}ms)")
+    else:
+        print(f"대상: {url}")
+
+    from app.core.config import settings
+    settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY = url, key
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        # 기존 방식: 요청마다 클라이언트 생성
+        results["before (요청마다 생성)"] = measure(
+            loop, sync_handler(lambda: create_client(url, key)), username, requests
+        )
+
+        # 공유 동기 클라이언트
+        pool = SupabaseClientPool()
+        pool.start()
+        results["shared sync"] = measure(loop, sync_handler(pool.get), username, requests)
+        pool.close()
+
+        # 현재 핸들러 (비동기 저장소)
+        results["async repository"] = measure(loop, creators.get_profile, username, requests)
+        loop.run_until_complete(postgrest.aclose())
+    finally:
+        loop.close()
+        if server:
+            server.terminate()
+
+    print(f"\nGET /api/creators/@{username} × {requests}회")
+    print(f"{'방식':<24}{'p50(ms)':>10}{'p99(ms)':>10}{'평균(ms)':>10}")
+    for name, samples in results.items():
+        p50, p99 = np.percentile(samples, [50, 99])
+        print(f"{name:<24}{p50:>10.2f}{p99:>10.2f}{samples.mean():>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--url")
+    parser.add_argument("--key")
+    parser.add_argument("--username", default=PROFILE["username"])
+    args = parser.parse_args()
+    run(args.requests, args.latency_ms, args.url, args.key, args.username)
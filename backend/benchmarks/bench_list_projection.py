@@ -0,0 +1,154 @@
+"""
+목록 API 요약 프로젝션 벤치마크 (view=full vs view=summary)
+GET /api/reports, GET /api/creators 한 페이지의 응답 크기와 처리 시간을 비교합니다.
+
+- DB 응답: PostgREST가 select 컬럼만 골라 보내는 JSON 크기 (Supabase → 백엔드 전송량)
+- API 응답: FastAPI 응답 본문 크기, 요청 한 건 처리 시간 (JSON 파싱 + 응답 모델 검증 + 직렬화)
+
+Supabase 대신 select 파라미터대로 컬럼을 골라 JSON으로 돌려주는 메모리 PostgREST를 쓰므로
+네트워크 지연은 빠지고 전송량과 CPU 시간만 비교합니다. 목록 캐시는 끄고 측정합니다.
+
+실행: python benchmarks/bench_list_projection.py [--limit 20] [--requests 200] [--report-kb 12]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import FastAPI
+
+from bench_creator_profile import PROFILE
+from app.api import creators, reports
+from app.db import repositories
+from app.db.postgrest import AsyncPostgrest
+from app.services.report_cache import report_cache
+
+
+def _over_wire(rows):
+    """JSON 인코딩 → 디코딩 (PostgREST 응답 전송 흉내) → (바이트 수, 행 목록)"""
+    body = json.dumps(rows, ensure_ascii=False).encode("utf-8")
+    return len(body), json.loads(body)
+
+
+class _InMemoryPostgrest(AsyncPostgrest):
+    """테이블별 행 목록에서 select 컬럼만 골라 JSON 왕복시켜 돌려주는 PostgREST 대역"""
+
+    def __init__(self, tables):
+        super().__init__()
+        self.tables = tables
+        self.bytes_sent = 0
+
+    async def _request(self, method, table, params=None, json=None, prefer=None):
+        rows = self.tables[table][: int(params.get("limit", 1000))]
+        columns = params.get("select", "*")
+        if columns != "*":
+            names = columns.split(",")
+            rows = [{name: row[name] for name in names} for row in rows]
+        size, rows = _over_wire(rows)
+        self.bytes_sent += size
+        return rows
+
+
+def sample_reports(count: int, report_kb: float):
+    paragraph = "## 성공 요인 분석\n이 영상은 첫 3초 훅과 자막 배치가 좋아 시청 지속률이 높습니다.\n\n"
+    body = paragraph * max(1, int(report_kb * 1024 / len(paragraph.encode("utf-8"))))
+    return [
+        {
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "video_id": f"vid{i:08d}",
+            "video_url": f"https://www.youtube.com/shorts/vid{i:08d}",
+            "title": f"5분 만에 끝내는 데일리 메이크업 #{i}",
+            "channel_name": "뷰티랩",
+            "view_count": 1200000 - i,
+            "like_count": 45000,
+            "comment_count": 1200,
+            "published_at": "2025-01-01T00:00:00+00:00",
+            "thumbnail_url": f"https://i.ytimg.com/vi/vid{i:08d}/hqdefault.jpg",
+            "analysis_report": body,
+            "success_score": 87,
+            "trending_keywords": ["메이크업", "데일리", "뷰티", "꿀팁", "루틴"],
+            "created_at": f"2025-01-01T00:{i // 60 % 60:02d}:{i % 60:02d}+00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def sample_profiles(count: int):
+    featured = [
+        {"video_id": f"vid{i}", "title": f"대표 영상 {i}", "thumbnail": f"https://i.ytimg.com/vi/vid{i}/hq.jpg",
+         "views": 100000 * i}
+        for i in range(5)
+    ]
+    return [
+        dict(PROFILE, id=f"00000000-0000-0000-0001-{i:012d}", username=f"creator{i}",
+             bio="매일 아침 5분 메이크업 루틴과 스킨케어 꿀팁을 올립니다. " * 6,
+             featured_videos=featured, updated_at=PROFILE["created_at"])
+        for i in range(count)
+    ]
+
+
+async def measure(app: FastAPI, db: _InMemoryPostgrest, path: str, requests: int):
+    """→ (DB 응답 바이트, API 응답 바이트, 처리 시간 배열 ms)"""
+    transport = httpx.ASGITransport(app=app)
+    samples = np.empty(requests)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        response = await client.get(path)
+        response.raise_for_status()
+        db.bytes_sent = 0
+        await client.get(path)
+        db_bytes, api_bytes = db.bytes_sent, len(response.content)
+
+        for i in range(requests):
+            started = time.perf_counter()
+            response = await client.get(path)
+            samples[i] = (time.perf_counter() - started) * 1000
+    return db_bytes, api_bytes, samples
+
+
+def run(limit: int, requests: int, report_kb: float):
+    db = _InMemoryPostgrest({
+        "video_reports": sample_reports(limit, report_kb),
+        "creator_profiles": sample_profiles(limit),
+    })
+    for repository in (repositories.video_reports, repositories.creator_profiles):
+        repository.db = db
+    report_cache.list_max_rows = 0  # 매 요청 DB 조회 + 직렬화가 일어나도록 목록 캐시 끔
+
+    app = FastAPI()
+    app.include_router(reports.router, prefix="/api/reports")
+    app.include_router(creators.router, prefix="/api/creators")
+
+    cases = [
+        ("reports full", f"/api/reports?limit={limit}&view=full"),
+        ("reports summary", f"/api/reports?limit={limit}"),
+        ("creators full", f"/api/creators/?limit={limit}&view=full"),
+        ("creators summary", f"/api/creators/?limit={limit}"),
+    ]
+    loop = asyncio.new_event_loop()
+    try:
+        results = {name: loop.run_until_complete(measure(app, db, path, requests)) for name, path in cases}
+    finally:
+        loop.close()
+
+    print(f"목록 {limit}행 (리포트 본문 약 {report_kb}KB), 요청 {requests}회")
+    print(f"{'목록':<20}{'DB 응답(KB)':>14}{'API 응답(KB)':>14}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for name, (db_bytes, api_bytes, samples) in results.items():
+        p50, p99 = np.percentile(samples, [50, 99])
+        print(f"{name:<20}{db_bytes / 1024:>14.1f}{api_bytes / 1024:>14.1f}{p50:>10.2f}{p99:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--report-kb", type=float, default=12.0)
+    args = parser.parse_args()
+    run(args.limit, args.requests, args.report_kb)
@@ -0,0 +1,157 @@
+"""
+프로필/협찬 요청 저장 지연 시간 벤치마크 (조회 후 저장 vs 단일 문장)
+저장 핸들러를 두 방식으로 반복 호출해 p50/p99를 비교합니다.
+
+- before: 조회 후 저장 (username 중복 조회 → INSERT, 존재 확인 → UPDATE, 요청 조회 → 수수료 계산 → UPDATE)
+- after: 현재 핸들러 (UNIQUE 제약에 맡긴 INSERT, UPDATE … RETURNING, 저장 함수 RPC) - 왕복 1회
+
+응답 지연을 준 로컬 PostgREST 스텁 서버에 요청합니다 (bench_creator_profile.py와 같은 스텁 구조).
+
+실행: python benchmarks/bench_mutations.py [--requests 300] [--latency-ms 2]
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi import HTTPException
+
+from bench_creator_profile import PROFILE, STUB_KEY, _StubHandler, measure, start_stub_server
+from app.api import creators, sponsorships
+from app.core.config import settings
+from app.db.postgrest import postgrest
+from app.db.repositories import creator_profiles, sponsorship_requests
+
+NEW_USERNAME = "newcreator"
+
+SPONSORSHIP = {
+    "id": "00000000-0000-0000-0000-000000000101",
+    "creator_id": PROFILE["id"],
+    "requested_rate": 1500000,
+    "preferred_brands": ["코스메틱"],
+    "message": None,
+    "status": "completed",
+    "admin_notes": None,
+    "final_rate": 2000000,
+    "commission_rate": 30.0,
+    "commission_amount": 600000,
+    "completed_at": "2025-01-02T00:00:00+00:00",
+    "created_at": "2025-01-01T00:00:00+00:00",
+    "updated_at": "2025-01-02T00:00:00+00:00",
+}
+
+
+class _MutationStubHandler(_StubHandler):
+    """테이블별로 PROFILE / SPONSORSHIP 한 건을 돌려주고, 새 username 조회에는 빈 목록을 돌려주는 스텁"""
+
+    def _reply(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if "sponsorship" in url.path:
+            rows = [SPONSORSHIP]
+        elif query.get("username") == [f"eq.{NEW_USERNAME}"] and self.command == "GET":
+            rows = []
+        else:
+            rows = [PROFILE]
+        body = json.dumps(rows).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = _reply
+
+
+# ===== 기존 핸들러 (조회 후 저장) =====
+async def before_create_profile(profile: creators.CreatorProfileCreate):
+    if await creator_profiles.get_by_username(profile.username, columns="id"):
+        raise HTTPException(status_code=400, detail="Username already exists")
+    return await creator_profiles.create(profile.dict())
+
+
+async def before_update_profile(username: str, profile: creators.CreatorProfileUpdate):
+    if not await creator_profiles.get_by_username(username, columns="id"):
+        raise HTTPException(status_code=404, detail="Profile not found")
+    update_data = {k: v for k, v in profile.dict().items() if v is not None}
+    update_data["updated_at"] = "now()"
+    return await creator_profiles.update_by_username(username, update_data)
+
+
+async def before_update_sponsorship(request_id: str, update: sponsorships.SponsorshipRequestUpdate):
+    existing = await sponsorship_requests.get(request_id)
+    if not existing:
+        raise HTTPException(status_code=404, detail="Sponsorship request not found")
+    update_data = {k: v for k, v in update.dict().items() if v is not None}
+    if update_data.get("status") == "completed" and update_data.get("final_rate"):
+        update_data["commission_amount"] = int(update_data["final_rate"] * existing["commission_rate"] / 100)
+        update_data["completed_at"] = "2025-01-02T00:00:00+00:00"
+    return await sponsorship_requests.update(request_id, update_data)
+
+
+def run(requests: int, latency_ms: float):
+    server, url = start_stub_server(latency_ms, _MutationStubHandler)
+    settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY = url, STUB_KEY
+    print(f"로컬 PostgREST 스텁: {url} (응답 지연 {latency_ms}ms)")
+
+    new_profile = creators.CreatorProfileCreate(
+        username=NEW_USERNAME, display_name="새 크리에이터", sponsorship_rate=1000000
+    )
+    profile_update = creators.CreatorProfileUpdate(bio="수정된 소개")
+    sponsorship_update = sponsorships.SponsorshipRequestUpdate(status="completed", final_rate=2000000)
+
+    cases = {
+        "POST /api/creators": (
+            lambda _: before_create_profile(new_profile),
+            lambda _: creators.create_profile(new_profile),
+        ),
+        "PUT /api/creators/@{username}": (
+            lambda username: before_update_profile(username, profile_update),
+            lambda username: creators.update_profile(username, profile_update),
+        ),
+        "PUT /api/sponsorship-requests/{id}": (
+            lambda _: before_update_sponsorship(SPONSORSHIP["id"], sponsorship_update),
+            lambda _: sponsorships.update_sponsorship_request(SPONSORSHIP["id"], sponsorship_update),
+        ),
+    }
+
+    loop = asyncio.new_event_loop()
+    results = {}
+    try:
+        for name, (before, after) in cases.items():
+            results[name] = (
+                measure(loop, before, PROFILE["username"], requests),
+                measure(loop, after, PROFILE["username"], requests),
+            )
+        loop.run_until_complete(postgrest.aclose())
+    finally:
+        loop.close()
+        server.terminate()
+
+    print(f"\n핸들러별 {requests}회")
+    print(f"{'엔드포인트':<36}{'before p50':>12}{'after p50':>12}{'before p99':>12}{'after p99':>12}")
+    for name, (before, after) in results.items():
+        b50, b99 = np.percentile(before, [50, 99])
+        a50, a99 = np.percentile(after, [50, 99])
+        print(f"{name:<36}{b50:>12.2f}{a50:>12.2f}{b99:>12.2f}{a99:>12.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    run(args.requests, args.latency_ms)
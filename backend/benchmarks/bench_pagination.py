@@ -0,0 +1,193 @@
+"""
+목록 페이지네이션 벤치마크 (offset vs 키셋 커서)
+같은 페이지를 offset 방식과 커서 방식으로 조회해 페이지 깊이별 지연 시간을 비교합니다.
+
+기본은 SQLite 메모리 DB에 sponsorship_requests 형태의 행을 채우고,
+문서의 복합 인덱스(created_at DESC, id DESC)를 만든 뒤 API가 PostgREST에 보내는 것과 같은 조건으로 조회합니다.
+--url/--key를 주면 실제 Supabase 프로젝트의 video_reports를 저장소(app/db/repositories.py)로 조회합니다
+(테이블에 pages × limit 행 이상이 있어야 함).
+
+실행: python benchmarks/bench_pagination.py [--rows 200000] [--limit 20] [--pages 1,10,100,1000] [--url URL --key KEY]
+"""
+import argparse
+import asyncio
+import re
+import sqlite3
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.db.pagination import after_cursor, encode_cursor
+
+OFFSET_SQL = """
+SELECT * FROM sponsorship_requests
+ORDER BY created_at DESC, id DESC
+LIMIT ? OFFSET ?
+"""
+
+# after_cursor()가 만드는 PostgREST 필터와 같은 조건 (값은 _keyset_params로 필터 문자열에서 꺼냄)
+KEYSET_SQL = """
+SELECT * FROM sponsorship_requests
+WHERE created_at <= ? AND (created_at < ? OR (created_at = ? AND id < ?))
+ORDER BY created_at DESC, id DESC
+LIMIT ?
+"""
+
+
+def build_db(rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("""
+        CREATE TABLE sponsorship_requests (
+            id TEXT PRIMARY KEY,
+            creator_id TEXT NOT NULL,
+            requested_rate INTEGER NOT NULL,
+            message TEXT,
+            status TEXT DEFAULT 'pending',
+            created_at TEXT NOT NULL
+        )
+    """)
+    started = datetime(2025, 1, 1)
+    rng = np.random.default_rng(0)
+    # 같은 created_at이 여러 행에 나오도록 초 단위로 묶음 (id로 순서 결정)
+    seconds = np.sort(rng.integers(0, rows // 2, size=rows))
+    conn.executemany(
+        "INSERT INTO sponsorship_requests VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (str(uuid.UUID(int=int(rng.integers(0, 2**63)))), f"creator-{i % 500}", 1000000,
+             "협찬 요청 메시지 " * 4, "pending", (started + timedelta(seconds=int(s))).isoformat())
+            for i, s in enumerate(seconds)
+        ),
+    )
+    conn.execute("CREATE INDEX idx_sponsorship_created ON sponsorship_requests(created_at DESC, id DESC)")
+    conn.commit()
+    return conn
+
+
+def offset_page(conn: sqlite3.Connection, page: int, limit: int):
+    return [dict(row) for row in conn.execute(OFFSET_SQL, (limit, (page - 1) * limit))]
+
+
+_OR_FILTER = re.compile(r"^\(created_at\.lt\.(.+),and\(created_at\.eq\.(.+),id\.lt\.(.+)\)\)$")
+
+
+def _unquote(value: str) -> str:
+    # or=/and= 식 안의 "…" 값은 PostgREST가 따옴표를 벗김
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def _keyset_params(cursor: str):
+    """
+    after_cursor() 필터 문자열 → SQL 파라미터 (PostgREST가 해석하는 방식 그대로)
+
+    최상위 created_at=lte.… 값은 따옴표를 벗기지 않고 그대로 비교하므로,
+    값이 따옴표로 감싸여 있으면 조회 결과가 offset 방식과 달라져 검증에서 드러납니다.
+    """
+    filters = after_cursor(cursor)
+    operator, bound = filters["created_at"].split(".", 1)
+    assert operator == "lte", filters["created_at"]
+    match = _OR_FILTER.match(filters["or"])
+    assert match, filters["or"]
+    lt_value, eq_value, row_id = (_unquote(value) for value in match.groups())
+    return bound, lt_value, eq_value, row_id
+
+
+def keyset_page(conn: sqlite3.Connection, cursor: str, limit: int):
+    return [dict(row) for row in conn.execute(KEYSET_SQL, (*_keyset_params(cursor), limit))]
+
+
+def timed(fn, repeat: int) -> float:
+    """repeat회 실행한 지연 시간의 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.median(samples))
+
+
+def run_sqlite(rows: int, limit: int, pages, repeat: int):
+    started = time.perf_counter()
+    conn = build_db(rows)
+    print(f"SQLite 메모리 DB: {rows:,}행 ({time.perf_counter() - started:.1f}초), 페이지당 {limit}행")
+
+    print(f"\n{'페이지':>8}{'offset(ms)':>14}{'cursor(ms)':>14}{'같은 행':>10}")
+    for page in pages:
+        if (page - 1) * limit >= rows:
+            print(f"{page:>8}  (행 수 초과)")
+            continue
+        # 커서는 앞 페이지 마지막 행에서 만듦 (클라이언트가 X-Next-Cursor로 받는 값)
+        previous = offset_page(conn, page - 1, limit)[-1] if page > 1 else None
+        expected = offset_page(conn, page, limit)
+        if previous is None:
+            offset_ms = timed(lambda: offset_page(conn, page, limit), repeat)
+            print(f"{page:>8}{offset_ms:>14.3f}{'-':>14}{'-':>10}")
+            continue
+
+        cursor = encode_cursor(previous)
+        same = keyset_page(conn, cursor, limit) == expected
+        offset_ms = timed(lambda: offset_page(conn, page, limit), repeat)
+        cursor_ms = timed(lambda: keyset_page(conn, cursor, limit), repeat)
+        print(f"{page:>8}{offset_ms:>14.3f}{cursor_ms:>14.3f}{'O' if same else 'X':>10}")
+    conn.close()
+
+
+def run_supabase(url: str, key: str, limit: int, pages, repeat: int):
+    from app.core.config import settings
+    settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY = url, key
+    from app.db.postgrest import postgrest
+    from app.db.repositories import video_reports
+
+    async def measure(loader) -> float:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await loader()
+            samples.append((time.perf_counter() - started) * 1000)
+        return float(np.median(samples))
+
+    async def main():
+        print(f"대상: {url} (video_reports), 페이지당 {limit}행")
+        print(f"\n{'페이지':>8}{'offset(ms)':>14}{'cursor(ms)':>14}")
+        for page in pages:
+            offset = (page - 1) * limit
+            if page == 1:
+                offset_ms = await measure(lambda: video_reports.list_recent(limit=limit))
+                print(f"{page:>8}{offset_ms:>14.1f}{'-':>14}")
+                continue
+            previous = await video_reports.list_recent(limit=1, offset=offset - 1)
+            if not previous:
+                print(f"{page:>8}  (행 수 초과)")
+                continue
+            cursor = encode_cursor(previous[0])
+            offset_ms = await measure(lambda: video_reports.list_recent(limit=limit, offset=offset))
+            cursor_ms = await measure(lambda: video_reports.list_recent(limit=limit, cursor=cursor))
+            print(f"{page:>8}{offset_ms:>14.1f}{cursor_ms:>14.1f}")
+        await postgrest.aclose()
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", default="1,10,100,1000")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url")
+    parser.add_argument("--key")
+    args = parser.parse_args()
+    page_list = [int(page) for page in args.pages.split(",")]
+    if args.url:
+        run_supabase(args.url, args.key, args.limit, page_list, args.repeat)
+    else:
+        run_sqlite(args.rows, args.limit, page_list, args.repeat)
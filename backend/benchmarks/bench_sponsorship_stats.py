@@ -0,0 +1,251 @@
+"""
+협찬 집계 벤치마크 (요약 테이블 vs 조회 시 집계)
+sponsorship_requests 이력 크기별로 관리자 집계를 두 방식으로 조회한 지연 시간과, 요약 테이블 유지 비용(수정 1건)을 비교합니다.
+
+- aggregate: 조회할 때마다 sponsorship_requests 전체를 GROUP BY (기존 대시보드가 하던 계산)
+- summary: 트리거가 유지하는 요약 행 조회 (GET /api/sponsorships/stats, /stats/creators/{id})
+
+SQLite 메모리 DB에 docs/creator_profile_schema.md 2-4의 요약 테이블/트리거를 같은 규칙으로 옮겨 실행하고,
+무작위 상태 변경/수수료 확정/삭제 후 요약 테이블이 전체 GROUP BY 결과와 같은지 검증합니다.
+
+실행: python benchmarks/bench_sponsorship_stats.py [--sizes 10000,100000,1000000] [--updates 2000]
+"""
+import argparse
+import random
+import sqlite3
+import time
+
+import numpy as np
+
+STATUSES = ["pending", "in_progress", "completed", "cancelled"]
+
+SCHEMA = """
+CREATE TABLE sponsorship_requests (
+    id INTEGER PRIMARY KEY,
+    creator_id INTEGER NOT NULL,
+    requested_rate INTEGER NOT NULL,
+    status TEXT DEFAULT 'pending',
+    final_rate INTEGER,
+    commission_rate REAL DEFAULT 30.0,
+    commission_amount INTEGER,
+    completed_at TEXT,
+    created_at TEXT
+);
+CREATE INDEX idx_sponsorship_creator ON sponsorship_requests(creator_id);
+
+CREATE TABLE sponsorship_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_requests INTEGER NOT NULL DEFAULT 0,
+    pending_count INTEGER NOT NULL DEFAULT 0,
+    in_progress_count INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    cancelled_count INTEGER NOT NULL DEFAULT 0,
+    final_rate_sum INTEGER NOT NULL DEFAULT 0,
+    commission_sum INTEGER NOT NULL DEFAULT 0
+);
+INSERT INTO sponsorship_totals (id) VALUES (1);
+
+CREATE TABLE sponsorship_monthly_stats (
+    month TEXT PRIMARY KEY,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    final_rate_sum INTEGER NOT NULL DEFAULT 0,
+    commission_sum INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE sponsorship_creator_stats (
+    creator_id INTEGER PRIMARY KEY,
+    total_requests INTEGER NOT NULL DEFAULT 0,
+    completed_count INTEGER NOT NULL DEFAULT 0,
+    cancelled_count INTEGER NOT NULL DEFAULT 0,
+    commission_sum INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# apply_sponsorship_stats(r, sign)을 SQLite 트리거 본문으로 옮긴 것 ({r}: NEW/OLD, {sign}: 1/-1)
+APPLY = """
+    UPDATE sponsorship_totals SET
+        total_requests = total_requests + {sign},
+        pending_count = pending_count + CASE WHEN {r}.status = 'pending' THEN {sign} ELSE 0 END,
+        in_progress_count = in_progress_count + CASE WHEN {r}.status = 'in_progress' THEN {sign} ELSE 0 END,
+        completed_count = completed_count + CASE WHEN {r}.status = 'completed' THEN {sign} ELSE 0 END,
+        cancelled_count = cancelled_count + CASE WHEN {r}.status = 'cancelled' THEN {sign} ELSE 0 END,
+        final_rate_sum = final_rate_sum
+            + CASE WHEN {r}.status = 'completed' THEN {sign} * COALESCE({r}.final_rate, 0) ELSE 0 END,
+        commission_sum = commission_sum + {sign} * COALESCE({r}.commission_amount, 0)
+    WHERE id = 1;
+
+    INSERT INTO sponsorship_creator_stats (creator_id, total_requests, completed_count, cancelled_count, commission_sum)
+    VALUES ({r}.creator_id, {sign},
+            CASE WHEN {r}.status = 'completed' THEN {sign} ELSE 0 END,
+            CASE WHEN {r}.status = 'cancelled' THEN {sign} ELSE 0 END,
+            {sign} * COALESCE({r}.commission_amount, 0))
+    ON CONFLICT (creator_id) DO UPDATE SET
+        total_requests = total_requests + excluded.total_requests,
+        completed_count = completed_count + excluded.completed_count,
+        cancelled_count = cancelled_count + excluded.cancelled_count,
+        commission_sum = commission_sum + excluded.commission_sum;
+
+    INSERT INTO sponsorship_monthly_stats (month, completed_count, final_rate_sum, commission_sum)
+    SELECT substr({r}.completed_at, 1, 7) || '-01', {sign},
+           {sign} * COALESCE({r}.final_rate, 0), {sign} * COALESCE({r}.commission_amount, 0)
+    WHERE {r}.status = 'completed' AND {r}.completed_at IS NOT NULL
+    ON CONFLICT (month) DO UPDATE SET
+        completed_count = completed_count + excluded.completed_count,
+        final_rate_sum = final_rate_sum + excluded.final_rate_sum,
+        commission_sum = commission_sum + excluded.commission_sum;
+"""
+
+TRIGGERS = f"""
+CREATE TRIGGER trg_sponsorship_stats_insert AFTER INSERT ON sponsorship_requests
+BEGIN {APPLY.format(r="NEW", sign=1)} END;
+
+CREATE TRIGGER trg_sponsorship_stats_update
+AFTER UPDATE ON sponsorship_requests
+WHEN OLD.status IS NOT NEW.status OR OLD.final_rate IS NOT NEW.final_rate
+    OR OLD.commission_amount IS NOT NEW.commission_amount OR OLD.completed_at IS NOT NEW.completed_at
+    OR OLD.creator_id IS NOT NEW.creator_id
+BEGIN {APPLY.format(r="OLD", sign=-1)} {APPLY.format(r="NEW", sign=1)} END;
+
+CREATE TRIGGER trg_sponsorship_stats_delete AFTER DELETE ON sponsorship_requests
+BEGIN {APPLY.format(r="OLD", sign=-1)} END;
+"""
+
+# update_sponsorship_request(p_id, p_changes)와 같은 규칙 (완료 + 최종 협찬비면 수수료/완료 시각 계산)
+UPDATE_SQL = """
+UPDATE sponsorship_requests SET
+    status = COALESCE(:status, status),
+    final_rate = COALESCE(:final_rate, final_rate),
+    commission_amount = CASE WHEN :status = 'completed' AND :final_rate > 0
+        THEN CAST(:final_rate * commission_rate / 100 AS INTEGER) ELSE commission_amount END,
+    completed_at = CASE WHEN :status = 'completed' AND :final_rate > 0
+        THEN :now ELSE completed_at END
+WHERE id = :id
+"""
+
+AGGREGATE_TOTALS_SQL = """
+SELECT COUNT(*),
+       SUM(status = 'pending'), SUM(status = 'in_progress'), SUM(status = 'completed'), SUM(status = 'cancelled'),
+       SUM(CASE WHEN status = 'completed' THEN COALESCE(final_rate, 0) ELSE 0 END),
+       SUM(COALESCE(commission_amount, 0))
+FROM sponsorship_requests
+"""
+SUMMARY_TOTALS_SQL = """
+SELECT total_requests, pending_count, in_progress_count, completed_count, cancelled_count,
+       final_rate_sum, commission_sum
+FROM sponsorship_totals WHERE id = 1
+"""
+
+AGGREGATE_MONTHLY_SQL = """
+SELECT substr(completed_at, 1, 7) || '-01' AS month, COUNT(*),
+       SUM(COALESCE(final_rate, 0)), SUM(COALESCE(commission_amount, 0))
+FROM sponsorship_requests
+WHERE status = 'completed' AND completed_at IS NOT NULL
+GROUP BY month ORDER BY month DESC LIMIT 12
+"""
+SUMMARY_MONTHLY_SQL = """
+SELECT month, completed_count, final_rate_sum, commission_sum
+FROM sponsorship_monthly_stats WHERE completed_count != 0 ORDER BY month DESC LIMIT 12
+"""
+
+AGGREGATE_CREATOR_SQL = """
+SELECT COUNT(*), SUM(status = 'completed'), SUM(status = 'cancelled'), SUM(COALESCE(commission_amount, 0))
+FROM sponsorship_requests WHERE creator_id = ?
+"""
+SUMMARY_CREATOR_SQL = """
+SELECT total_requests, completed_count, cancelled_count, commission_sum
+FROM sponsorship_creator_stats WHERE creator_id = ?
+"""
+
+
+def random_month(rng: random.Random) -> str:
+    return f"202{rng.randint(3, 5)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00+09:00"
+
+
+def build_db(size: int, creators: int, rng: random.Random) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA + TRIGGERS)
+
+    def rows():
+        for i in range(size):
+            status = rng.choices(STATUSES, weights=[3, 2, 4, 1])[0]
+            final_rate = rng.randint(50, 500) * 10000 if status == "completed" else None
+            yield (i, rng.randrange(creators), rng.randint(50, 500) * 10000, status, final_rate,
+                   final_rate * 30 // 100 if final_rate else None,
+                   random_month(rng) if final_rate else None, random_month(rng))
+
+    conn.executemany(
+        "INSERT INTO sponsorship_requests (id, creator_id, requested_rate, status, final_rate, "
+        "commission_amount, completed_at, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        rows(),
+    )
+    conn.commit()
+    return conn
+
+
+def apply_updates(conn: sqlite3.Connection, size: int, updates: int, rng: random.Random) -> np.ndarray:
+    """무작위 요청 수정(관리자 처리) → 건당 지연 시간 ms (트리거 포함)"""
+    samples = np.empty(updates)
+    for i in range(updates):
+        status = rng.choice(STATUSES)
+        params = {
+            "id": rng.randrange(size),
+            "status": status,
+            "final_rate": rng.randint(50, 500) * 10000 if status == "completed" else None,
+            "now": random_month(rng),
+        }
+        started = time.perf_counter()
+        conn.execute(UPDATE_SQL, params)
+        conn.commit()
+        samples[i] = (time.perf_counter() - started) * 1000
+    # 삭제도 반영되는지 확인
+    for _ in range(10):
+        conn.execute("DELETE FROM sponsorship_requests WHERE id = ?", (rng.randrange(size),))
+    conn.commit()
+    return samples
+
+
+def timed(conn: sqlite3.Connection, sql: str, params=(), repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        samples.append((time.perf_counter() - started) * 1000)
+    return float(np.median(samples))
+
+
+def verify(conn: sqlite3.Connection, creator_ids) -> bool:
+    same = conn.execute(AGGREGATE_TOTALS_SQL).fetchone() == conn.execute(SUMMARY_TOTALS_SQL).fetchone()
+    same &= conn.execute(AGGREGATE_MONTHLY_SQL).fetchall() == conn.execute(SUMMARY_MONTHLY_SQL).fetchall()
+    for creator_id in creator_ids:
+        expected = conn.execute(AGGREGATE_CREATOR_SQL, (creator_id,)).fetchone()
+        actual = conn.execute(SUMMARY_CREATOR_SQL, (creator_id,)).fetchone() or (0, None, None, None)
+        same &= tuple(value or 0 for value in expected) == tuple(value or 0 for value in actual)
+    return same
+
+
+def run(sizes, creators: int, updates: int):
+    rng = random.Random(0)
+    print(f"{'이력(건)':>10}{'전체 집계':>22}{'월별 집계':>22}{'크리에이터':>22}{'수정 p50':>10}{'검증':>6}")
+    print(f"{'':>10}{'aggregate / summary (ms)':>22}{'':>22}{'':>22}{'(ms)':>10}")
+    for size in sizes:
+        conn = build_db(size, creators, rng)
+        update_samples = apply_updates(conn, size, updates, rng)
+        creator_id = rng.randrange(creators)
+
+        totals = (timed(conn, AGGREGATE_TOTALS_SQL), timed(conn, SUMMARY_TOTALS_SQL))
+        monthly = (timed(conn, AGGREGATE_MONTHLY_SQL), timed(conn, SUMMARY_MONTHLY_SQL))
+        creator = (timed(conn, AGGREGATE_CREATOR_SQL, (creator_id,)), timed(conn, SUMMARY_CREATOR_SQL, (creator_id,)))
+        same = verify(conn, rng.sample(range(creators), 50))
+        conn.close()
+
+        cells = "".join(f"{f'{a:.2f} / {b:.3f}':>22}" for a, b in (totals, monthly, creator))
+        print(f"{size:>10,}{cells}{np.median(update_samples):>10.3f}{'O' if same else 'X':>6}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--creators", type=int, default=2000)
+    parser.add_argument("--updates", type=int, default=2000)
+    args = parser.parse_args()
+    run([int(size) for size in args.sizes.split(",")], args.creators, args.updates)
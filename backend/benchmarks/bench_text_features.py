@@ -0,0 +1,72 @@
+"""
+문자 n-gram 해싱 벡터라이저 벤치마크
+단일 코어 기준 초당 처리 제목 수를 측정하고,
+예측기의 유사 키워드 매칭이 오타는 잡고 앞부분만 같은 다른 단어는 거르는지 확인합니다.
+
+실행: python benchmarks/bench_text_features.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.predictor import PredictorService
+from app.services.text_features import HashingNgramVectorizer
+
+WORDS = [
+    "올리브영", "신상", "내돈내산", "GRWM", "리뷰", "추천템", "퍼스널컬러", "쿨톤", "웜톤",
+    "틴트", "립스틱", "파운데이션", "세일", "할인", "데일리", "메이크업", "겟레디윗미",
+    "makeup", "tutorial", "skincare", "haul", "클렌징", "선크림", "쿠션", "🔥", "10가지", "3분",
+]
+
+
+# (제목, 키워드, 매칭되어야 하는지)
+FUZZY_CASES = [
+    ("파운데이이션 추천", "파운데이션", True),
+    ("올리브영 세일", "올리브영", True),
+    ("올리브", "올리브영", False),
+    ("올리브 오일 요리", "올리브영", False),
+    ("스틱형 파운데이션", "립스틱", False),
+]
+
+
+def check_fuzzy_matching() -> None:
+    predictor = PredictorService()
+    print(f"🔎 유사 키워드 매칭 (기준 {predictor.FUZZY_MATCH_THRESHOLD})")
+    for title, keyword, expected in FUZZY_CASES:
+        matched = f"keyword_{keyword}" in predictor.extract_features(title, None, None)
+        print(f"  {'O' if matched == expected else 'X'} {title!r} → {keyword}: {'매칭' if matched else '없음'}")
+
+
+def make_titles(count: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(WORDS, k=rng.randint(4, 10))) for _ in range(count)]
+
+
+def run(count: int = 100_000, batch_size: int = 1000, repeat: int = 3):
+    titles = make_titles(count)
+    vectorizer = HashingNgramVectorizer()
+
+    print("=" * 60)
+    print(f"📊 HashingNgramVectorizer 벤치마크 ({count:,}개 제목, 배치 {batch_size})")
+    print("=" * 60)
+
+    for i in range(repeat):
+        # 첫 회차는 n-gram 해시 메모가 비어 있는 상태
+        started = time.perf_counter()
+        nnz = 0
+        for start in range(0, count, batch_size):
+            matrix = vectorizer.transform(titles[start:start + batch_size])
+            nnz += len(matrix.data)
+        elapsed = time.perf_counter() - started
+
+        label = "cold" if i == 0 else "warm"
+        print(f"  [{label}] {count / elapsed:,.0f} titles/s  ({elapsed:.2f}s, 평균 nnz {nnz / count:.1f})")
+
+
+if __name__ == "__main__":
+    check_fuzzy_matching()
+    run()
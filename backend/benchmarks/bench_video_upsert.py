@@ -0,0 +1,102 @@
+"""
+영상 데이터 저장 벤치마크
+기존 방식(영상마다 SELECT 후 INSERT/UPDATE)과 대량 UPSERT의 1,000개당 저장 시간을 비교합니다.
+임시 SQLite 파일 DB를 사용하며, 실행마다 절반은 신규 / 절반은 기존 영상입니다.
+
+실행: python benchmarks/bench_video_upsert.py [영상 수]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.bulk import bulk_upsert
+from app.db.database import Base
+from app.models.models import VideoData
+
+
+def make_videos(start: int, count: int, seed: int = 42):
+    rng = random.Random(seed + start)
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "video_id": f"v{i:010d}",
+            "channel_id": f"c{rng.randint(0, 500):05d}",
+            "title": f"올리브영 세일 추천템 {i}",
+            "description": "내돈내산 리뷰",
+            "tags": ["올리브영", "뷰티", f"tag{i % 50}"],
+            "view_count": rng.randint(100, 1_000_000),
+            "like_count": rng.randint(0, 10_000),
+            "comment_count": rng.randint(0, 1_000),
+            "duration": rng.randint(10, 1800),
+            "published_at": now - timedelta(hours=rng.randint(1, 24 * 7)),
+            "thumbnail_url": f"https://i.ytimg.com/vi/v{i}/hqdefault.jpg",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def save_legacy(db, videos):
+    """기존 save_to_database 방식"""
+    for video in videos:
+        existing = db.query(VideoData).filter(VideoData.video_id == video["video_id"]).first()
+        if existing:
+            existing.view_count = video["view_count"]
+            existing.like_count = video["like_count"]
+            existing.comment_count = video["comment_count"]
+            existing.updated_at = datetime.now()
+        else:
+            db.add(VideoData(**video))
+    db.commit()
+
+
+def save_bulk(db, videos, chunk_size=500):
+    result = bulk_upsert(
+        db, VideoData, videos, key="video_id",
+        update_columns=["view_count", "like_count", "comment_count"],
+        chunk_size=chunk_size,
+    )
+    db.commit()
+    return result
+
+
+def run_case(label: str, save, count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        # 기존 영상 절반을 미리 저장
+        db = Session()
+        save_bulk(db, make_videos(0, count // 2))
+        db.close()
+
+        videos = make_videos(0, count // 2, seed=7) + make_videos(count // 2, count - count // 2)
+        db = Session()
+        started = time.perf_counter()
+        save(db, videos)
+        elapsed = time.perf_counter() - started
+        db.close()
+        engine.dispose()
+
+    print(f"  {label:<28} {elapsed * 1000:9.1f} ms 전체   {elapsed * 1000 / count * 1000:8.1f} ms / 1k")
+
+
+def run(count: int = 5000):
+    print(f"영상 {count:,}개 저장 (신규 50% / 갱신 50%, SQLite)")
+    run_case("기존 (행마다 SELECT)", save_legacy, count)
+    for chunk_size in (100, 500, 1000):
+        run_case(f"대량 UPSERT (chunk={chunk_size})", lambda db, v, c=chunk_size: save_bulk(db, v, c), count)
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -1,79 +1,33 @@
 #!/usr/bin/env python3
 """
 YouTube 급상승 뷰티 영상 수집 및 Gemini AI 분석 스크립트
+
+급상승 차트 조회/분배는 일일 수집기의 YouTubeCollector.ingest_trending을 그대로 사용하고,
+여기서는 리포트 분석 함수만 이 스크립트의 Gemini 프롬프트로 바꿉니다.
+일일 수집에서 INGESTION_TRENDING_REPORTS=True로 리포트까지 만들고 있다면 이 스크립트를 따로 돌릴 필요가 없습니다
+(둘 다 돌리면 차트를 두 번 조회).
 """
 import os
 import sys
-from datetime import datetime
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 import google.generativeai as genai
-from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # .env 파일 로드
 load_dotenv()
 
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from app.core.config import settings
+from app.services.ingestion import VideoReportSink
+from app.services.known_ids import known_report_index
+from app.tasks.youtube_collector import YouTubeCollector, is_beauty_video
+
 # 환경 변수 로드
-YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
-
-# Supabase 클라이언트
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
 
 # Gemini 설정
 genai.configure(api_key=GEMINI_API_KEY)
 model = genai.GenerativeModel('gemini-1.5-flash')
 
-def get_trending_beauty_videos(max_results=10):
-    """YouTube 급상승 뷰티 영상 가져오기"""
-    youtube = build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
-    
-    try:
-        # 한국 급상승 동영상 가져오기 (뷰티 카테고리)
-        request = youtube.videos().list(
-            part="snippet,statistics",
-            chart="mostPopular",
-            regionCode="KR",
-            videoCategoryId="26",  # Howto & Style (뷰티 포함)
-            maxResults=max_results
-        )
-        response = request.execute()
-        
-        videos = []
-        for item in response.get('items', []):
-            video_id = item['id']
-            snippet = item['snippet']
-            stats = item['statistics']
-            
-            # 뷰티 관련 키워드 필터링
-            beauty_keywords = ['메이크업', '뷰티', '화장', '스킨케어', '피부', '립스틱', '파운데이션', '아이섀도', '블러쉬', '마스카라']
-            title_lower = snippet['title'].lower()
-            
-            if any(keyword in snippet['title'] for keyword in beauty_keywords):
-                video_data = {
-                    'video_id': video_id,
-                    'video_url': f'https://www.youtube.com/watch?v={video_id}',
-                    'title': snippet['title'],
-                    'channel_name': snippet['channelTitle'],
-                    'view_count': int(stats.get('viewCount', 0)),
-                    'like_count': int(stats.get('likeCount', 0)),
-                    'comment_count': int(stats.get('commentCount', 0)),
-                    'published_at': snippet['publishedAt'],
-                    'thumbnail_url': snippet['thumbnails']['high']['url']
-                }
-                videos.append(video_data)
-                print(f"✅ 발견: {snippet['title'][:50]}...")
-        
-        print(f"\n총 {len(videos)}개의 뷰티 영상 발견")
-        return videos
-        
-    except HttpError as e:
-        print(f"YouTube API 오류: {e}")
-        return []
-
 def analyze_video_with_gemini(video_data):
     """Gemini AI로 영상 분석"""
     prompt = f"""
@@ -128,43 +82,6 @@ def analyze_video_with_gemini(video_data):
             "analysis_report": f"# 분석 오류\n\n{str(e)}"
         }
 
-def save_to_supabase(video_data, analysis):
-    """Supabase에 저장"""
-    try:
-        # 기존 데이터 확인
-        existing = supabase.table('video_reports')\
-            .select('id')\
-            .eq('video_id', video_data['video_id'])\
-            .execute()
-        
-        if existing.data:
-            print(f"⏭️  이미 존재: {video_data['title'][:50]}...")
-            return False
-        
-        # 새 데이터 삽입
-        data = {
-            'video_id': video_data['video_id'],
-            'video_url': video_data['video_url'],
-            'title': video_data['title'],
-            'channel_name': video_data['channel_name'],
-            'view_count': video_data['view_count'],
-            'like_count': video_data['like_count'],
-            'comment_count': video_data['comment_count'],
-            'published_at': video_data['published_at'],
-            'thumbnail_url': video_data['thumbnail_url'],
-            'analysis_report': analysis['analysis_report'],
-            'success_score': analysis['success_score'],
-            'trending_keywords': analysis['trending_keywords']
-        }
-        
-        result = supabase.table('video_reports').insert(data).execute()
-        print(f"💾 저장 완료: {video_data['title'][:50]}... (점수: {analysis['success_score']}점)")
-        return True
-        
-    except Exception as e:
-        print(f"Supabase 저장 오류: {e}")
-        return False
-
 def main():
     """메인 실행 함수"""
     print("=" * 80)
@@ -172,36 +89,24 @@ def main():
     print("=" * 80)
     print()
     
-    # 1. YouTube 급상승 영상 수집
-    print("📺 Step 1: YouTube 급상승 뷰티 영상 수집 중...")
-    videos = get_trending_beauty_videos(max_results=20)
-    
-    if not videos:
-        print("❌ 영상을 찾을 수 없습니다.")
-        return
-    
-    print(f"\n✅ {len(videos)}개 영상 수집 완료\n")
-    
-    # 2. 각 영상 분석 및 저장
-    print("🤖 Step 2: Gemini AI 분석 및 저장 중...")
+    # 급상승 차트 1회 조회 → VideoData / 트렌드 엔진 / video_reports(뷰티 영상만 Gemini 분석)로 분배
+    # 리포트가 이미 있는 영상은 VideoReportSink가 Gemini 분석·Supabase 조회 전에 메모리에서 제외
+    print("📺 YouTube 급상승 영상 수집 및 Gemini AI 분석 중...")
     print()
     
-    saved_count = 0
-    for i, video in enumerate(videos, 1):
-        print(f"[{i}/{len(videos)}] 분석 중: {video['title'][:50]}...")
-        
-        # Gemini 분석
-        analysis = analyze_video_with_gemini(video)
-        
-        # Supabase 저장
-        if save_to_supabase(video, analysis):
-            saved_count += 1
-        
-        print()
+    report = YouTubeCollector().ingest_trending(
+        max_results=settings.INGESTION_TRENDING_MAX_RESULTS,
+        with_reports=True,
+        analyze=analyze_video_with_gemini,
+        report_filter=is_beauty_video,
+    )
+    counters = report[VideoReportSink.name]["counters"]
     
-    # 3. 결과 요약
+    # 결과 요약
     print("=" * 80)
-    print(f"✅ 완료! {saved_count}개의 새로운 리포트가 저장되었습니다.")
+    print(f"✅ 완료! {counters.get('inserted', 0)}개의 새로운 리포트가 저장되었습니다.")
+    print(f"   (뷰티 외 영상 {counters.get('filtered', 0)}개 제외, "
+          f"건너뛴 분석/조회: {known_report_index.stats()['calls_avoided']}건)")
     print("=" * 80)
 
 if __name__ == "__main__":
@@ -47,6 +47,13 @@ class DataRetentionManager:
             'analytics': 'data/analytics.db'
         }
         
+        # 청크 단위 삭제 설정
+        self.delete_chunk_size = 1000
+        self.delete_pause_seconds = 0.05
+        
+        # 정리 작업별 마지막 실행 지표
+        self.last_cleanup_metrics = {}
+        
         self.setup_scheduler()
     
     def setup_scheduler(self):
@@ -111,28 +118,69 @@ class DataRetentionManager:
             print(f"사용자 동의 데이터 정리 실패: {e}")
     
     def cleanup_channel_database(self):
-        """채널 데이터베이스 정리"""
+        """
+        채널 데이터베이스 정리
+        
+        updated_at 인덱스로 대상 행을 골라 청크 단위로 삭제하고 청크마다 바로 커밋해
+        쓰기 잠금을 짧게 유지합니다. (청크 사이에 잠깐 쉬어 다른 쓰기 작업이 끼어들 수 있게 함)
+        """
         try:
             db_path = self.db_paths['channels']
             if not os.path.exists(db_path):
                 return
             
-            conn = sqlite3.connect(db_path)
+            started = time.perf_counter()
+            conn = sqlite3.connect(db_path, timeout=5)
             cursor = conn.cursor()
             
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_channels_updated_at ON channels(updated_at)')
+            conn.commit()
+            
             # 24시간 이전 데이터 삭제
             cutoff_time = datetime.now() - timedelta(hours=self.retention_policies['channel_storage'])
             
-            cursor.execute('''
-                DELETE FROM channels 
-                WHERE updated_at < ?
-            ''', (cutoff_time.isoformat(),))
+            deleted_count = 0
+            chunks = 0
+            lock_ms_total = 0.0
+            lock_ms_max = 0.0
+            
+            while True:
+                lock_started = time.perf_counter()
+                cursor.execute('''
+                    DELETE FROM channels
+                    WHERE rowid IN (
+                        SELECT rowid FROM channels
+                        WHERE updated_at < ?
+                        ORDER BY updated_at
+                        LIMIT ?
+                    )
+                ''', (cutoff_time.isoformat(), self.delete_chunk_size))
+                chunk_deleted = cursor.rowcount
+                conn.commit()
+                lock_ms = (time.perf_counter() - lock_started) * 1000
+                
+                deleted_count += chunk_deleted
+                chunks += 1
+                lock_ms_total += lock_ms
+                lock_ms_max = max(lock_ms_max, lock_ms)
+                
+                if chunk_deleted < self.delete_chunk_size:
+                    break
+                time.sleep(self.delete_pause_seconds)
             
-            deleted_count = cursor.rowcount
-            conn.commit()
             conn.close()
             
-            print(f"채널 데이터베이스에서 {deleted_count}개 레코드 삭제")
+            self.last_cleanup_metrics['channels'] = {
+                'rows_deleted': deleted_count,
+                'chunks': chunks,
+                'lock_ms_total': round(lock_ms_total, 2),
+                'lock_ms_max': round(lock_ms_max, 2),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 2),
+                'finished_at': datetime.now().isoformat()
+            }
+            
+            print(f"채널 데이터베이스에서 {deleted_count}개 레코드 삭제 "
+                  f"(청크 {chunks}개, 최대 잠금 {lock_ms_max:.0f}ms)")
             
         except Exception as e:
             print(f"채널 데이터베이스 정리 실패: {e}")
@@ -266,7 +314,8 @@ class DataRetentionManager:
                 'retention_policies': self.retention_policies,
                 'database_sizes': {},
                 'last_cleanup': datetime.now().isoformat(),
-                'compliance_status': 'compliant'
+                'compliance_status': 'compliant',
+                'last_cleanup_metrics': self.last_cleanup_metrics
             }
             
             # 데이터베이스 크기 정보